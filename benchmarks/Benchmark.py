@@ -0,0 +1,222 @@
+'''
+Benchmark - Times PlugSy operations across synthetic plugin homes and compares results against a baseline
+'''
+
+# Import libs
+import json
+import platform
+import tempfile
+import time
+
+# Import package modules
+from plugsy import Config, Plugsy
+from plugsy.utils import Logger, toposort
+
+from .SyntheticHome import SyntheticHome
+
+
+class Benchmark(Logger):
+    '''
+    Runs each benchmarked operation against a synthetic plugin home for every combination of graph shape and size.
+    The fastest of the repeated samples is kept for each operation, as it is the least affected by system noise
+    '''
+
+    FORMAT = 1
+    DEFAULT_SIZES = [10, 100, 1000, 10000]
+    DEFAULT_REPEAT = 3
+    DEFAULT_THRESHOLD = 0.25
+    DEFAULT_MIN_DELTA = 0.001
+
+    ACTIVATE = "activate_plugins"
+    DEACTIVATE = "deactivate_plugins"
+    GET_PLUGIN = "get_plugin"
+    TOPOSORT = "toposort"
+    OPERATIONS = [ACTIVATE, DEACTIVATE, GET_PLUGIN, TOPOSORT]
+
+    def __init__(self, sizes=None, shapes=None, repeat=DEFAULT_REPEAT, lazy_discovery=False, root_path=None):
+        '''
+        Constructor
+
+        :param sizes: List of plugin counts to benchmark. Defaults to DEFAULT_SIZES
+        :param shapes: List of graph shapes to benchmark. Defaults to every SyntheticHome shape
+        :param repeat: The number of samples taken of each operation
+        :param lazy_discovery: Boolean specifying whether Plugsy should discover plugins lazily
+        :param root_path: Optional directory to build plugin homes in. A temporary directory is used if None
+        '''
+        Logger.__init__(self, name="%s.benchmarks.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(repeat, int) or repeat < 1:
+            raise ValueError("repeat must be a positive integer")
+
+        self.__sizes = list(sizes or self.DEFAULT_SIZES)
+        self.__shapes = list(shapes or SyntheticHome.SHAPES)
+        self.__repeat = repeat
+        self.__lazy_discovery = lazy_discovery
+        self.__root_path = root_path
+
+
+    def run(self, progress=None):
+        '''
+        Runs every benchmark
+
+        :param progress: Optional callable taking (shape, size, results) after each home is benchmarked
+        :return: Dict of results, in the format accepted by compare()
+        '''
+        self.trace("ENTRY")
+        results = {}
+
+        with tempfile.TemporaryDirectory(prefix="plugsy-bench-", dir=self.__root_path) as root_path:
+            for shape in self.__shapes:
+                for size in self.__sizes:
+                    home = SyntheticHome(root_path, size, shape)
+                    home.create()
+                    try:
+                        timings = self.__run_home(home)
+                    finally:
+                        home.destroy()
+
+                    results.setdefault(shape, {})[str(size)] = timings
+                    if progress:
+                        progress(shape, size, timings)
+
+        self.trace("EXIT")
+        return {
+            "format": self.FORMAT,
+            "version": Config.VERSION,
+            "python": platform.python_version(),
+            "created": time.time(),
+            "repeat": self.__repeat,
+            "lazy_discovery": self.__lazy_discovery,
+            "results": results
+        }
+
+
+    def __run_home(self, home):
+        '''
+        Benchmarks every operation against a single home
+
+        :param home: SyntheticHome object, already created
+        :return: Dict of <operation>:<seconds>
+        '''
+        self.logger.debug("Benchmarking %s", home)
+        names = home.get_plugin_names()
+        graph = dict((name.lower(), set(dependencies)) for name, dependencies in home.get_graph())
+        samples = dict((operation, []) for operation in self.OPERATIONS)
+
+        for _ in range(self.__repeat):
+            # Modules are reimported each sample so every activation includes its import cost
+            home.activate_path()
+            plugsy = Plugsy(lazy_discovery=self.__lazy_discovery)
+
+            started = time.perf_counter()
+            plugsy.activate_plugins()
+            samples[self.ACTIVATE].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for name in names:
+                plugsy.get_plugin(name)
+            samples[self.GET_PLUGIN].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            plugsy.deactivate_plugins()
+            samples[self.DEACTIVATE].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for _generation in toposort(graph):
+                pass
+            samples[self.TOPOSORT].append(time.perf_counter() - started)
+
+        return dict((operation, min(timings)) for operation, timings in samples.items())
+
+
+    @classmethod
+    def load(cls, path):
+        '''
+        Loads results from a JSON file
+
+        :param path: Path of the results file
+        :return: Dict of results
+        :raise: ValueError if the file isn't a compatible results file
+        '''
+
+        with open(path, "r") as results_file:
+            results = json.load(results_file)
+
+        if not isinstance(results, dict) or results.get("format") != cls.FORMAT:
+            raise ValueError("'%s' is not a compatible benchmark results file" % path)
+        return results
+
+
+    @staticmethod
+    def save(results, path):
+        '''
+        Writes results to a JSON file
+
+        :param results: Dict of results, as returned by run()
+        :param path: Path of the results file
+        '''
+
+        with open(path, "w") as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+    @classmethod
+    def compare(cls, baseline, current, threshold=DEFAULT_THRESHOLD, min_delta=DEFAULT_MIN_DELTA):
+        '''
+        Compares results against a baseline. An operation has regressed when it is slower than the baseline by more
+        than threshold (relatively) and min_delta (absolutely), so timings too small to measure reliably aren't
+        flagged
+
+        :param baseline: Dict of baseline results
+        :param current: Dict of current results
+        :param threshold: Allowed slowdown as a fraction of the baseline timing
+        :param min_delta: Allowed slowdown in seconds, regardless of threshold
+        :return: List of comparison dicts (shape, size, operation, baseline, current, ratio, regressed), ordered by
+            shape, size and operation. Only entries present in both results are compared
+        '''
+        comparisons = []
+
+        for shape, sizes in sorted(current["results"].items()):
+            for size, timings in sorted(sizes.items(), key=lambda item: int(item[0])):
+                baseline_timings = baseline["results"].get(shape, {}).get(size, {})
+
+                for operation in cls.OPERATIONS:
+                    if operation not in timings or operation not in baseline_timings:
+                        continue
+
+                    before = baseline_timings[operation]
+                    after = timings[operation]
+                    comparisons.append({
+                        "shape": shape,
+                        "size": int(size),
+                        "operation": operation,
+                        "baseline": before,
+                        "current": after,
+                        "ratio": after / before if before else float("inf"),
+                        "regressed": after > before * (1 + threshold) and after - before > min_delta
+                    })
+
+        return comparisons
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_sizes(self):
+        '''
+        Gets the plugin counts benchmarked
+
+        :return: List of sizes
+        '''
+
+        return self.__sizes
+
+
+    def get_shapes(self):
+        '''
+        Gets the graph shapes benchmarked
+
+        :return: List of shape names
+        '''
+
+        return self.__shapes
@@ -0,0 +1,248 @@
+'''
+SyntheticHome - Generates plugin homes of arbitrary size and dependency shape for benchmarking
+'''
+
+# Import libs
+import importlib
+import os
+import random
+import shutil
+import sys
+
+# Import package modules
+from plugsy import Config
+from plugsy.utils import Logger
+
+# Plugin class written for every synthetic plugin. Unlike the SDK template it blocks on the stop event rather than
+# polling it, so stop latency doesn't dominate deactivation timings
+PLUGIN_SOURCE = """'''
+%(name)s - Synthetic benchmark plugin
+'''
+
+from plugsy.AbstractPlugin import AbstractPlugin
+
+class %(name)s(AbstractPlugin):
+
+    def __init__(self, plugsy):
+        AbstractPlugin.__init__(self, plugsy)
+
+
+    def run(self):
+        self.stop_event.wait()
+"""
+
+INIT_SOURCE = """from .%(name)s import %(name)s
+from .Config import *
+"""
+
+CONFIG_SOURCE = """DEPENDENCIES = %(dependencies)r
+"""
+
+
+class SyntheticHome(Logger):
+    '''
+    A plugins home populated with synthetic core plugins whose dependencies form a given graph shape. Files are
+    written directly rather than through Sdk.create_plugin, which rewrites the subpackage __init__ for every plugin
+    and is itself quadratic in the number of plugins
+    '''
+
+    ROOT_PACKAGE = "plugins"
+    NAME_FORMAT = "Plugin%05d"
+
+    CHAIN = "chain"
+    FANOUT = "fanout"
+    DIAMOND = "diamond"
+    RANDOM = "random"
+    FLAT = "flat"
+    SHAPES = [CHAIN, FANOUT, DIAMOND, RANDOM, FLAT]
+
+    def __init__(self, root_path, size, shape, seed=0, max_random_dependencies=3):
+        '''
+        Constructor
+
+        :param root_path: Directory the plugins package is created in. It's emptied on create()
+        :param size: The number of plugins to generate
+        :param shape: The dependency graph shape. One of SHAPES
+        :param seed: Seed for the random shape, so graphs are reproducible between runs
+        :param max_random_dependencies: Maximum number of dependencies of each plugin in the random shape
+        '''
+        Logger.__init__(self, name="%s.benchmarks.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if shape not in self.SHAPES:
+            raise ValueError("Unknown graph shape '%s'. Expected one of %s" % (shape, self.SHAPES))
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("size must be a positive integer")
+
+        self.__root_path = os.path.abspath(root_path)
+        self.__size = size
+        self.__shape = shape
+        self.__seed = seed
+        self.__max_random_dependencies = max_random_dependencies
+        self.__graph = None
+
+
+    def __repr__(self):
+        return "<SyntheticHome %s/%s>" % (self.__shape, self.__size)
+
+
+    def create(self):
+        '''
+        Writes the plugins home to disk and makes it importable as the root plugins package
+
+        :return: Path of the plugins package directory
+        '''
+        self.trace("ENTRY")
+        home_path = self.get_home_path()
+
+        self.destroy()
+        for subpackage in ["core", "addon"]:
+            os.makedirs(os.path.join(home_path, subpackage))
+
+        with open(os.path.join(home_path, "__init__.py"), "w") as init_file:
+            init_file.write("from . import core\nfrom . import addon\n")
+        open(os.path.join(home_path, "addon", "__init__.py"), "w").close()
+
+        graph = self.get_graph()
+        with open(os.path.join(home_path, "core", "__init__.py"), "w") as init_file:
+            init_file.writelines("from . import %s\n" % name for name, _ in graph)
+
+        for name, dependencies in graph:
+            plugin_path = os.path.join(home_path, "core", name)
+            os.mkdir(plugin_path)
+            for filename, source in [
+                ("__init__.py", INIT_SOURCE), ("Config.py", CONFIG_SOURCE), ("%s.py" % name, PLUGIN_SOURCE)
+            ]:
+                with open(os.path.join(plugin_path, filename), "w") as plugin_file:
+                    plugin_file.write(source % {"name": name, "dependencies": dependencies})
+
+        self.activate_path()
+        self.trace("EXIT - created %s plugins at '%s'", self.__size, home_path)
+        return home_path
+
+
+    def destroy(self):
+        '''
+        Removes the plugins home from disk and unloads any of its imported modules
+        '''
+
+        self.deactivate_path()
+        shutil.rmtree(self.get_home_path(), ignore_errors=True)
+
+
+    def activate_path(self):
+        '''
+        Makes this home the importable root plugins package, replacing any previously imported one
+        '''
+
+        self.__unload_modules()
+        if self.__root_path not in sys.path:
+            sys.path.insert(0, self.__root_path)
+        importlib.invalidate_caches()
+
+
+    def deactivate_path(self):
+        '''
+        Unloads this home's modules and removes it from sys.path
+        '''
+
+        self.__unload_modules()
+        if self.__root_path in sys.path:
+            sys.path.remove(self.__root_path)
+
+
+    def __unload_modules(self):
+        '''
+        Drops the root plugins package and its submodules from sys.modules
+        '''
+        prefix = "%s." % self.ROOT_PACKAGE
+
+        for module_name in [name for name in sys.modules if name == self.ROOT_PACKAGE or name.startswith(prefix)]:
+            del sys.modules[module_name]
+
+
+    def __generate_graph(self):
+        '''
+        Generates the dependency graph for the configured shape. Plugins only ever depend on plugins generated
+        before them, so every shape is acyclic
+
+        :return: List of (plugin name, list of lowercase dependency names) tuples
+        '''
+        names = [self.NAME_FORMAT % index for index in range(self.__size)]
+        keys = [name.lower() for name in names]
+        rng = random.Random(self.__seed)
+        graph = []
+
+        for index, name in enumerate(names):
+            if index == 0 or self.__shape == self.FLAT:
+                dependencies = []
+            elif self.__shape == self.CHAIN:
+                dependencies = [keys[index - 1]]
+            elif self.__shape == self.FANOUT:
+                dependencies = [keys[0]]
+            elif self.__shape == self.DIAMOND:
+                # Repeating diamonds: top -> (left, right) -> bottom, where each bottom is the next top
+                position = index % 3
+                top = index - position if position else index - 3
+                dependencies = [keys[top]] if position else [keys[index - 2], keys[index - 1]]
+            else:
+                count = rng.randint(1, min(index, self.__max_random_dependencies))
+                dependencies = sorted(keys[dependency] for dependency in rng.sample(range(index), count))
+
+            graph.append((name, dependencies))
+
+        return graph
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_graph(self):
+        '''
+        Gets the dependency graph of the home
+
+        :return: List of (plugin name, list of lowercase dependency names) tuples, in generation order
+        '''
+
+        if self.__graph is None:
+            self.__graph = self.__generate_graph()
+        return self.__graph
+
+
+    def get_plugin_names(self):
+        '''
+        Gets the names of the generated plugins
+
+        :return: List of plugin names
+        '''
+
+        return [name for name, _ in self.get_graph()]
+
+
+    def get_home_path(self):
+        '''
+        Gets the path of the plugins package directory
+
+        :return: Path
+        '''
+
+        return os.path.join(self.__root_path, self.ROOT_PACKAGE)
+
+
+    def get_size(self):
+        '''
+        Gets the number of plugins in the home
+
+        :return: Plugin count
+        '''
+
+        return self.__size
+
+
+    def get_shape(self):
+        '''
+        Gets the dependency graph shape of the home
+
+        :return: Shape name
+        '''
+
+        return self.__shape
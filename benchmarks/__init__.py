@@ -0,0 +1,6 @@
+'''
+PlugSy benchmarks
+'''
+
+from .Benchmark import Benchmark
+from .SyntheticHome import SyntheticHome
@@ -0,0 +1,101 @@
+'''
+Benchmark runner. Run from the repository root with: python -m benchmarks
+'''
+
+# Import libs
+import argparse
+import sys
+import threading
+
+# Import package modules
+from .Benchmark import Benchmark
+from .SyntheticHome import SyntheticHome
+
+# Every plugin is a thread, so keep stacks small enough for the largest homes
+THREAD_STACK_SIZE = 256 * 1024
+
+
+def parse_args(argv):
+    '''
+    Parses the command line arguments
+
+    :param argv: List of arguments
+    :return: argparse Namespace
+    '''
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark PlugSy at scale")
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=Benchmark.DEFAULT_SIZES,
+                        help="Plugin counts to benchmark")
+    parser.add_argument("--shapes", nargs="+", choices=SyntheticHome.SHAPES, default=SyntheticHome.SHAPES,
+                        help="Dependency graph shapes to benchmark")
+    parser.add_argument("--repeat", type=int, default=Benchmark.DEFAULT_REPEAT,
+                        help="Samples per operation. The fastest is kept")
+    parser.add_argument("--lazy-discovery", action="store_true", help="Discover plugins lazily")
+    parser.add_argument("--output", help="Write results to this JSON file, e.g. to record a new baseline")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="Compare results against this baseline file and exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=Benchmark.DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before flagging a regression")
+    parser.add_argument("--min-delta", type=float, default=Benchmark.DEFAULT_MIN_DELTA,
+                        help="Allowed absolute slowdown in seconds before flagging a regression")
+
+    return parser.parse_args(argv)
+
+
+def print_timings(shape, size, timings):
+    '''
+    Prints the timings of a single home
+
+    :param shape: Graph shape
+    :param size: Plugin count
+    :param timings: Dict of <operation>:<seconds>
+    '''
+
+    print("%-8s %6s  %s" % (shape, size, "  ".join(
+        "%s=%.4fs" % (operation, timings[operation]) for operation in Benchmark.OPERATIONS
+    )))
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    '''
+    Runs the benchmarks
+
+    :param argv: Optional list of arguments. Defaults to sys.argv
+    :return: Exit status
+    '''
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    baseline = Benchmark.load(args.compare) if args.compare else None
+
+    threading.stack_size(THREAD_STACK_SIZE)
+    results = Benchmark(
+        sizes=args.sizes, shapes=args.shapes, repeat=args.repeat, lazy_discovery=args.lazy_discovery
+    ).run(progress=print_timings)
+
+    if args.output:
+        Benchmark.save(results, args.output)
+        print("Results written to '%s'" % args.output)
+
+    if baseline is None:
+        return 0
+
+    comparisons = Benchmark.compare(baseline, results, threshold=args.threshold, min_delta=args.min_delta)
+    regressions = [comparison for comparison in comparisons if comparison["regressed"]]
+
+    print("\nCompared %s timings against '%s'" % (len(comparisons), args.compare))
+    for comparison in comparisons:
+        print("%-8s %6s  %-18s %.4fs -> %.4fs  x%.2f%s" % (
+            comparison["shape"], comparison["size"], comparison["operation"], comparison["baseline"],
+            comparison["current"], comparison["ratio"], "  REGRESSION" if comparison["regressed"] else ""
+        ))
+
+    if regressions:
+        print("\n%s regression(s) found" % len(regressions))
+        return 1
+
+    print("\nNo regressions found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
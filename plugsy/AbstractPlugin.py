@@ -8,9 +8,15 @@ from threading import Event
 
 # Import package modules
 from . import Config
+from .MessageBus import MessageBus
+from .Supervisor import Supervisor
 from .utils import Logger
 
-class AbstractPlugin(Thread, Logger):
+class AbstractPlugin(Logger):
+    '''
+    Plugin base class. The plugin object outlives its worker thread: each activation runs run() in a fresh thread,
+    so a deactivated plugin can be activated again with its configuration and state intact
+    '''
 
     def __init__(self, plugsy, name=None):
         '''
@@ -23,8 +29,20 @@ class AbstractPlugin(Thread, Logger):
         self.__loaded = False
         self.__is_core_plugin = False
         self.__is_initialised = True
+        self.__signals_ready = False
+        self.__shutdown_timeout = None
+        self.__restart_policy = Supervisor.NEVER
+        self.__restart_backoff = Supervisor.DEFAULT_BACKOFF
+        self.__max_restart_backoff = Supervisor.DEFAULT_MAX_BACKOFF
+        self.__failure = None
+        self.__failure_listener = None
         self.plugsy = plugsy
         self.stop_event = Event()
+        self.ready_event = Event()
+        self.wake_event = Event()
+        # Set once the plugin reports ready or its run ends, so waiting for readiness never outlives the plugin
+        self.__settled = Event()
+        self.__thread = None
 
         # Set name
         if not name:
@@ -32,9 +50,6 @@ class AbstractPlugin(Thread, Logger):
         else:
             self.__set_name(name)
 
-        # Super
-        Thread.__init__(self)
-
 
     def run(self):
         '''
@@ -51,14 +66,106 @@ class AbstractPlugin(Thread, Logger):
         )
 
 
+    def start(self):
+        '''
+        Starts run() in a new worker thread
+
+        :raise: RuntimeError if the plugin is already running
+        '''
+
+        if self.is_alive():
+            raise RuntimeError("Plugin '%s' is already running" % self.__name)
+
+        self.__thread = Thread(target=self.__run_thread, name=self.__name)
+        self.__thread.start()
+
+
+    def __run_thread(self):
+        '''
+        Worker thread body. Records an exception raised by run(), rather than letting the thread die silently
+        '''
+
+        try:
+            self.run()
+        except Exception as ex:
+            self.logger.error("Plugin run() raised an exception", exc_info=True)
+            self.set_failure(ex)
+        finally:
+            self.set_finished()
+
+
+    def is_alive(self):
+        '''
+        Checks whether the plugin's worker thread is running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__thread is not None and self.__thread.is_alive()
+
+
+    def join(self, timeout=None):
+        '''
+        Waits for the plugin's worker thread to finish
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        '''
+
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+
+
     def stop(self):
         '''
-        Plugin stop method. Stops plugin execution by setting stop event to iterrupt actions
+        Plugin stop method. Stops plugin execution by setting stop event to iterrupt actions, and wakes the plugin
+        if it's waiting for work
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.stop_event.set()
-        self.logger.debug("EXIT")
+        self.wake_event.set()
+        self.trace("EXIT")
+
+
+    def wake(self):
+        '''
+        Signals the plugin that there's work to do, waking it from wait_for_work(). Safe to call from any thread
+        '''
+
+        self.wake_event.set()
+
+
+    def wait_for_work(self, timeout=None):
+        '''
+        Blocks the run loop until the plugin is woken with wake(), the timeout passes or the plugin is stopped.
+        Intended as the condition of the run() loop, in place of polling the stop event
+
+        :param timeout: Optional number of seconds to wait, for plugins doing periodic work. Waits indefinitely if None
+        :return: False once the plugin is stopping, otherwise True
+        '''
+
+        if self.stop_event.is_set():
+            return False
+
+        self.wake_event.wait(timeout)
+        self.wake_event.clear()
+        return not self.stop_event.is_set()
+
+
+    def subscribe(self, topic, max_size=MessageBus.DEFAULT_QUEUE_SIZE, overflow_policy=MessageBus.BLOCK):
+        '''
+        Subscribes the plugin to a topic of PlugSy's message bus, waking it from wait_for_work() when messages arrive.
+        The subscription is removed once the plugin is deactivated, restarted or reloaded
+
+        :param topic: The topic name
+        :param max_size: Maximum number of messages queued for the subscription
+        :param overflow_policy: One of MessageBus.OVERFLOW_POLICIES
+        :return: Subscription
+        '''
+
+        return self.plugsy.get_message_bus().subscribe(
+            topic, max_size=max_size, overflow_policy=overflow_policy, notify=self.wake, owner=self.__name
+        )
 
 
     def load_configuration(self, configuration):
@@ -67,39 +174,114 @@ class AbstractPlugin(Thread, Logger):
 
         :param configuration: Plugin configuration module
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Load plugin dependencies
         self.set_dependencies(configuration.DEPENDENCIES)
-        self.logger.debug("EXIT")
+
+        # Plugins that signal readiness themselves must call set_ready() from run()
+        self.__signals_ready = bool(getattr(configuration, "SIGNALS_READY", False))
+
+        # Optional number of seconds the plugin is given to stop when deactivated
+        self.__shutdown_timeout = getattr(configuration, "SHUTDOWN_TIMEOUT", None)
+
+        # What the supervisor does when run() raises. Backoff delays double per consecutive failure, up to the max
+        self.__restart_policy = getattr(configuration, "RESTART_POLICY", Supervisor.NEVER)
+        if self.__restart_policy not in Supervisor.RESTART_POLICIES:
+            raise ValueError("Unknown restart policy '%s'. Expected one of %s" % (
+                self.__restart_policy, Supervisor.RESTART_POLICIES
+            ))
+        self.__restart_backoff = getattr(configuration, "RESTART_BACKOFF", Supervisor.DEFAULT_BACKOFF)
+        self.__max_restart_backoff = getattr(configuration, "RESTART_MAX_BACKOFF", Supervisor.DEFAULT_MAX_BACKOFF)
+        if not 0 < self.__restart_backoff <= self.__max_restart_backoff:
+            raise ValueError("RESTART_BACKOFF must be a positive number of seconds, up to RESTART_MAX_BACKOFF")
+        self.trace("EXIT")
 
 
     def activate(self):
         '''
-        Activates the plugin and starts the thread
+        Activates the plugin and starts the thread. A deactivated plugin can be activated again
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         self.__activated = True
 
+        # Clear the events and failure of any previous activation
+        self.__failure = None
+        self.stop_event.clear()
+        self.ready_event.clear()
+        self.wake_event.clear()
+        self.__settled.clear()
+
         # Start main thread
         self.start()
 
+        if not self.__signals_ready:
+            self.set_ready()
+
         self.logger.info("Plugin activated!")
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
-    def deactivate(self):
+    def deactivate(self, timeout=None):
         '''
-        Deactivates the plugin and calls the plugin stop method
+        Deactivates the plugin by calling the plugin stop method, and waits for it to stop running
+
+        :param timeout: Optional number of seconds to wait for the plugin to stop. Waits indefinitely if None
+        :return: True if the plugin stopped, otherwise False
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.stop()
+        stopped = self.wait_until_stopped(timeout)
 
-        # TODO Wait until we're no longer running before setting this and returning. Might need to close handles etc.
-        self.__activated = True
+        self.trace("EXIT with %s", stopped)
+        return stopped
+
+
+    def wait_until_stopped(self, timeout=None):
+        '''
+        Waits for a stopped plugin's thread to finish. The plugin is marked deactivated once it has
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        :return: True if the plugin is no longer running, otherwise False
+        '''
+        self.trace("ENTRY")
+
+        if self.is_alive():
+            self.join(timeout)
+
+        if self.is_alive():
+            self.logger.warning("Plugin still running after %ss", timeout)
+            self.trace("EXIT with False")
+            return False
+
+        self.__activated = False
         self.logger.info("Plugin deactivated!")
-        self.logger.debug("EXIT")
+        self.trace("EXIT with True")
+        return True
+
+
+    def set_ready(self):
+        '''
+        Reports the plugin as ready. Dependents of this plugin are not activated until it is ready
+        '''
+        self.trace("ENTRY")
+
+        self.ready_event.set()
+        self.__settled.set()
+        self.trace("EXIT")
+
+
+    def wait_until_ready(self, timeout=None):
+        '''
+        Blocks until the plugin reports ready, or its run ends without it having done so
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        :return: True if the plugin is ready, otherwise False
+        '''
+
+        self.__settled.wait(timeout)
+        return self.ready_event.is_set()
 
 
     def init_logging(self):
@@ -124,9 +306,7 @@ class AbstractPlugin(Thread, Logger):
 
         :return: True if activated, otherwise False
         '''
-        self.logger.debug("ENTRY")
 
-        self.logger.debug("EXIT")
         return self.__activated
 
     def get_name(self):
@@ -139,15 +319,63 @@ class AbstractPlugin(Thread, Logger):
         return self.__name
 
 
+    def get_failure(self):
+        '''
+        Gets the exception raised by run() since the plugin was last activated
+
+        :return: The exception, or None if run() hasn't raised
+        '''
+
+        return self.__failure
+
+
+    def get_restart_policy(self):
+        '''
+        Gets what the supervisor does when run() raises
+
+        :return: One of Supervisor.RESTART_POLICIES
+        '''
+
+        return self.__restart_policy
+
+
+    def get_restart_backoff(self):
+        '''
+        Gets the delay before the first restart of the backoff restart policy
+
+        :return: Seconds
+        '''
+
+        return self.__restart_backoff
+
+
+    def get_max_restart_backoff(self):
+        '''
+        Gets the maximum delay before a restart under the backoff restart policy
+
+        :return: Seconds
+        '''
+
+        return self.__max_restart_backoff
+
+
+    def get_shutdown_timeout(self):
+        '''
+        Gets the number of seconds the plugin is given to stop when deactivated
+
+        :return: Seconds, or None if not set in the plugin config
+        '''
+
+        return self.__shutdown_timeout
+
+
     def is_core_plugin(self):
         '''
         Checks whether the plugin is a core plugin (within the core subpackage)
 
         :return: True if plugin is a core plugin, otherwise False
         '''
-        self.logger.debug("ENTRY")
 
-        self.logger.debug("EXIT")
         return self.__is_core_plugin
 
 
@@ -171,9 +399,7 @@ class AbstractPlugin(Thread, Logger):
 
         :return: Plugin dependencies as a list of strings (plugin names)
         '''
-        self.logger.debug("ENTRY")
 
-        self.logger.debug("EXIT")
         return self.__dependencies
 
 
@@ -196,15 +422,45 @@ class AbstractPlugin(Thread, Logger):
 
         :param dependencies: A list of plugins that the plugin depends on
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         dependency_set = set()
 
         for dependency in dependencies:
             dependency_set.add(dependency.lower())
 
         self.__dependencies = dependency_set
-        self.logger.debug("Plugin dependencies set to '%s'" % dependencies)
-        self.logger.debug("EXIT")
+        self.logger.debug("Plugin dependencies set to '%s'", dependencies)
+        self.trace("EXIT")
+
+
+    def set_failure(self, exception):
+        '''
+        Records an exception that ended the plugin's run, and notifies the failure listener
+
+        :param exception: The exception
+        '''
+
+        self.__failure = exception
+        if self.__failure_listener is not None:
+            self.__failure_listener()
+
+
+    def set_finished(self):
+        '''
+        Reports that the plugin's run has ended, releasing anything still waiting for it to report ready
+        '''
+
+        self.__settled.set()
+
+
+    def set_failure_listener(self, listener):
+        '''
+        Sets a callable invoked, without arguments, whenever the plugin fails. Must not block
+
+        :param listener: Callable, or None to remove the listener
+        '''
+
+        self.__failure_listener = listener
 
 
     def set_core_plugin(self):
@@ -0,0 +1,252 @@
+'''
+Activator - Activates plugins generation by generation
+'''
+
+# Import libs
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Import package modules
+from . import Config
+from .Exceptions import *
+from .ShutdownReport import ShutdownReport
+from .StartupReport import StartupReport
+from .utils import Logger
+
+class Activator(Logger):
+    '''
+    Activates plugins concurrently, one dependency generation at a time. Every plugin within a generation is
+    activated in parallel (bounded by max_workers) and the next generation is only started once all plugins of the
+    previous generation report ready. Deactivation works the same way, with generations ordered dependents first
+    '''
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, ready_timeout=None):
+        '''
+        Constructor
+
+        :param max_workers: Maximum number of plugins to activate concurrently
+        :param ready_timeout: Optional number of seconds to wait for each plugin to report ready. Waits
+            indefinitely if None
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.__max_workers = max_workers
+        self.__ready_timeout = ready_timeout
+
+
+    def activate(self, generations, report=None):
+        '''
+        Activates the specified plugin generations in order
+
+        :param generations: List of plugin object lists. Each inner list holds plugins that do not depend on each
+            other and may be activated concurrently
+        :param report: Optional StartupReport to record activation timings into
+        :return: List of activated plugin objects, in activation order
+        :raise: PluginNotReady if a plugin does not report ready within the ready timeout, or fails before it does.
+            Every plugin started by the call is deactivated before raising
+        '''
+        self.trace("ENTRY")
+        activated = []
+
+        generations = [generation for generation in generations if generation]
+        if not generations:
+            self.logger.debug("No plugins to activate")
+            return activated
+
+        self.logger.debug("Activating %s generations", len(generations))
+        report = report if report is not None else StartupReport()
+        try:
+            for generation in self.__run_generations(partial(self.__activate_plugin, report), generations):
+                activated += generation
+        except Exception:
+            self.abort(generations)
+            raise
+
+        self.trace("EXIT")
+        return activated
+
+
+    def abort(self, generations):
+        '''
+        Deactivates the plugins of a failed activation that were started, dependents first, so none are left running
+
+        :param generations: List of plugin object lists, in activation order
+        :return: ShutdownReport
+        '''
+        self.trace("ENTRY")
+
+        started = [[plugin for plugin in generation if plugin.is_activated()] for generation in reversed(generations)]
+        self.logger.error(
+            "Activation failed. Deactivating the %s plugins it started", sum(len(generation) for generation in started)
+        )
+        report = self.deactivate(started)
+
+        self.trace("EXIT with %s", report)
+        return report
+
+
+    def deactivate(self, generations, timeout=None, plugin_timeouts=None, report=None):
+        '''
+        Deactivates the specified plugin generations in order. Every plugin of a generation is signalled to stop
+        first, and the generation's plugins are then waited on concurrently. Waiting is bounded by the global
+        timeout, and by each plugin's own timeout (from plugin_timeouts, or SHUTDOWN_TIMEOUT in its config) counted
+        from when it was signalled. Plugins that overrun are given up on and reported
+
+        :param generations: List of plugin object lists. Each inner list holds plugins that no remaining plugin
+            depends on, which may be deactivated concurrently
+        :param timeout: Optional number of seconds the whole deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding individual plugin timeouts
+        :param report: Optional ShutdownReport to add results to
+        :return: ShutdownReport
+        '''
+        self.trace("ENTRY")
+        report = report if report is not None else ShutdownReport()
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+        plugin_timeouts = dict((name.lower(), seconds) for name, seconds in (plugin_timeouts or {}).items())
+        signalled = {}
+
+        generations = [generation for generation in generations if generation]
+        if not generations:
+            self.logger.debug("No plugins to deactivate")
+            return report
+
+        # Waiting is idle, so every plugin of a generation gets its own worker to keep timings accurate
+        self.logger.debug("Deactivating %s generations", len(generations))
+        for _ in self.__run_generations(
+                partial(self.__stop_plugin, signalled, deadline, plugin_timeouts, report),
+                generations,
+                before=partial(self.__signal_generation, signalled),
+                workers=max(len(generation) for generation in generations)
+        ):
+            pass
+
+        report.set_elapsed(report.get_elapsed() + time.monotonic() - started)
+        self.trace("EXIT with %s", report)
+        return report
+
+
+    def __run_generations(self, action, generations, before=None, workers=None):
+        '''
+        Applies an action to every plugin of each generation concurrently, one generation at a time
+
+        :param action: Callable taking a plugin object
+        :param generations: Non-empty list of non-empty plugin object lists
+        :param before: Optional callable taking each generation, called before the action is dispatched
+        :param workers: Optional worker count. Defaults to max_workers
+        :return: Generator yielding each generation once the action has completed for all of its plugins
+        '''
+        workers = min(workers or self.__max_workers, max(len(generation) for generation in generations))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plugsy-activator") as executor:
+            for index, generation in enumerate(generations):
+                self.logger.debug("Generation %s: %s", index, generation)
+                if before:
+                    before(generation)
+
+                # Single plugin generations are handled inline to skip the executor round trip
+                if len(generation) == 1:
+                    action(generation[0])
+                else:
+                    futures = [executor.submit(action, plugin) for plugin in generation]
+
+                    # Wait for the whole generation before raising so no action is left running
+                    errors = [future.exception() for future in futures]
+                    for error in errors:
+                        if error is not None:
+                            raise error
+
+                yield generation
+
+
+    def __activate_plugin(self, report, plugin):
+        '''
+        Activates a single plugin and waits for it to report ready
+
+        :param report: StartupReport to record timings into
+        :param plugin: The plugin object to activate
+        :raise: PluginNotReady
+        '''
+        self.logger.debug("Activating '%s'", plugin.get_name())
+
+        with report.measure(StartupReport.ACTIVATE, plugin.get_name()):
+            plugin.activate()
+        with report.measure(StartupReport.READY, plugin.get_name()):
+            ready = plugin.wait_until_ready(self.__ready_timeout)
+
+        # Waiting also ends once the plugin's run ends, so a plugin that isn't ready has failed rather than timed out
+        # if it recorded a failure, its worker is no longer alive, or there was no timeout to run out
+        failure = plugin.get_failure()
+        if not ready and (failure is not None or self.__ready_timeout is None or not plugin.is_alive()):
+            failure = failure or RuntimeError("run() returned")
+            self.logger.error("Plugin '%s' failed before reporting ready: %s", plugin.get_name(), failure)
+            raise PluginNotReady(plugin, self.__ready_timeout, failure) from failure
+        elif not ready:
+            self.logger.error(
+                "Plugin '%s' did not report ready within %ss", plugin.get_name(), self.__ready_timeout
+            )
+            raise PluginNotReady(plugin, self.__ready_timeout)
+
+        self.logger.debug("'%s' is ready", plugin.get_name())
+
+
+    def __signal_generation(self, signalled, generation):
+        '''
+        Signals every plugin of a generation to stop
+
+        :param signalled: Dict of <plugin name>:<monotonic time signalled> to record into
+        :param generation: List of plugin objects
+        '''
+
+        for plugin in generation:
+            self.logger.debug("Signalling '%s' to stop", plugin.get_name())
+            signalled[plugin.get_name()] = time.monotonic()
+            plugin.stop()
+
+
+    def __stop_plugin(self, signalled, deadline, plugin_timeouts, report, plugin):
+        '''
+        Waits for a signalled plugin to stop, within its timeout and the global deadline
+
+        :param signalled: Dict of <plugin name>:<monotonic time signalled>
+        :param deadline: Monotonic time by which all plugins must have stopped, or None
+        :param plugin_timeouts: Dict of <lowercase plugin name>:<seconds> overrides
+        :param report: ShutdownReport to record the result into
+        :param plugin: The plugin object to wait for
+        '''
+        name = plugin.get_name()
+        plugin_timeout = plugin_timeouts.get(name.lower(), plugin.get_shutdown_timeout())
+
+        # Wait until whichever of the plugin's own timeout and the global deadline comes first
+        ends = [end for end in [
+            deadline, signalled[name] + plugin_timeout if plugin_timeout is not None else None
+        ] if end is not None]
+        wait = max(0.0, min(ends) - time.monotonic()) if ends else None
+
+        stopped = plugin.wait_until_stopped(wait)
+        duration = time.monotonic() - signalled[name]
+        report.add(name, stopped, duration, plugin_timeout)
+
+        if stopped:
+            self.logger.debug("'%s' stopped in %.3fs", name, duration)
+        else:
+            self.logger.warning("'%s' overran its shutdown timeout and is still running", name)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_max_workers(self):
+        '''
+        Gets the maximum number of concurrent activations
+
+        :return: Max worker count
+        '''
+
+        return self.__max_workers
@@ -0,0 +1,157 @@
+'''
+Defines the Abstract Plugin that async plugins must derive from
+'''
+
+# Import libs
+from threading import Event
+
+# Import package modules
+from .AbstractPlugin import AbstractPlugin
+
+class AsyncAbstractPlugin(AbstractPlugin):
+    '''
+    Plugin whose run() is a coroutine. Rather than getting a thread of its own, the plugin is run as a task on one of
+    the event loops of its PlugSy object's EventLoopRuntime. Stopping the plugin sets its stop event and cancels the
+    task, so run() receives CancelledError at its current await. Activation, readiness, dependencies and
+    deactivation otherwise behave exactly as for threaded plugins
+    '''
+
+    def __init__(self, plugsy, name=None):
+        '''
+        Constructor
+
+        :param plugsy: Parent PlugSy object
+        :param name: The name of the plugin. Optional, overrides package name
+        '''
+        AbstractPlugin.__init__(self, plugsy, name)
+
+        self.__runtime = None
+        self.__loop = None
+        self.__task = None
+        self.__finished = Event()
+
+
+    async def run(self):
+        '''
+        Plugin main run coroutine holding the main plugin code. Scheduled upon plugin activation
+        Must be overriden by derived classes (plugins)
+
+        :raises: NotImplementedError If plugin hasn't overridden method
+        '''
+
+        self.logger.error("Plugin does not have a run() coroutine")
+        raise NotImplementedError(
+            "Abstract run() coroutine must be implemented by '%s'" %
+            self.__class__.__name__
+        )
+
+
+    def start(self):
+        '''
+        Schedules run() on an event loop, in place of a worker thread
+
+        :raise: RuntimeError if the plugin is already running
+        '''
+
+        if self.is_alive():
+            raise RuntimeError("Plugin '%s' is already running" % self.get_name())
+
+        self.__task = None
+        self.__finished.clear()
+        self.__runtime = self.plugsy.get_async_runtime()
+        self.__loop = self.__runtime.acquire_loop()
+        self.__loop.call_soon_threadsafe(self.__create_task)
+
+
+    def stop(self):
+        '''
+        Plugin stop method. Sets the stop event and cancels the run() task
+        '''
+        self.trace("ENTRY")
+
+        AbstractPlugin.stop(self)
+        if self.__loop is not None and not self.__finished.is_set():
+            self.__loop.call_soon_threadsafe(self.__cancel_task)
+
+        self.trace("EXIT")
+
+
+    def is_alive(self):
+        '''
+        Checks whether run() is scheduled or running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__loop is not None and not self.__finished.is_set()
+
+
+    def join(self, timeout=None):
+        '''
+        Waits for run() to finish
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        '''
+
+        if self.__loop is not None:
+            self.__finished.wait(timeout)
+
+
+    def __create_task(self):
+        '''
+        Creates the run() task. Called on the event loop
+        '''
+
+        # Stopped before the task was created
+        if self.stop_event.is_set():
+            self.__finish()
+            return
+
+        self.__task = self.__loop.create_task(self.run(), name=self.get_name())
+        self.__task.add_done_callback(self.__on_task_done)
+
+
+    def __cancel_task(self):
+        '''
+        Cancels the run() task. Called on the event loop
+        '''
+
+        if self.__task is not None:
+            self.__task.cancel()
+
+
+    def __on_task_done(self, task):
+        '''
+        Task done callback. Logs and records any exception raised by run()
+
+        :param task: The finished run() task
+        '''
+        failure = None if task.cancelled() else task.exception()
+
+        if failure is not None:
+            self.logger.error("Plugin run() raised an exception", exc_info=failure)
+            self.set_failure(failure)
+        self.__finish()
+
+
+    def __finish(self):
+        '''
+        Marks run() as finished and releases the plugin's event loop
+        '''
+
+        self.__runtime.release_loop(self.__loop)
+        self.__finished.set()
+        self.set_finished()
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_loop(self):
+        '''
+        Gets the event loop the plugin is scheduled on
+
+        :return: asyncio event loop, or None if the plugin hasn't been started
+        '''
+
+        return self.__loop
@@ -4,4 +4,10 @@ Holds global PlugSy config
 
 VERSION = "0.2.31"
 FULL_NAME = "PlugSy"
-DEBUG_FILTERS = []
\ No newline at end of file
+DEBUG_FILTERS = []
+
+# Logger name prefixes (lowercase) to emit ENTRY/EXIT trace entries for. Tracing is disabled for all others
+TRACE_LOGGERS = []
+
+# multiprocessing start method of the processes plugins share channels with. spawn is safe with threads running
+PROCESS_START_METHOD = "spawn"
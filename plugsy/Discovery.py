@@ -0,0 +1,335 @@
+'''
+Discovery - Finds plugins and reads their metadata without importing them
+'''
+
+# Import libs
+import ast
+import importlib.util
+import os
+import runpy
+import sys
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class PluginInfo():
+    '''
+    Metadata of a discovered, but not necessarily imported, plugin
+    '''
+
+    def __init__(self, name, tier, dependencies, path):
+        '''
+        Constructor
+
+        :param name: The name of the plugin (its package name)
+        :param tier: The plugin's subpackage, core or addon
+        :param dependencies: Set of lowercase plugin names the plugin depends on
+        :param path: The absolute path of the plugin's package directory
+        '''
+        self.__name = name
+        self.__tier = tier
+        self.__dependencies = dependencies
+        self.__path = path
+
+
+    def __repr__(self):
+        return "<PluginInfo %s.%s>" % (self.__tier, self.__name)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_name(self):
+        '''
+        Gets the plugin's name
+
+        :return: Plugin name
+        '''
+
+        return self.__name
+
+
+    def get_tier(self):
+        '''
+        Gets the plugin's subpackage
+
+        :return: core or addon
+        '''
+
+        return self.__tier
+
+
+    def is_core_plugin(self):
+        '''
+        Checks whether the plugin is a core plugin
+
+        :return: True if plugin is a core plugin, otherwise False
+        '''
+
+        return self.__tier == "core"
+
+
+    def get_dependencies(self):
+        '''
+        Gets the plugin's dependencies
+
+        :return: Set of lowercase plugin names
+        '''
+
+        return self.__dependencies
+
+
+    def get_path(self):
+        '''
+        Gets the plugin's package directory
+
+        :return: Absolute path
+        '''
+
+        return self.__path
+
+
+class Discovery(Logger):
+    '''
+    Discovers the plugins of a plugins package by reading the subpackage __init__ files and statically parsing each
+    plugin's Config.py. Individual plugins can then be imported on demand, without executing the plugins package or
+    subpackage __init__ files (and so without importing every other plugin)
+
+    Plugin names are taken from the package names, so plugins overriding their name in AbstractPlugin.__init__ are
+    not supported in this mode
+    '''
+
+    CONFIG_FILENAME = "Config.py"
+    INIT_FILENAME = "__init__.py"
+
+    def __init__(self, root_package, cache=None):
+        '''
+        Constructor
+
+        :param root_package: The name of the root plugins package, such as "plugins"
+        :param cache: Optional DiscoveryCache. Cached metadata is reused for files that haven't changed
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+        self.__root_package = root_package
+        self.__cache = cache
+
+
+    def discover(self, tier):
+        '''
+        Discovers the plugins registered in a subpackage
+
+        :param tier: The subpackage to discover, core or addon
+        :return: List of PluginInfo objects in registration order. Empty if the subpackage doesn't exist
+        '''
+        self.trace("ENTRY")
+        discovered = []
+
+        root_path = self.get_root_path()
+        if root_path is None:
+            self.trace("EXIT - plugins package not found")
+            return discovered
+
+        tier_path = os.path.join(root_path, tier)
+        tier_init = os.path.join(tier_path, self.INIT_FILENAME)
+        if not os.path.isfile(tier_init):
+            self.trace("EXIT - no '%s' subpackage", tier)
+            return discovered
+
+        for name in self.__get_registered_plugins(tier, tier_init):
+            plugin_path = os.path.join(tier_path, name)
+            if not os.path.isfile(os.path.join(plugin_path, self.INIT_FILENAME)):
+                self.logger.debug("'%s' is not a plugin package. Skipping", name)
+                continue
+
+            discovered.append(PluginInfo(
+                name=name,
+                tier=tier,
+                dependencies=self.__get_dependencies(tier, name, os.path.join(plugin_path, self.CONFIG_FILENAME)),
+                path=plugin_path
+            ))
+
+        self.trace("EXIT with %s", discovered)
+        return discovered
+
+
+    def import_plugin(self, plugin_info):
+        '''
+        Imports a single discovered plugin package. The plugins package and subpackage are registered as bare
+        packages if not already imported, so their __init__ files aren't executed
+
+        :param plugin_info: The PluginInfo of the plugin to import
+        :return: The plugin package module
+        '''
+        self.trace("ENTRY")
+        tier_package = ".".join([self.__root_package, plugin_info.get_tier()])
+        module_name = ".".join([tier_package, plugin_info.get_name()])
+
+        if module_name in sys.modules:
+            self.trace("EXIT - '%s' already imported", module_name)
+            return sys.modules[module_name]
+
+        tier_path = os.path.dirname(plugin_info.get_path())
+        self.__register_package(self.__root_package, os.path.dirname(tier_path), execute=False)
+        self.__register_package(tier_package, tier_path, execute=False)
+        module = self.__register_package(module_name, plugin_info.get_path(), execute=True)
+
+        self.trace("EXIT")
+        return module
+
+
+    def __register_package(self, package_name, package_path, execute):
+        '''
+        Creates and registers a package module from its directory
+
+        :param package_name: Fully qualified package name
+        :param package_path: The package directory
+        :param execute: Boolean specifying whether the package __init__ should be executed
+        :return: The package module
+        '''
+        if package_name in sys.modules:
+            return sys.modules[package_name]
+
+        spec = importlib.util.spec_from_file_location(
+            package_name,
+            os.path.join(package_path, self.INIT_FILENAME),
+            submodule_search_locations=[package_path]
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[package_name] = module
+
+        if execute:
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[package_name]
+                raise
+
+        # Bind to the parent package, as the import system would
+        parent_name, _, child_name = package_name.rpartition(".")
+        if parent_name:
+            setattr(sys.modules[parent_name], child_name, module)
+
+        return module
+
+
+    def __get_registered_plugins(self, tier, init_path):
+        '''
+        Gets the plugin packages registered in a subpackage, from the cache where it is up to date
+
+        :param tier: core or addon
+        :param init_path: Path of the subpackage __init__.py
+        :return: List of plugin package names
+        '''
+        if not self.__cache:
+            return self.__parse_registered_plugins(init_path)
+
+        fingerprint = self.__cache.fingerprint(init_path)
+        names = self.__cache.get_tier(tier, fingerprint)
+        if names is None:
+            self.logger.debug("Discovery cache miss for '%s' subpackage", tier)
+            names = self.__parse_registered_plugins(init_path)
+            self.__cache.set_tier(tier, fingerprint, names)
+
+        return names
+
+
+    def __get_dependencies(self, tier, name, config_path):
+        '''
+        Gets the dependencies of a plugin, from the cache where it is up to date
+
+        :param tier: core or addon
+        :param name: The name of the plugin
+        :param config_path: Path of the plugin's Config.py
+        :return: Set of lowercase plugin names
+        '''
+        if not self.__cache:
+            return self.parse_dependencies(config_path)
+
+        fingerprint = self.__cache.fingerprint(config_path)
+        dependencies = self.__cache.get_dependencies(tier, name, fingerprint)
+        if dependencies is None:
+            self.logger.debug("Discovery cache miss for '%s'", name)
+            dependencies = self.parse_dependencies(config_path)
+            self.__cache.set_dependencies(tier, name, fingerprint, dependencies)
+
+        return dependencies
+
+
+    def __parse_registered_plugins(self, init_path):
+        '''
+        Parses the plugin packages imported by a subpackage __init__ (lines such as "from . import MyPlugin")
+
+        :param init_path: Path of the subpackage __init__.py
+        :return: List of plugin package names
+        '''
+        names = []
+
+        with open(init_path, "r") as init_file:
+            tree = ast.parse(init_file.read(), init_path)
+
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.level == 1 and not node.module:
+                names += [alias.name for alias in node.names]
+
+        return names
+
+
+    def parse_dependencies(self, config_path):
+        '''
+        Reads the DEPENDENCIES of a plugin Config.py. The file is parsed statically where DEPENDENCIES is a literal,
+        and only executed otherwise
+
+        :param config_path: Path of the plugin's Config.py
+        :return: Set of lowercase plugin names
+        '''
+        dependencies = []
+
+        if not os.path.isfile(config_path):
+            return set()
+
+        with open(config_path, "r") as config_file:
+            tree = ast.parse(config_file.read(), config_path)
+
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == "DEPENDENCIES" for target in node.targets
+            ):
+                try:
+                    dependencies = ast.literal_eval(node.value)
+                except ValueError:
+                    self.logger.debug("DEPENDENCIES in '%s' is not a literal. Executing config", config_path)
+                    dependencies = runpy.run_path(config_path).get("DEPENDENCIES", [])
+                    break
+
+        return set(dependency.lower() for dependency in dependencies)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_cache(self):
+        '''
+        Gets the discovery cache
+
+        :return: DiscoveryCache object, or None if caching is disabled
+        '''
+
+        return self.__cache
+
+
+    def get_root_path(self):
+        '''
+        Locates the root plugins package directory without importing it
+
+        :return: Directory path, or None if the package could not be found
+        '''
+        try:
+            spec = importlib.util.find_spec(self.__root_package)
+        except (ImportError, ValueError):
+            return None
+
+        if spec is None or not spec.submodule_search_locations:
+            return None
+
+        return list(spec.submodule_search_locations)[0]
@@ -0,0 +1,239 @@
+'''
+DiscoveryCache - Persists discovered plugin metadata and activation plans between runs
+'''
+
+# Import libs
+import hashlib
+import json
+import os
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class DiscoveryCache(Logger):
+    '''
+    On-disk cache of plugin discovery results, stored as JSON in the plugins home. Each cached entry is keyed by a
+    fingerprint of the file it was read from (mtime and size, or a content hash), so entries are invalidated
+    individually when their file changes. All cached activation plans are dropped whenever the metadata of any plugin
+    changes, as addon plans depend on which core plugins are available
+    '''
+
+    FILENAME = ".plugsy_cache.json"
+    FORMAT = 1
+
+    def __init__(self, plugins_home_path, hash_contents=False):
+        '''
+        Constructor
+
+        :param plugins_home_path: The plugins package directory, where the cache file is stored
+        :param hash_contents: Boolean specifying whether files should be fingerprinted by a hash of their contents
+            rather than by their mtime and size
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        self.__path = os.path.join(plugins_home_path, self.FILENAME)
+        self.__hash_contents = hash_contents
+        self.__dirty = False
+        self.__data = self.__empty()
+        self.load()
+
+
+    def __empty(self):
+        '''
+        Creates an empty cache structure
+
+        :return: Cache dict
+        '''
+
+        return {
+            "format": self.FORMAT,
+            "version": Config.VERSION,
+            "hash_contents": self.__hash_contents,
+            "tiers": {},
+            "plugins": {},
+            "plans": {}
+        }
+
+
+    def load(self):
+        '''
+        Loads the cache file. A missing, unreadable or incompatible cache file is treated as empty
+        '''
+        self.trace("ENTRY")
+
+        try:
+            with open(self.__path, "r") as cache_file:
+                data = json.load(cache_file)
+        except FileNotFoundError:
+            self.trace("EXIT - no cache file at '%s'", self.__path)
+            return
+        except (OSError, ValueError) as ex:
+            self.logger.warning("Ignoring unreadable discovery cache '%s': %s", self.__path, ex)
+            return
+
+        if (
+                not isinstance(data, dict) or data.get("format") != self.FORMAT or
+                data.get("version") != Config.VERSION or data.get("hash_contents") != self.__hash_contents
+        ):
+            self.logger.info("Discarding incompatible discovery cache '%s'", self.__path)
+            self.__dirty = True
+            return
+
+        self.__data = data
+        self.trace("EXIT")
+
+
+    def save(self):
+        '''
+        Writes the cache file if anything has changed since it was loaded
+        '''
+        self.trace("ENTRY")
+
+        if not self.__dirty:
+            self.trace("EXIT - cache unchanged")
+            return
+
+        # Write to a temporary file and swap it in, so concurrent readers never see a partial cache
+        temp_path = "%s.%s.tmp" % (self.__path, os.getpid())
+        try:
+            with open(temp_path, "w") as cache_file:
+                json.dump(self.__data, cache_file)
+            os.replace(temp_path, self.__path)
+            self.__dirty = False
+        except OSError as ex:
+            self.logger.warning("Could not write discovery cache '%s': %s", self.__path, ex)
+
+        self.trace("EXIT")
+
+
+    def clear(self):
+        '''
+        Empties the cache
+        '''
+
+        self.__data = self.__empty()
+        self.__dirty = True
+
+
+    def fingerprint(self, file_path):
+        '''
+        Fingerprints a file
+
+        :param file_path: Path of the file
+        :return: List of [mtime_ns, size], or [content hash] if hashing contents. None if the file doesn't exist
+        '''
+        try:
+            if self.__hash_contents:
+                with open(file_path, "rb") as hashed_file:
+                    return [hashlib.sha1(hashed_file.read()).hexdigest()]
+
+            stat = os.stat(file_path)
+            return [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            return None
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_tier(self, tier, fingerprint):
+        '''
+        Fetches the cached plugin names registered in a subpackage
+
+        :param tier: core or addon
+        :param fingerprint: Current fingerprint of the subpackage __init__
+        :return: List of plugin names, or None if not cached or stale
+        '''
+        entry = self.__data["tiers"].get(tier)
+
+        if entry is None or fingerprint is None or entry["fingerprint"] != fingerprint:
+            return None
+        return entry["plugins"]
+
+
+    def get_dependencies(self, tier, name, fingerprint):
+        '''
+        Fetches the cached dependencies of a plugin
+
+        :param tier: core or addon
+        :param name: The name of the plugin
+        :param fingerprint: Current fingerprint of the plugin's Config.py
+        :return: Set of lowercase plugin names, or None if not cached or stale
+        '''
+        entry = self.__data["plugins"].get("%s/%s" % (tier, name))
+
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return set(entry["dependencies"])
+
+
+    def get_plan(self, tier, key):
+        '''
+        Fetches a cached activation plan
+
+        :param tier: core or addon
+        :param key: Key describing the activation request the plan was computed for
+        :return: Tuple of (generations, skipped), where generations is a list of lowercase plugin name lists and
+            skipped is a list of plugin names left out of the plan. None if not cached
+        '''
+        entry = self.__data["plans"].get(tier, {}).get(key)
+
+        if entry is None:
+            return None
+        return entry["generations"], entry["skipped"]
+
+
+    # =======================
+    # = SETTERS
+    # =======================
+    def set_tier(self, tier, fingerprint, plugin_names):
+        '''
+        Caches the plugin names registered in a subpackage
+
+        :param tier: core or addon
+        :param fingerprint: Fingerprint of the subpackage __init__
+        :param plugin_names: List of plugin names
+        '''
+        previous = self.__data["tiers"].get(tier)
+
+        if previous is None or previous["plugins"] != plugin_names:
+            self.__data["plans"] = {}
+        self.__data["tiers"][tier] = {"fingerprint": fingerprint, "plugins": list(plugin_names)}
+        self.__dirty = True
+
+
+    def set_dependencies(self, tier, name, fingerprint, dependencies):
+        '''
+        Caches the dependencies of a plugin
+
+        :param tier: core or addon
+        :param name: The name of the plugin
+        :param fingerprint: Fingerprint of the plugin's Config.py
+        :param dependencies: Set of lowercase plugin names
+        '''
+        key = "%s/%s" % (tier, name)
+        previous = self.__data["plugins"].get(key)
+        dependencies = sorted(dependencies)
+
+        if previous is None or previous["dependencies"] != dependencies:
+            self.__data["plans"] = {}
+        self.__data["plugins"][key] = {"fingerprint": fingerprint, "dependencies": dependencies}
+        self.__dirty = True
+
+
+    def set_plan(self, tier, key, generations, skipped):
+        '''
+        Caches an activation plan
+
+        :param tier: core or addon
+        :param key: Key describing the activation request the plan was computed for
+        :param generations: List of lowercase plugin name lists, one per generation
+        :param skipped: List of lowercase plugin names left out of the plan
+        '''
+
+        self.__data["plans"].setdefault(tier, {})[key] = {
+            "generations": [list(generation) for generation in generations],
+            "skipped": sorted(skipped)
+        }
+        self.__dirty = True
@@ -0,0 +1,166 @@
+'''
+EventLoopRuntime - Shared asyncio event loops hosting async plugins
+'''
+
+# Import libs
+import asyncio
+from threading import Lock, Thread
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class EventLoopRuntime(Logger):
+    '''
+    Runs one or more asyncio event loops, each in its own thread, on which async plugins are scheduled as tasks.
+    Plugins are spread over the loops by assigning each to the loop currently hosting the fewest plugins
+    '''
+
+    DEFAULT_LOOPS = 1
+
+    def __init__(self, loops=DEFAULT_LOOPS):
+        '''
+        Constructor
+
+        :param loops: The number of event loops (and threads) to run
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(loops, int) or loops < 1:
+            raise ValueError("loops must be a positive integer")
+
+        self.__loop_count = loops
+        self.__lock = Lock()
+        self.__loops = []
+        self.__threads = []
+        self.__load = {}
+
+
+    def start(self):
+        '''
+        Starts the event loops
+        '''
+        self.trace("ENTRY")
+
+        with self.__lock:
+            if self.__loops:
+                self.trace("EXIT - already running")
+                return
+
+            for index in range(self.__loop_count):
+                loop = asyncio.new_event_loop()
+                thread = Thread(
+                    target=self.__run_loop, args=(loop,), name="plugsy-event-loop-%s" % index, daemon=True
+                )
+                self.__loops.append(loop)
+                self.__threads.append(thread)
+                self.__load[loop] = 0
+                thread.start()
+
+        self.logger.debug("Started %s event loops", self.__loop_count)
+        self.trace("EXIT")
+
+
+    def stop(self, timeout=None):
+        '''
+        Stops the event loops. Tasks still running on them are cancelled
+
+        :param timeout: Optional number of seconds to wait for each loop thread to finish
+        '''
+        self.trace("ENTRY")
+
+        with self.__lock:
+            loops, threads = self.__loops, self.__threads
+            self.__loops, self.__threads, self.__load = [], [], {}
+
+        for loop in loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in threads:
+            thread.join(timeout)
+
+        self.logger.debug("Stopped %s event loops", len(loops))
+        self.trace("EXIT")
+
+
+    def __run_loop(self, loop):
+        '''
+        Event loop thread target. Runs the loop until stopped, then cancels any remaining tasks and closes it
+
+        :param loop: The event loop to run
+        '''
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.logger.warning("Cancelling %s tasks still running on a stopped event loop", len(tasks))
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+    def acquire_loop(self):
+        '''
+        Assigns a loop to a plugin. Every acquired loop must be released once the plugin has stopped
+
+        :return: The event loop currently hosting the fewest plugins
+        :raise: RuntimeError if the runtime isn't running
+        '''
+
+        with self.__lock:
+            if not self.__loops:
+                raise RuntimeError("The event loop runtime is not running")
+
+            loop = min(self.__loops, key=self.__load.__getitem__)
+            self.__load[loop] += 1
+            return loop
+
+
+    def release_loop(self, loop):
+        '''
+        Releases a loop acquired for a plugin
+
+        :param loop: The event loop
+        '''
+
+        with self.__lock:
+            if loop in self.__load:
+                self.__load[loop] -= 1
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_loop_count(self):
+        '''
+        Gets the number of event loops
+
+        :return: Loop count
+        '''
+
+        return self.__loop_count
+
+
+    def get_load(self):
+        '''
+        Gets the number of plugins hosted on each loop
+
+        :return: List of plugin counts, one per loop
+        '''
+
+        with self.__lock:
+            return [self.__load[loop] for loop in self.__loops]
+
+
+    def is_running(self):
+        '''
+        Checks whether the event loops are running
+
+        :return: True if running, otherwise False
+        '''
+
+        return bool(self.__loops)
@@ -101,13 +101,16 @@ class PluginCircularDependency(Exception):
     To be raised in the event of plugin Circular Dependency
     '''
 
-    def __init__(self):
+    def __init__(self, cycle=None):
         '''
         Constructor
 
-        :param message: Exception message
+        :param cycle: Optional list of plugin names forming the cycle, starting and ending with the same plugin
         '''
+        self.cycle = list(cycle) if cycle else []
         self.message = "Circular Dependency error encountered whilst loading plugins"
+        if self.cycle:
+            self.message += ": %s" % " -> ".join(self.cycle)
         super(PluginCircularDependency, self).__init__(self.message)
 
 
@@ -235,3 +238,31 @@ class SubpackageImportError(Exception):
         Exception.__init__(self, message)
 
 
+#################################################
+# PluginNotReady
+#################################################
+class PluginNotReady(Exception):
+    '''
+    To be raised if an activated plugin does not report ready within the activation timeout
+    '''
+
+    def __init__(self, plugin, timeout, failure=None):
+        '''
+        Constructor
+
+        :param plugin: The plugin object that did not report ready
+        :param timeout: The number of seconds waited
+        :param failure: Optional exception the plugin's run ended with before it reported ready
+        '''
+        if failure is not None:
+            self.message = "plugin '%s' failed before reporting ready: %s" % (plugin.get_name(), failure)
+        else:
+            self.message = "plugin '%s' did not report ready within %s seconds" % (plugin.get_name(), timeout)
+        self.failure = failure
+        super(PluginNotReady, self).__init__(self.message)
+
+
+    def __str__(self):
+        return self.message
+
+
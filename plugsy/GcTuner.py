@@ -0,0 +1,174 @@
+'''
+GcTuner - Freezes the long-lived startup heap and tunes the garbage collector
+'''
+
+# Import libs
+import gc
+import time
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class GcTuner(Logger):
+    '''
+    Moves every object alive once plugins have been activated (imported modules, plugin objects, loggers) into the
+    collector's permanent generation with gc.freeze(), so full collections stop rescanning them and forked processes
+    stop dirtying their pages. Optionally applies generation thresholds. The pauses of every collection are timed
+    through gc.callbacks, separately for collections before and after the first freeze, so the effect can be compared
+    '''
+
+    GENERATIONS = 3
+
+    def __init__(self, freeze=True, thresholds=None):
+        '''
+        Constructor
+
+        :param freeze: Boolean specifying whether tune() should freeze the heap
+        :param thresholds: Optional tuple of up to three generation thresholds, as taken by gc.set_threshold
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if thresholds is not None and not 1 <= len(thresholds) <= self.GENERATIONS:
+            raise ValueError("thresholds must hold between 1 and %s generation thresholds" % self.GENERATIONS)
+
+        self.__freeze = freeze
+        self.__thresholds = tuple(thresholds) if thresholds is not None else None
+        self.__started = None
+        self.__frozen = 0
+        self.__before = self.empty_pauses()
+        self.__after = None
+        self.__pauses = self.__before
+
+
+    def start(self):
+        '''
+        Starts timing collection pauses. Does nothing if already timing them
+        '''
+
+        if self.__on_collection not in gc.callbacks:
+            gc.callbacks.append(self.__on_collection)
+
+
+    def stop(self):
+        '''
+        Stops timing collection pauses, removing the gc callback. Called once all plugins are deactivated
+        '''
+
+        if self.__on_collection in gc.callbacks:
+            gc.callbacks.remove(self.__on_collection)
+
+
+    def tune(self):
+        '''
+        Collects garbage, so none of it is frozen, then freezes the heap and applies the thresholds. Can be called
+        again to freeze objects created since
+        '''
+        self.trace("ENTRY")
+
+        if self.__freeze:
+            gc.collect()
+            frozen = gc.get_freeze_count()
+            gc.freeze()
+            frozen = gc.get_freeze_count() - frozen
+
+            self.__frozen = gc.get_freeze_count()
+            if self.__after is None:
+                self.__after = self.__pauses = self.empty_pauses()
+            self.logger.info("Froze %s objects (%s in total)", frozen, gc.get_freeze_count())
+
+        if self.__thresholds is not None:
+            gc.set_threshold(*self.__thresholds)
+            self.logger.info("Set collection thresholds to %s", gc.get_threshold())
+
+        self.trace("EXIT")
+
+
+    def unfreeze(self):
+        '''
+        Moves the frozen objects back into the oldest generation, so they can be collected again
+        '''
+
+        gc.unfreeze()
+        self.__frozen = 0
+        self.logger.debug("Unfroze the heap")
+
+
+    def refreeze(self):
+        '''
+        Freezes the heap again after it was unfrozen, such as to collect garbage, without collecting first or applying
+        the thresholds
+        '''
+
+        gc.freeze()
+        self.__frozen = gc.get_freeze_count()
+        self.logger.debug("Refroze %s objects", self.__frozen)
+
+
+    def __on_collection(self, phase, info):
+        '''
+        gc callback. Times each collection. Collections never run concurrently, and locking here could deadlock a
+        thread that triggers one while holding the lock, so the statistics are updated without locking
+
+        :param phase: "start" or "stop"
+        :param info: Dict holding the generation being collected
+        '''
+
+        if phase == "start":
+            self.__started = time.perf_counter()
+        elif self.__started is not None:
+            pause = time.perf_counter() - self.__started
+            self.__started = None
+            generation = self.__pauses[info["generation"]]
+            generation["collections"] += 1
+            generation["total"] += pause
+            if pause > generation["max"]:
+                generation["max"] = pause
+
+
+    @staticmethod
+    def __summarise(pauses):
+        '''
+        Copies pause statistics, adding the mean pause of each generation
+
+        :param pauses: List of per generation pause statistics, or None
+        :return: List of dicts of collections, total, mean and max pause seconds, or None
+        '''
+
+        if pauses is None:
+            return None
+        return [
+            dict(generation, mean=generation["total"] / generation["collections"] if generation["collections"] else 0.0)
+            for generation in pauses
+        ]
+
+
+    @classmethod
+    def empty_pauses(cls):
+        '''
+        Creates empty pause statistics
+
+        :return: List of dicts of collections, total and max pause seconds, one per generation
+        '''
+
+        return [{"collections": 0, "total": 0.0, "max": 0.0} for _ in range(cls.GENERATIONS)]
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_report(self):
+        '''
+        Gets the objects frozen, the collection thresholds and the collection pauses before and after the first
+        freeze
+
+        :return: Dict of frozen (objects currently frozen), thresholds, and before and after lists of per generation
+            dicts of collections, total, mean and max pause seconds. after is None until the heap has been frozen
+        '''
+
+        return {
+            "frozen": self.__frozen,
+            "thresholds": gc.get_threshold(),
+            "before": self.__summarise(self.__before),
+            "after": self.__summarise(self.__after)
+        }
@@ -0,0 +1,467 @@
+'''
+MessageBus - Topic based publish/subscribe messaging between plugins
+'''
+
+# Import libs
+import time
+from collections import deque
+from threading import Condition, Lock
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class MessageBus(Logger):
+    '''
+    Delivers messages published on a topic to every subscription to that topic. Each subscription has its own bounded
+    queue and overflow policy, so a slow subscriber only ever holds up (block) or loses messages for (drop,
+    drop_oldest) itself. Publishing and receiving are thread safe, and batches are queued and dequeued under a single
+    lock acquisition per subscription
+    '''
+
+    BLOCK = "block"
+    DROP = "drop"
+    DROP_OLDEST = "drop_oldest"
+    OVERFLOW_POLICIES = [BLOCK, DROP, DROP_OLDEST]
+
+    DEFAULT_QUEUE_SIZE = 1000
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        self.__lock = Lock()
+        # Topic subscriptions are replaced rather than mutated, so publishers can read them without locking
+        self.__topics = {}
+        self.__published = {}
+        # Statistics of removed subscriptions, by topic
+        self.__retired = {}
+        self.__started = time.monotonic()
+
+
+    def subscribe(self, topic, max_size=DEFAULT_QUEUE_SIZE, overflow_policy=BLOCK, notify=None, owner=None):
+        '''
+        Subscribes to a topic
+
+        :param topic: The topic name
+        :param max_size: Maximum number of messages queued for the subscription
+        :param overflow_policy: What publishers do when the queue is full. block waits for room (up to the publish
+            timeout), drop discards the new message and drop_oldest discards the oldest queued message
+        :param notify: Optional callable invoked after messages are queued, such as a plugin's wake()
+        :param owner: Optional name of the plugin owning the subscription, so it can be removed with
+            unsubscribe_owner() once the plugin stops
+        :return: Subscription
+        '''
+
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy '%s'. Expected one of %s" % (
+                overflow_policy, self.OVERFLOW_POLICIES
+            ))
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        subscription = Subscription(self, topic, max_size, overflow_policy, notify, owner)
+        with self.__lock:
+            self.__topics[topic] = self.__topics.get(topic, ()) + (subscription,)
+
+        self.logger.debug("New '%s' subscription to '%s'", overflow_policy, topic)
+        return subscription
+
+
+    def unsubscribe(self, subscription):
+        '''
+        Removes a subscription. Publishers blocked on it are released
+
+        :param subscription: The Subscription to remove
+        '''
+
+        with self.__lock:
+            subscriptions = tuple(
+                existing for existing in self.__topics.get(subscription.get_topic(), ()) if existing is not subscription
+            )
+            if subscriptions:
+                self.__topics[subscription.get_topic()] = subscriptions
+            else:
+                self.__topics.pop(subscription.get_topic(), None)
+
+            if not subscription.is_closed():
+                retired = self.__retired.setdefault(subscription.get_topic(), Subscription.empty_stats())
+                Subscription.merge_stats(retired, subscription.get_stats())
+
+        subscription.close()
+        self.logger.debug("Removed subscription to '%s'", subscription.get_topic())
+
+
+    def unsubscribe_owner(self, owner):
+        '''
+        Removes every subscription owned by a plugin. Publishers blocked on them are released
+
+        :param owner: The plugin name
+        :return: The number of subscriptions removed
+        '''
+        owner = owner.lower()
+
+        with self.__lock:
+            subscriptions = [
+                subscription for topic in self.__topics.values() for subscription in topic
+                if subscription.get_owner() is not None and subscription.get_owner().lower() == owner
+            ]
+
+        for subscription in subscriptions:
+            self.unsubscribe(subscription)
+        return len(subscriptions)
+
+
+    def publish(self, topic, message, timeout=None):
+        '''
+        Publishes a message to every subscription to a topic
+
+        :param topic: The topic name
+        :param message: The message. Delivered by reference, so it shouldn't be mutated once published
+        :param timeout: Optional number of seconds to wait for room in block subscriptions. Waits indefinitely if None
+        :return: The number of subscriptions the message was queued for
+        '''
+
+        return self.publish_batch(topic, [message], timeout)
+
+
+    def publish_batch(self, topic, messages, timeout=None):
+        '''
+        Publishes a batch of messages to every subscription to a topic, preserving their order
+
+        :param topic: The topic name
+        :param messages: List of messages
+        :param timeout: Optional number of seconds to wait for room in block subscriptions. Waits indefinitely if None
+        :return: The number of subscriptions all messages were queued for
+        '''
+        subscriptions = self.__topics.get(topic, ())
+        published = time.monotonic()
+        delivered = 0
+
+        for subscription in subscriptions:
+            if subscription.put(messages, published, timeout):
+                delivered += 1
+
+        with self.__lock:
+            self.__published[topic] = self.__published.get(topic, 0) + len(messages)
+
+        return delivered
+
+
+    def reset_stats(self):
+        '''
+        Resets the statistics of the bus and of every subscription
+        '''
+
+        with self.__lock:
+            self.__published = {}
+            self.__retired = {}
+            self.__started = time.monotonic()
+            subscriptions = [subscription for topic in self.__topics.values() for subscription in topic]
+
+        for subscription in subscriptions:
+            subscription.reset_stats()
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_topics(self):
+        '''
+        Gets the topics with at least one subscription
+
+        :return: List of topic names
+        '''
+
+        return list(self.__topics)
+
+
+    def get_subscriptions(self, topic):
+        '''
+        Gets the subscriptions to a topic
+
+        :param topic: The topic name
+        :return: List of Subscriptions
+        '''
+
+        return list(self.__topics.get(topic, ()))
+
+
+    def get_stats(self, topic=None):
+        '''
+        Gets the message statistics since the bus was created or its statistics were reset
+
+        :param topic: Optional topic to restrict the statistics to. Includes every topic if None
+        :return: Dict of published, queued, dropped and received message counts, received messages per second and
+            mean and max latency in seconds (from publish to receive)
+        '''
+
+        with self.__lock:
+            elapsed = time.monotonic() - self.__started
+            published = sum(count for name, count in self.__published.items() if topic is None or name == topic)
+            stats = Subscription.empty_stats()
+            for name, retired in self.__retired.items():
+                if topic is None or name == topic:
+                    Subscription.merge_stats(stats, retired)
+            subscriptions = [
+                subscription for name, subscriptions in self.__topics.items() if topic is None or name == topic
+                for subscription in subscriptions
+            ]
+
+        for subscription in subscriptions:
+            Subscription.merge_stats(stats, subscription.get_stats())
+
+        return {
+            "published": published,
+            "queued": stats["queued"],
+            "dropped": stats["dropped"],
+            "received": stats["received"],
+            "messages_per_second": stats["received"] / elapsed if elapsed else 0.0,
+            "mean_latency": stats["total_latency"] / stats["received"] if stats["received"] else None,
+            "max_latency": stats["max_latency"]
+        }
+
+
+# ==========================
+# = Subscription Class
+# ==========================
+class Subscription():
+    '''
+    A single subscriber's bounded queue of messages on one topic
+    '''
+
+    def __init__(self, bus, topic, max_size, overflow_policy, notify=None, owner=None):
+        '''
+        Constructor
+
+        :param bus: The MessageBus subscribed to
+        :param topic: The topic name
+        :param max_size: Maximum number of queued messages
+        :param overflow_policy: One of MessageBus.OVERFLOW_POLICIES
+        :param notify: Optional callable invoked after messages are queued
+        :param owner: Optional name of the plugin owning the subscription
+        '''
+        self.__bus = bus
+        self.__topic = topic
+        self.__owner = owner
+        self.__max_size = max_size
+        self.__overflow_policy = overflow_policy
+        self.__notify = notify
+        self.__queue = deque()
+        self.__condition = Condition()
+        self.__closed = False
+        self.__stats = self.empty_stats()
+
+
+    def __repr__(self):
+        return "<Subscription %s %s depth=%s>" % (self.__topic, self.__overflow_policy, len(self.__queue))
+
+
+    def put(self, messages, published, timeout=None):
+        '''
+        Queues messages, applying the overflow policy. Called by the bus
+
+        :param messages: List of messages
+        :param published: Monotonic time the messages were published
+        :param timeout: Optional number of seconds to wait for room under the block policy
+        :return: True if every message was queued, otherwise False
+        '''
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        queued = 0
+
+        with self.__condition:
+            for message in messages:
+                if self.__closed:
+                    break
+
+                if len(self.__queue) >= self.__max_size:
+                    if self.__overflow_policy == MessageBus.DROP:
+                        continue
+                    elif self.__overflow_policy == MessageBus.DROP_OLDEST:
+                        self.__queue.popleft()
+                        self.__stats["dropped"] += 1
+                    else:
+                        # Let the subscriber drain what's already been queued while waiting for room
+                        self.__condition.notify_all()
+                        while len(self.__queue) >= self.__max_size and not self.__closed:
+                            remaining = deadline - time.monotonic() if deadline is not None else None
+                            if remaining is not None and remaining <= 0:
+                                break
+                            self.__condition.wait(remaining)
+                        if len(self.__queue) >= self.__max_size or self.__closed:
+                            continue
+
+                self.__queue.append((published, message))
+                queued += 1
+
+            self.__stats["queued"] += queued
+            self.__stats["dropped"] += len(messages) - queued
+            if queued:
+                self.__condition.notify_all()
+
+        if queued and self.__notify is not None:
+            self.__notify()
+        return queued == len(messages)
+
+
+    def receive(self, timeout=None):
+        '''
+        Receives the oldest queued message
+
+        :param timeout: Optional number of seconds to wait for a message. Waits indefinitely if None
+        :return: The message
+        :raise: TimeoutError if no message was received within the timeout
+        '''
+        messages = self.receive_batch(1, timeout)
+
+        if not messages:
+            raise TimeoutError("No message received on '%s' within %ss" % (self.__topic, timeout))
+        return messages[0]
+
+
+    def receive_batch(self, max_count=None, timeout=None):
+        '''
+        Receives up to max_count queued messages, waiting for at least one
+
+        :param max_count: Optional maximum number of messages to receive. Receives every queued message if None
+        :param timeout: Optional number of seconds to wait for a message. Waits indefinitely if None. 0 doesn't wait
+        :return: List of messages, oldest first. Empty if the timeout passed or the subscription was closed
+        '''
+
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__queue or self.__closed, timeout):
+                return []
+
+            count = len(self.__queue) if max_count is None else min(max_count, len(self.__queue))
+            entries = [self.__queue.popleft() for _ in range(count)]
+            if entries:
+                self.__condition.notify_all()
+
+            now = time.monotonic()
+            for published, _ in entries:
+                latency = now - published
+                self.__stats["total_latency"] += latency
+                if latency > self.__stats["max_latency"]:
+                    self.__stats["max_latency"] = latency
+            self.__stats["received"] += count
+
+        return [message for _, message in entries]
+
+
+    def close(self):
+        '''
+        Closes the subscription. Queued messages can still be received, but no more are queued and blocked publishers
+        and receivers are released
+        '''
+
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+
+    def unsubscribe(self):
+        '''
+        Removes the subscription from its bus
+        '''
+
+        self.__bus.unsubscribe(self)
+
+
+    def reset_stats(self):
+        '''
+        Resets the subscription statistics
+        '''
+
+        with self.__condition:
+            self.__stats = self.empty_stats()
+
+
+    @staticmethod
+    def empty_stats():
+        '''
+        Creates an empty statistics dict
+
+        :return: Dict of queued, dropped, received, total_latency and max_latency
+        '''
+
+        return {"queued": 0, "dropped": 0, "received": 0, "total_latency": 0.0, "max_latency": 0.0}
+
+
+    @staticmethod
+    def merge_stats(stats, other):
+        '''
+        Adds one statistics dict into another
+
+        :param stats: The statistics dict to add to
+        :param other: The statistics dict to add
+        '''
+
+        for key in ["queued", "dropped", "received", "total_latency"]:
+            stats[key] += other[key]
+        stats["max_latency"] = max(stats["max_latency"], other["max_latency"])
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_topic(self):
+        '''
+        Gets the topic subscribed to
+
+        :return: Topic name
+        '''
+
+        return self.__topic
+
+
+    def get_owner(self):
+        '''
+        Gets the name of the plugin owning the subscription
+
+        :return: Plugin name, or None if not owned by a plugin
+        '''
+
+        return self.__owner
+
+
+    def get_overflow_policy(self):
+        '''
+        Gets the overflow policy
+
+        :return: Policy name
+        '''
+
+        return self.__overflow_policy
+
+
+    def get_depth(self):
+        '''
+        Gets the number of queued messages
+
+        :return: Queue depth
+        '''
+
+        return len(self.__queue)
+
+
+    def get_stats(self):
+        '''
+        Gets the subscription statistics
+
+        :return: Dict of queued, dropped, received, total_latency and max_latency
+        '''
+
+        with self.__condition:
+            return dict(self.__stats)
+
+
+    def is_closed(self):
+        '''
+        Checks whether the subscription has been closed
+
+        :return: True if closed, otherwise False
+        '''
+
+        return self.__closed
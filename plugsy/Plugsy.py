@@ -3,16 +3,32 @@ Plugsy - Plugin System
 '''
 
 # Import standard libs
+import gc
 import importlib
 import pkgutil
 import sys
 import time
 import inspect
+import weakref
+from threading import Lock
 from plugsy.utils import *
 
 # Import project libs
 from . import Config
 from .Exceptions import *
+from .Activator import Activator
+from .Registry import Registry
+from .Discovery import Discovery
+from .DiscoveryCache import DiscoveryCache
+from .EventLoopRuntime import EventLoopRuntime
+from .GcTuner import GcTuner
+from .MessageBus import MessageBus
+from .ProcessPlugin import ProcessPluginProxy
+from .SharedChannel import SharedChannel
+from .ShutdownReport import ShutdownReport
+from .StartupReport import StartupReport
+from .Supervisor import Supervisor
+from .TaskScheduler import TaskScheduler
 
 ####################################
 # PlugSy Plugin Manager
@@ -23,7 +39,11 @@ class Plugsy(Logger):
     ADDON_DIR = "addon"
     CORE_DIR = "core"
 
-    def __init__(self, safe_mode=False, debug_level="", debug_log_path=""):
+    def __init__(self, safe_mode=False, debug_level="", debug_log_path="",
+                 max_activation_workers=Activator.DEFAULT_MAX_WORKERS, activation_timeout=None,
+                 lazy_discovery=False, discovery_cache=False, timings_path="", log_queue_size=0,
+                 log_overflow_policy=LogPipeline.DROP, async_loops=EventLoopRuntime.DEFAULT_LOOPS,
+                 max_task_workers=TaskScheduler.DEFAULT_MAX_WORKERS, gc_freeze=False, gc_thresholds=None):
         '''
         Constructor
 
@@ -31,72 +51,223 @@ class Plugsy(Logger):
             core plugins will be loaded
         :param debug_level: Level of debug. Should be one or INFO, DEBUG, WARNING or ERROR
         :param debug_log_path: Optional peth to a debug log file. WIll be created and used for logging if specified
+        :param max_activation_workers: Maximum number of plugins within a dependency generation to activate
+            concurrently
+        :param activation_timeout: Optional number of seconds to wait for each plugin to report ready before
+            activating the next generation
+        :param lazy_discovery: Boolean specifying whether plugins should be discovered statically, importing only
+            the plugins being loaded. The plugins package and subpackage __init__ files are not executed in this mode
+        :param discovery_cache: Boolean specifying whether discovered plugin metadata and activation plans should be
+            cached in the plugins home, so warm starts skip discovery and sorting. Implies lazy_discovery
+        :param timings_path: Optional path of a JSON file. The StartupReport of each activation is written to it
+        :param log_queue_size: Optional maximum number of queued log records. If set, plugin threads queue their log
+            records for a background listener instead of writing them to the console and log file themselves
+        :param log_overflow_policy: What to do with log records when the queue is full. One of drop, block or sample
+        :param async_loops: The number of event loops async plugins are spread over. The loops are only started
+            once an async plugin is activated
+        :param max_task_workers: Maximum number of task plugin ticks executed concurrently. The shared thread pool
+            is only started once a task plugin is activated
+        :param gc_freeze: Boolean specifying whether the heap should be frozen with gc.freeze() once plugins have
+            been activated (or preloaded), so the long-lived objects created at startup are no longer scanned by
+            collections and stay shared with forked processes
+        :param gc_thresholds: Optional tuple of generation thresholds applied with gc.set_threshold() once plugins
+            have been activated (or preloaded)
         '''
         Logger.__init__(
             self,
             name=Config.FULL_NAME,
-            level=debug_level, log_path=debug_log_path
+            level=debug_level, log_path=debug_log_path,
+            queue_size=log_queue_size, overflow_policy=log_overflow_policy
         )
-        self.__plugins = []
+        self.__registry = Registry()
         self.__safe_mode = safe_mode
+        self.__activator = Activator(max_workers=max_activation_workers, ready_timeout=activation_timeout)
+        self.__discovery = None
+        self.__discovery_cache = discovery_cache
+        if lazy_discovery or discovery_cache:
+            self.__discovery = Discovery(self.ROOT_PLUGIN_PACKAGE)
+        self.__timings_path = timings_path
+        self.__startup_report = StartupReport()
+        self.__async_loops = async_loops
+        self.__async_runtime = None
+        self.__runtime_lock = Lock()
+        self.__max_task_workers = max_task_workers
+        self.__task_scheduler = None
+        self.__message_bus = MessageBus()
+        self.__supervisor = Supervisor(
+            restart=self.__restart_failed_plugin, disable=self.__disable_failed_plugin,
+            ready_timeout=activation_timeout if activation_timeout is not None else Supervisor.DEFAULT_READY_TIMEOUT
+        )
+        self.__channels = {}
+        self.__preloaded = None
+        # Plugin names to (<plugin_name>, <package name>), and weak references to modules not collected after reloads
+        self.__plugin_packages = {}
+        self.__leaked_modules = []
+        self.__gc_tuner = None
+        if gc_freeze or gc_thresholds:
+            self.__gc_tuner = GcTuner(freeze=gc_freeze, thresholds=gc_thresholds)
+            self.__gc_tuner.start()
+
+
+    def activate_plugins(self, plugin_names=[], ignore_addon_dep_failures=False, resolve_dependencies=False):
+        '''
+        Activates Plugsy plugins. If plugins have been preloaded with preload_plugins, the preloaded plugins are
+        activated instead, and the arguments are ignored
+
+        :param plugin_names: Optional list of specific plugins to activate
+        :param ignore_addon_dep_failures: Boolean specifying whether dependency failures should be ignored or raised
+            when loading Addon plugins
+        :param resolve_dependencies: Boolean specifying whether the transitive dependencies of plugin_names, across
+            the core and addon packages, should be activated too. Only that subgraph is loaded and activated
+        :return: StartupReport of the time spent in each startup phase
+        '''
+
+        if self.__gc_tuner:
+            self.__gc_tuner.start()
+        if self.__preloaded is not None:
+            return self.__activate_preloaded_plugins()
+        return self.__load_and_activate_plugins(
+            plugin_names, ignore_addon_dep_failures, resolve_dependencies, activate=True
+        )
 
 
-    def activate_plugins(self, plugin_names=[], ignore_addon_dep_failures=False):
+    def preload_plugins(self, plugin_names=[], ignore_addon_dep_failures=False, resolve_dependencies=False):
         '''
-        Activates Plugsy plugins
+        Imports, instantiates and configures plugins and sorts them by dependencies, without activating them. The
+        next activate_plugins call activates them. Nothing is started, so a process can preload plugins once and
+        fork workers that share the loaded modules copy-on-write and only activate them (see PreforkServer)
 
-        :param plugin_names: Optional list of specific plugins to activate
+        :param plugin_names: Optional list of specific plugins to preload
         :param ignore_addon_dep_failures: Boolean specifying whether dependency failures should be ignored or raised
             when loading Addon plugins
+        :param resolve_dependencies: Boolean specifying whether the transitive dependencies of plugin_names should be
+            preloaded too
+        :return: StartupReport of the time spent in each loading phase
+        :raise: RuntimeError if plugins have already been preloaded
         '''
-        self.logger.debug("ENTRY")
+
+        if self.__preloaded is not None:
+            raise RuntimeError("Plugins have already been preloaded")
+        if self.__gc_tuner:
+            self.__gc_tuner.start()
+        return self.__load_and_activate_plugins(
+            plugin_names, ignore_addon_dep_failures, resolve_dependencies, activate=False
+        )
+
+
+    def __activate_preloaded_plugins(self):
+        '''
+        Activates the plugins loaded by preload_plugins, in the preloaded activation plan
+
+        :return: StartupReport of the time spent activating each plugin
+        '''
+        self.trace("ENTRY")
+        started = time.perf_counter()
+        self.__startup_report = report = StartupReport()
+        core_generations, addon_generations, loaded_plugins = self.__preloaded
+        self.__preloaded = None
+
+        self.logger.debug("Activating preloaded core plugins")
+        self.__activator.activate(core_generations, report=report)
+        self.logger.debug("Activating preloaded addon plugins")
+        try:
+            self.__activator.activate(addon_generations, report=report)
+        except Exception:
+            self.__activator.abort(core_generations)
+            raise
+        self.__set_plugins(loaded_plugins)
+
+        if self.__gc_tuner:
+            with report.measure(StartupReport.GC_FREEZE):
+                self.__gc_tuner.tune()
+
+        report.set_elapsed(time.perf_counter() - started)
+        if self.__timings_path:
+            report.dump(self.__timings_path)
+
+        self.trace("EXIT with %s", report)
+        return report
+
+
+    def __load_and_activate_plugins(self, plugin_names, ignore_addon_dep_failures, resolve_dependencies, activate):
+        '''
+        Loads plugins and sorts them by dependencies, then activates them or keeps them preloaded
+
+        :param plugin_names: List of specific plugins to load
+        :param ignore_addon_dep_failures: Boolean specifying whether dependency failures should be ignored or raised
+            when loading Addon plugins
+        :param resolve_dependencies: Boolean specifying whether the transitive dependencies of plugin_names should be
+            loaded too
+        :param activate: Boolean specifying whether the plugins should be activated, or kept for a later
+            activate_plugins call
+        :return: StartupReport of the time spent in each startup phase
+        '''
+        self.trace("ENTRY")
         loaded_plugins = []
-        self.logger.debug("Ignoring Addon dependency failures: %s" % ignore_addon_dep_failures)
+        started = time.perf_counter()
+        self.__startup_report = report = StartupReport()
+        self.logger.debug("Ignoring Addon dependency failures: %s", ignore_addon_dep_failures)
 
         # Check plugin_names is correct type
         if not isinstance(plugin_names, list):
             self.logger.error(
-                "Expected plugin_names arg to be list, but got %s" %
-                type(plugin_names)
+                "Expected plugin_names arg to be list, but got %s", type(plugin_names)
             )
             raise TypeError("plugin_names argument must be list")
 
+        requested_names = set(plugin_name.lower() for plugin_name in plugin_names)
         if plugin_names:
-            self.logger.debug("plugin names specified. Trying to load '%s'")
+            self.logger.debug("plugin names specified. Trying to load '%s'", plugin_names)
         else:
             self.logger.debug("plugin names not specified. Activating all plugins")
 
         # Check for plugins package
-        try:
-            import plugins
-            self.logger.debug("plugins directory imported successfully")
-        except ImportError:
-            self.logger.critical("Plugins directory not found. There are no plugins to activate")
-            return
+        if self.__discovery:
+            plugins_home_path = self.__discovery.get_root_path()
+            if plugins_home_path is None:
+                self.logger.critical("Plugins directory not found. There are no plugins to activate")
+                return report
+            self.logger.debug("plugins directory found")
+
+            # Cache lives in the plugins home, which is only known once the package has been found
+            if self.__discovery_cache and not self.__discovery.get_cache():
+                self.__discovery = Discovery(self.ROOT_PLUGIN_PACKAGE, cache=DiscoveryCache(plugins_home_path))
+        else:
+            try:
+                with report.measure(StartupReport.PACKAGE_IMPORT):
+                    import plugins
+                self.logger.debug("plugins directory imported successfully")
+            except ImportError:
+                self.logger.critical("Plugins directory not found. There are no plugins to activate")
+                return report
+
+        # Expand the requested plugins to their dependency closure
+        if requested_names and resolve_dependencies:
+            requested_names = self.__resolve_dependencies(requested_names)
+            self.logger.debug("Resolved plugin names to '%s'", requested_names)
 
         # CORE - Start
         # --------------------------------------
         # Load core plugins
         self.logger.debug(" Loading core plugins")
-        core_plugins = self.__sort_by_dependencies(
-            self.__load_plugins(
-                subpackage=".".join([self.ROOT_PLUGIN_PACKAGE, self.CORE_DIR]),
-                plugin_names=[plugin_name.lower() for plugin_name in plugin_names]
-            ),
-            False,
-            loaded_plugins
+        core_plugins = self.__load_plugins(
+            subpackage=".".join([self.ROOT_PLUGIN_PACKAGE, self.CORE_DIR]),
+            plugin_names=requested_names
         )
+        with report.measure(StartupReport.SORT):
+            core_plugins, core_generations = self.__get_activation_plan(
+                core_plugins, False, loaded_plugins, requested_names
+            )
 
         if core_plugins:
-            self.logger.info("%s Core plugins imported successfully" % len(core_plugins))
+            self.logger.info("%s Core plugins imported successfully", len(core_plugins))
         else:
             self.logger.info("No core plugins were found")
 
         # Activate core plugins
-        self.logger.debug("Activating core plugins")
-        for plugin in core_plugins:
-            self.logger.debug(" Activating '%s'" % plugin.get_name())
-            plugin.activate()
+        if activate:
+            self.logger.debug("Activating core plugins")
+            self.__activator.activate(core_generations, report=report)
         loaded_plugins += core_plugins
         self.logger.debug("Finished loading core plugins")
         # CORE - End
@@ -104,143 +275,561 @@ class Plugsy(Logger):
 
         # ADDON - Start
         # --------------------------------------
-        # Load and activate addon plugins
-        self.logger.debug("Activating addon plugins")
-        addon_plugins = self.__sort_by_dependencies(
-            self.__load_plugins(
+        # Addon failures must not leave the core plugins activated above running unregistered
+        try:
+            # Load and activate addon plugins
+            self.logger.debug("Activating addon plugins")
+            addon_plugins = self.__load_plugins(
                 subpackage=".".join([self.ROOT_PLUGIN_PACKAGE, self.ADDON_DIR]),
-                plugin_names=[plugin_name.lower() for plugin_name in plugin_names]
-            ),
-            ignore_addon_dep_failures,
-            loaded_plugins
-        )
+                plugin_names=requested_names
+            )
+            with report.measure(StartupReport.SORT):
+                addon_plugins, addon_generations = self.__get_activation_plan(
+                    addon_plugins, ignore_addon_dep_failures, loaded_plugins, requested_names
+                )
 
-        if addon_plugins:
-            self.logger.info("%s Addon plugins imported successfully" % len(addon_plugins))
-        else:
-            self.logger.info("No Addon plugins were found")
-
-        # Activate addon plugins
-        self.logger.debug("Activating addon plugins")
-        for plugin in addon_plugins:
-            self.logger.debug("Activating '%s'" % plugin.get_name())
-            plugin.activate()
-        loaded_plugins += addon_plugins
-        self.logger.debug("Finished activating core plugins")
+            if addon_plugins:
+                self.logger.info("%s Addon plugins imported successfully", len(addon_plugins))
+            else:
+                self.logger.info("No Addon plugins were found")
+
+            # Activate addon plugins
+            if activate:
+                self.logger.debug("Activating addon plugins")
+                self.__activator.activate(addon_generations, report=report)
+            loaded_plugins += addon_plugins
+            self.logger.debug("Finished activating core plugins")
+        except Exception:
+            if activate:
+                self.__activator.abort(core_generations)
+            raise
         # ADDON - End
         # --------------------------------------
 
-        # Set Plugsy plugins
-        self.__set_plugins(loaded_plugins)
+        # Set Plugsy plugins, or keep them until they're activated
+        if activate:
+            self.__set_plugins(loaded_plugins)
+        else:
+            self.__preloaded = (core_generations, addon_generations, loaded_plugins)
+
+        if self.__discovery and self.__discovery.get_cache():
+            self.__discovery.get_cache().save()
+
+        if self.__gc_tuner:
+            with report.measure(StartupReport.GC_FREEZE):
+                self.__gc_tuner.tune()
 
-        self.logger.debug("EXIT")
+        report.set_elapsed(time.perf_counter() - started)
+        if self.__timings_path:
+            report.dump(self.__timings_path)
 
+        self.trace("EXIT with %s", report)
+        return report
 
-    def deactivate_plugins(self, plugin_names=[]):
+
+    def deactivate_plugins(self, plugin_names=[], cascade=False, timeout=None, plugin_timeouts=None):
         '''
-        Deactivates all plugins, or a specific plugin
+        Deactivates all plugins, or a specific plugin, and waits for them to stop. Plugins that don't stop within
+        their timeout are left running and remain in PlugSy's plugins
 
         :param plugin_names: Optional list of plugin names to deactivate
+        :param cascade: Boolean specifying whether plugins depending on plugin_names should be deactivated too,
+            rather than raising DependentRunning. As addon plugins may not run without the core plugins, deactivating
+            a core plugin this way also deactivates every addon plugin
+        :param timeout: Optional number of seconds the whole deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding the SHUTDOWN_TIMEOUT of
+            individual plugins
+        :return: ShutdownReport of the plugins stopped, how long each took and which overran
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
+        report = ShutdownReport()
 
         # Check plugin_names is correct type
         if not isinstance(plugin_names, list):
             self.logger.error(
-                "Expected plugin_names arg to be list, but got %s" %
-                type(plugin_names)
+                "Expected plugin_names arg to be list, but got %s", type(plugin_names)
             )
             raise TypeError("plugin_names argument must be list")
 
-        # Deactivate specified plugin
-        if plugin_names:
-            self.logger.debug("plugin names specified. Deactivating '%s'" % plugin_names)
+        # Deactivate specified plugins
+        if plugin_names and not cascade:
+            self.logger.debug("plugin names specified. Deactivating '%s'", plugin_names)
+            plugins = []
             for plugin_name in plugin_names:
 
                 # Get object of Plugin
                 plugin = self.get_plugin(plugin_name)
                 if plugin and plugin.is_activated():
-                    self.logger.debug("plugin '%s' exists and is active" % plugin.get_name())
-
-                    # Make sure there isn't a dependent running
-                    self.logger.debug("Checking for dependencies")
-                    for active_plugin in self.get_plugins():
-
-                        # Check if there's a plugin running that depends on the plugin being deactivated
-                        if plugin.get_name() in active_plugin.get_dependencies():
-                            self.logger.error(
-                                "'%s' is depended upon by running plugin '%s',"
-                                 "and cannot be deactivated" % (plugin_name, active_plugin.get_name())
-                            )
-                            raise DependentRunning(plugin, active_plugin)
-
-                        # If the plugin is a core plugin, make sure there are no addon plugins still running
-                        elif plugin.is_core_plugin() and not active_plugin.is_core_plugin():
-                            self.logger.error(
-                                "'%s' is a core plugin and there are still addon"
-                                " plugins currently running" % plugin_name
-                            )
-                            raise AddonPluginsStillRunning(plugin)
-
-
-                    # Deactive and remove plugin
-                    self.logger.debug("shutting down plugin '%s' and removing from plugins array" % plugin_name)
-                    plugin.deactivate()
-                    self.__plugins.remove(plugin)
+                    self.logger.debug("plugin '%s' exists and is active", plugin.get_name())
+                    plugins.append(plugin)
+                else:
+                    self.logger.error(
+                        "No plugin object found for '%s', or plugin not active", plugin_name
+                    )
+
+            # Check every plugin before stopping any, allowing for dependents deactivated alongside
+            stopping = set(plugin.get_name().lower() for plugin in plugins)
+            for plugin in plugins:
+
+                # Make sure there isn't a dependent running
+                self.logger.debug("Checking for dependencies")
+                for dependent in self.__registry.get_dependents(plugin.get_name()):
+                    if self.__registry.is_active(dependent.get_name()) and dependent.get_name().lower() not in stopping:
+                        self.logger.error(
+                            "'%s' is depended upon by running plugin '%s',"
+                             "and cannot be deactivated", plugin.get_name(), dependent.get_name()
+                        )
+                        raise DependentRunning(plugin, dependent)
+
+                # If the plugin is a core plugin, make sure there are no addon plugins still running
+                if plugin.is_core_plugin() and any(
+                        addon.get_name().lower() not in stopping for addon in self.get_plugins(core=False, active=True)
+                ):
+                    self.logger.error(
+                        "'%s' is a core plugin and there are still addon"
+                        " plugins currently running", plugin.get_name()
+                    )
+                    raise AddonPluginsStillRunning(plugin)
+
+            # Signal each generation of the batch to stop together, rather than stopping and joining one at a time
+            self.logger.debug("shutting down plugins '%s' and removing from plugins array", plugin_names)
+            self.__deactivate_generations(
+                self.__get_shutdown_plan(plugins), timeout=timeout, plugin_timeouts=plugin_timeouts, report=report
+            )
 
+        # Deactivate specified plugins and their dependents
+        elif plugin_names:
+            self.logger.debug("plugin names specified. Deactivating '%s' and dependents", plugin_names)
+            plugins = []
+            for plugin_name in plugin_names:
+                plugin = self.get_plugin(plugin_name)
+                if plugin and plugin.is_activated():
+                    plugins.append(plugin)
                 else:
-                    self.logger.error("No plugin object found for '%s', or plugin not active" %
-                                      plugin_name
-                                      )
+                    self.logger.error("No plugin object found for '%s', or plugin not active", plugin_name)
+
+            self.__deactivate_generations(
+                self.__get_shutdown_plan(plugins), timeout=timeout, plugin_timeouts=plugin_timeouts, report=report
+            )
 
         # Deactivate all plugins
         else:
             self.logger.debug("plugin names not specified. Deactivating all plugins")
-            for plugin in self.get_plugins():
-                if plugin.is_activated():
-                    self.logger.debug("shutting down plugin '%s' and removing from plugins array" % plugin.get_name())
-                    plugin.deactivate()
-                    self.__plugins.remove(plugin)
+            plugins = [plugin for plugin in self.__registry.get_by_state(active=True) if plugin.is_activated()]
+            self.__deactivate_generations(
+                self.__get_shutdown_plan(plugins), timeout=timeout, plugin_timeouts=plugin_timeouts, report=report
+            )
+
+            # Plugins the supervisor deactivated after they failed are removed too
+            for plugin in self.__registry.get_by_state(active=False):
+                self.logger.debug("Removing failed plugin '%s' from plugins array", plugin.get_name())
+                self.__unset_plugin(plugin)
+
+        # Remove the plugins that have stopped
+        for plugin_name in report.get_stopped():
+            plugin = self.get_plugin(plugin_name)
+            if plugin:
+                self.logger.debug("plugin '%s' shut down. Removing from plugins array", plugin_name)
+                self.__unset_plugin(plugin)
+
+        # Stop the event loops and task thread pool once no plugins are left on them
+        with self.__runtime_lock:
+            if self.__async_runtime is not None and not any(self.__async_runtime.get_load()):
+                self.__async_runtime.stop()
+                self.__async_runtime = None
+            if self.__task_scheduler is not None and not self.__task_scheduler.get_task_count():
+                self.__task_scheduler.stop()
+                self.__task_scheduler = None
+
+        # Remove the shared memory of the channels, and stop timing collections, once no plugins are left
+        if not len(self.__registry):
+            for name in list(self.__channels):
+                self.close_channel(name)
+            if self.__gc_tuner:
+                self.__gc_tuner.stop()
+
+        if not report.is_clean():
+            self.logger.error("Plugins overran their shutdown timeout: %s", report.get_overrun())
+
+        self.logger.debug("%s plugins remaining", len(self.__registry))
+        self.trace("EXIT")
+        return report
+
+
+    def restart_plugin(self, plugin_name, timeout=None, plugin_timeouts=None):
+        '''
+        Restarts an active plugin and the active plugins depending on it, without re-importing or re-instantiating
+        them. The plugins are deactivated, dependents first, then activated again in dependency order, each in a
+        fresh worker, keeping their configuration and state. Plugins that overrun their shutdown timeout are left
+        running, and are not restarted
+
+        :param plugin_name: The name of the plugin
+        :param timeout: Optional number of seconds the deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding individual plugin timeouts
+        :return: StartupReport of the reactivation, or None if the plugin isn't active
+        :raise: PluginNotReady if a restarted plugin does not report ready within the activation timeout
+        '''
+        self.trace("ENTRY")
+        started = time.perf_counter()
+        plugin = self.get_plugin(plugin_name)
+
+        if not plugin or not plugin.is_activated():
+            self.logger.error("No plugin object found for '%s', or plugin not active", plugin_name)
+            self.trace("EXIT - not active")
+            return None
+
+        report = StartupReport()
+        activated = self.__start_plugins(self.__stop_plugin_tree(plugin, timeout, plugin_timeouts), report)
+        report.set_elapsed(time.perf_counter() - started)
+
+        self.logger.info("Restarted %s plugins", len(activated))
+        self.trace("EXIT with %s", report)
+        return report
+
+
+    def reload_plugin(self, plugin_name, timeout=None, plugin_timeouts=None):
+        '''
+        Reloads an active plugin from its source, without restarting PlugSy. The plugin and the active plugins
+        depending on it are deactivated, dependents first, the plugin's modules are evicted from sys.modules and its
+        package is imported again. A new plugin object is instantiated and configured from it, then activated with the
+        dependents in dependency order. Dependents are restarted rather than reloaded, and other plugins keep running.
+        If the new version can't be loaded, the previous one is restored and reactivated. The previous modules are
+        then checked for having been garbage collected. Any still referenced are logged, and returned by
+        get_leaked_modules()
+
+        :param plugin_name: The name of the plugin
+        :param timeout: Optional number of seconds the deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding individual plugin timeouts
+        :return: StartupReport of the reload, or None if the plugin isn't active or overran its shutdown timeout
+        :raise: InvalidPlugin if the new version can't be loaded, MissingDependencyError if it depends on a plugin that
+            isn't active, PluginNotReady if a plugin does not report ready within the activation timeout
+        '''
+        self.trace("ENTRY")
+        started = time.perf_counter()
+        plugin = self.get_plugin(plugin_name)
+
+        if not plugin or not plugin.is_activated():
+            self.logger.error("No plugin object found for '%s', or plugin not active", plugin_name)
+            self.trace("EXIT - not active")
+            return None
+
+        name = plugin.get_name()
+        core = plugin.is_core_plugin()
+        attribute_name, package_name = self.__plugin_packages[name.lower()]
+        plan = self.__stop_plugin_tree(plugin, timeout, plugin_timeouts)
+        # Nothing may keep the previous version alive once it has been replaced
+        del plugin
+
+        report = StartupReport()
+        if not any(name in generation for generation in plan):
+            self.logger.error("Not reloading '%s' as it overran its shutdown timeout", name)
+            self.__start_plugins(plan, report)
+            self.trace("EXIT - not stopped")
+            return None
+
+        previous_modules = self.__evict_modules(package_name)
+        try:
+            importlib.invalidate_caches()
+            with report.measure(StartupReport.MODULE_IMPORT, name):
+                module = importlib.import_module(package_name)
+            reloaded_plugin = self.__load_plugin([attribute_name, module], core, report)
+
+            if reloaded_plugin.get_name() != name:
+                raise InvalidPlugin(name, "Reloaded plugin is named '%s'" % reloaded_plugin.get_name())
+            for dependency in reloaded_plugin.get_dependencies():
+                if not self.__registry.is_active(dependency):
+                    raise MissingDependencyError(reloaded_plugin, dependency)
+        except Exception:
+            self.logger.error("Could not reload '%s'. Reactivating the previous version", name)
+            self.__evict_modules(package_name)
+            self.__restore_modules(previous_modules)
+            self.__plugin_packages[name.lower()] = (attribute_name, package_name)
+            self.__start_plugins(plan, report)
+            raise
+
+        self.__registry.add(reloaded_plugin, active=False)
+        previous_modules = [weakref.ref(module) for module in previous_modules.values()]
+        activated = self.__start_plugins(plan, report)
+
+        # Frozen objects are never collected, so the heap is unfrozen for the check, then frozen again
+        frozen = gc.get_freeze_count()
+        if frozen and self.__gc_tuner:
+            self.__gc_tuner.unfreeze()
+        elif frozen:
+            gc.unfreeze()
+        gc.collect()
+        leaked = [reference for reference in previous_modules if reference() is not None]
+        if frozen and self.__gc_tuner:
+            self.__gc_tuner.refreeze()
+        elif frozen:
+            gc.freeze()
+
+        if leaked:
+            self.logger.warning(
+                "Previous modules of '%s' are still referenced and weren't garbage collected: %s",
+                name, [reference().__name__ for reference in leaked]
+            )
+            self.__leaked_modules += leaked
+
+        report.set_elapsed(time.perf_counter() - started)
+
+        self.logger.info("Reloaded '%s' and restarted %s plugins", name, len(activated) - 1)
+        self.trace("EXIT with %s", report)
+        return report
+
+
+    def __stop_plugin_tree(self, plugin, timeout, plugin_timeouts):
+        '''
+        Deactivates a plugin and the active plugins depending on it, dependents first. The plugins stay registered
+
+        :param plugin: The plugin object to deactivate
+        :param timeout: Optional number of seconds the deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding individual plugin timeouts
+        :return: List of plugin name lists, one per generation in activation order, of the plugins that stopped.
+            Plugins that overran their shutdown timeout are left running, and aren't included
+        '''
+        self.trace("ENTRY")
+
+        generations = self.__get_shutdown_plan([plugin])
+        shutdown_report = self.__deactivate_generations(generations, timeout=timeout, plugin_timeouts=plugin_timeouts)
+        if not shutdown_report.is_clean():
+            self.logger.error("Plugins overran their shutdown timeout and were left running: %s",
+                              shutdown_report.get_overrun())
+
+        stopped = set(shutdown_report.get_stopped())
+        for name in stopped:
+            self.__registry.set_active(name, False)
+
+        # Shutdown generations are ordered dependents first, so reversed they're in activation order
+        plan = [
+            [stopped_plugin.get_name() for stopped_plugin in generation if stopped_plugin.get_name() in stopped]
+            for generation in reversed(generations)
+        ]
+
+        self.trace("EXIT with %s", plan)
+        return plan
 
 
-        self.logger.debug("plugins array: %s" % self.__plugins)
-        self.logger.debug("EXIT")
+    def __deactivate_generations(self, generations, timeout=None, plugin_timeouts=None, report=None):
+        '''
+        Stops supervising plugins and removes their message bus subscriptions, then deactivates them. Removing the
+        subscriptions first releases publishers blocked on their full queues
+
+        :param generations: List of plugin object lists, one per generation in deactivation order
+        :param timeout: Optional number of seconds the deactivation may take. Unbounded if None
+        :param plugin_timeouts: Optional dict of <plugin name>:<seconds> overriding individual plugin timeouts
+        :param report: Optional ShutdownReport to record the deactivation in
+        :return: ShutdownReport
+        '''
+
+        plugins = [plugin for generation in generations for plugin in generation]
+
+        self.__supervisor.unwatch(plugins)
+        for plugin in plugins:
+            self.__message_bus.unsubscribe_owner(plugin.get_name())
+        return self.__activator.deactivate(
+            generations, timeout=timeout, plugin_timeouts=plugin_timeouts, report=report
+        )
+
+
+    def __restart_failed_plugin(self, plugin, ready_timeout):
+        '''
+        Activates a plugin whose run() failed again, in a fresh worker. Called by the supervisor, which must never wait
+        indefinitely for a plugin that fails again before reporting ready
+
+        :param plugin: The plugin object
+        :param ready_timeout: Seconds to wait for the plugin to report ready
+        :raise: PluginNotReady if the plugin does not report ready within ready_timeout
+        '''
+
+        # The failed run's subscriptions are replaced by whatever the new run subscribes to
+        self.__message_bus.unsubscribe_owner(plugin.get_name())
+        plugin.activate()
+        if not plugin.wait_until_ready(ready_timeout):
+            raise PluginNotReady(plugin, ready_timeout, plugin.get_failure())
+
+
+    def __disable_failed_plugin(self, plugin):
+        '''
+        Deactivates a plugin whose run() failed and won't be restarted. Called by the supervisor. The plugin stays in
+        PlugSy's plugins until all plugins are deactivated, and plugins depending on it are left running
+
+        :param plugin: The plugin object
+        '''
 
+        self.__message_bus.unsubscribe_owner(plugin.get_name())
+        plugin.deactivate(Supervisor.EXIT_TIMEOUT)
+        self.__registry.set_active(plugin.get_name(), False)
 
-    def __load_plugins(self, subpackage, plugin_names=[]):
+        dependents = [
+            dependent.get_name() for dependent in self.__registry.get_dependents(plugin.get_name())
+            if self.__registry.is_active(dependent.get_name())
+        ]
+        if dependents:
+            self.logger.warning("Plugins depending on failed plugin '%s' are still running: %s",
+                                plugin.get_name(), dependents)
+
+
+    def __start_plugins(self, plan, report):
+        '''
+        Activates registered plugins
+
+        :param plan: List of plugin name lists, one per generation in activation order
+        :param report: StartupReport to record the activation in
+        :return: List of the activated plugin objects
+        :raise: PluginNotReady if a plugin does not report ready within the activation timeout
+        '''
+        self.trace("ENTRY")
+
+        activated = self.__activator.activate(
+            [[self.get_plugin(name) for name in generation] for generation in plan], report=report
+        )
+        for plugin in activated:
+            self.__registry.set_active(plugin.get_name(), True)
+        self.__supervisor.watch(activated)
+
+        self.trace("EXIT")
+        return activated
+
+
+    def __evict_modules(self, package_name):
+        '''
+        Removes a package and its submodules from sys.modules, and unbinds them from their parent packages, so the
+        next import executes them again
+
+        :param package_name: Fully qualified package name
+        :return: Dict of the removed module names to modules
+        '''
+        modules = {
+            module_name: module for module_name, module in list(sys.modules.items())
+            if module_name == package_name or module_name.startswith(package_name + ".")
+        }
+
+        for module_name, module in modules.items():
+            del sys.modules[module_name]
+            parent_name, _, child_name = module_name.rpartition(".")
+            if getattr(sys.modules.get(parent_name), child_name, None) is module:
+                delattr(sys.modules[parent_name], child_name)
+
+        self.logger.debug("Evicted modules %s", list(modules))
+        return modules
+
+
+    def __restore_modules(self, modules):
+        '''
+        Puts modules removed by __evict_modules back
+
+        :param modules: Dict of module names to modules
+        '''
+
+        sys.modules.update(modules)
+        for module_name, module in modules.items():
+            parent_name, _, child_name = module_name.rpartition(".")
+            if parent_name in sys.modules:
+                setattr(sys.modules[parent_name], child_name, module)
+
+
+    def __get_shutdown_plan(self, plugins):
+        '''
+        Builds the deactivation plan for the specified plugins and all of their active dependents. Plugins are
+        ordered in generations, reverse topologically: every plugin is deactivated after the plugins that depend on
+        it, with addon plugins deactivated before core plugins
+
+        :param plugins: The plugin objects to deactivate
+        :return: List of plugin object lists, one per generation
+        '''
+        self.trace("ENTRY")
+        stopping = {}
+
+        # Collect the plugins and everything that depends on them, using the reverse dependency index
+        pending = list(plugins)
+        if any(plugin.is_core_plugin() for plugin in plugins):
+            pending += self.get_plugins(core=False, active=True)
+        while pending:
+            plugin = pending.pop()
+            name = plugin.get_name().lower()
+            if name in stopping or not self.__registry.is_active(name):
+                continue
+            stopping[name] = plugin
+            pending += self.__registry.get_dependents(name)
+
+        # Sort each tier on its dependents, so that a plugin's generation comes after all of its dependents
+        generations = []
+        for core in [False, True]:
+            tier_names = set(name for name, plugin in stopping.items() if plugin.is_core_plugin() == core)
+            dependents = {
+                name: set(
+                    dependent.get_name().lower() for dependent in self.__registry.get_dependents(name)
+                    if dependent.get_name().lower() in tier_names
+                )
+                for name in tier_names
+            }
+            for dependent_set in toposort(dependents):
+                generations.append([stopping[name] for name in dependent_set])
+
+        self.trace("EXIT with %s generations", len(generations))
+        return generations
+
+
+    def __resolve_dependencies(self, plugin_names):
+        '''
+        Computes the transitive dependency closure of the specified plugins across the core and addon packages.
+        Dependencies are read from discovered metadata, or from the imported plugin Config modules, so no plugin is
+        instantiated
+
+        :param plugin_names: Set of (lowercase) plugin names
+        :return: Set of (lowercase) plugin names including all of their dependencies
+        '''
+        self.trace("ENTRY")
+        dependencies = {}
+
+        for subpackage in [self.CORE_DIR, self.ADDON_DIR]:
+            if self.__discovery:
+                with self.__startup_report.measure(StartupReport.DISCOVERY):
+                    discovered = self.__discovery.discover(subpackage)
+                for plugin_info in discovered:
+                    dependencies[plugin_info.get_name().lower()] = plugin_info.get_dependencies()
+            else:
+                package_name = ".".join([self.ROOT_PLUGIN_PACKAGE, subpackage])
+                for name, module in self.__import_available_plugins(package_name):
+                    configuration = getattr(module, "Config", None)
+                    dependencies[name.lower()] = set(
+                        dependency.lower() for dependency in getattr(configuration, "DEPENDENCIES", [])
+                    )
+
+        # Walk the graph from the requested plugins. Unknown names are kept, and reported when sorting
+        resolved = set(plugin_names)
+        pending = list(plugin_names)
+        while pending:
+            for dependency in dependencies.get(pending.pop(), ()):
+                if dependency not in resolved:
+                    resolved.add(dependency)
+                    pending.append(dependency)
+
+        self.trace("EXIT with %s", resolved)
+        return resolved
+
+
+    def __load_plugins(self, subpackage, plugin_names=()):
         '''
         Loads Plugsy plugins
 
         :param subpackage: The subpackage to be loaded, such as 'core' or 'addons'
-        :param plugin_names: An optional list of specific plugins to load
+        :param plugin_names: An optional set of specific (lowercase) plugin names to load
         :return: List of plugin objects
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         plugins = []
 
         # Iterate packages and contained plugins
-        for plugin in self.__import_available_plugins(subpackage):
+        for plugin in self.__import_available_plugins(subpackage, plugin_names):
 
             # Skip plugin load if name specified and not matching plugin, or plugin already loaded
             if (not plugin_names or plugin[0].lower() in plugin_names) and not self.get_plugin(plugin[0]):
-                self.logger.debug("Attempting to load '%s' plugin" % plugin[0])
                 try:
-                    name, _class, plugin, configuration = self.__instantiate_plugin(plugin)
-                    self.logger.debug("'%s' loaded successfully" % name)
-                    # Try to load the plugins
-                    try:
-                        if subpackage.lower().split(".")[1] == "core":
-                            self.logger.debug("Setting plugin as core plugin")
-                            plugin.set_core_plugin()
-                        plugin.init_logging()
-                        self.logger.debug("Loading plugin config")
-                        plugin.load_configuration(configuration)
-                    except Exception as nx:
-                        raise InvalidPlugin(
-                            plugin_name=name,
-                            message=nx
-                        )
-                    plugins.append(plugin)
+                    plugins.append(self.__load_plugin(
+                        plugin, subpackage.lower().split(".")[1] == "core", self.__startup_report
+                    ))
                 except InvalidPlugin as ix:
                     # raise exception as "not a plugin or something"
                     if subpackage.lower().split(".")[1] == "core":
@@ -248,46 +837,117 @@ class Plugsy(Logger):
                         raise(ix)
                     else:
                         self.logger.error(
-                            "Skipping plugin '%s' due to load error: %s" % (
-                                ix.plugin_name,
-                                ix.message
-                            )
+                            "Skipping plugin '%s' due to load error: %s", ix.plugin_name, ix.message
                         )
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
         return plugins
 
 
-    def __import_available_plugins(self, package_name):
+    def __load_plugin(self, plugin_package, core, report):
+        '''
+        Instantiates and configures a single plugin
+
+        :param plugin_package: Tuple of (<plugin_name>, <plugin_module_reference>)
+        :param core: Boolean specifying whether the plugin is a core plugin
+        :param report: StartupReport to record the time spent instantiating and configuring the plugin in
+        :return: The plugin object
+        :raise: InvalidPlugin
+        '''
+        self.trace("ENTRY")
+        self.logger.debug("Attempting to load '%s' plugin", plugin_package[0])
+
+        with report.measure(StartupReport.INSTANTIATE, plugin_package[0]):
+            name, _class, plugin, configuration = self.__instantiate_plugin(plugin_package)
+        self.logger.debug("'%s' loaded successfully", name)
+        # Try to load the plugins
+        try:
+            if core:
+                self.logger.debug("Setting plugin as core plugin")
+                plugin.set_core_plugin()
+            plugin.init_logging()
+            self.logger.debug("Loading plugin config")
+            with report.measure(StartupReport.LOAD_CONFIGURATION, name):
+                plugin.load_configuration(configuration)
+        except Exception as nx:
+            raise InvalidPlugin(
+                plugin_name=name,
+                message=nx
+            )
+
+        self.trace("EXIT")
+        return plugin
+
+
+    def __import_available_plugins(self, package_name, plugin_names=()):
         '''
         imports available plugins for the specified package
 
         :param package_name: The name of the package to load plugins from, such as "core"
+        :param plugin_names: An optional set of specific (lowercase) plugin names. Only used with lazy discovery,
+            where plugins outside this set are not imported
         :return: List of tuples containing (<plugin_name>, <plugin_module_reference>)
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         available_plugins = []
-        self.logger.debug("Importing plugins from package %s" % package_name)
+        self.logger.debug("Importing plugins from package %s", package_name)
+
+        if self.__discovery:
+            return self.__import_discovered_plugins(package_name, plugin_names)
 
         # Try to import parent_package
         try:
-            package_import = importlib.import_module(package_name)
-            self.logger.debug("Subpackage '%s' successfully imported" % package_name)
+            with self.__startup_report.measure(StartupReport.PACKAGE_IMPORT):
+                package_import = importlib.import_module(package_name)
+            self.logger.debug("Subpackage '%s' successfully imported", package_name)
         except Exception as ix:
-            self.logger.error("Could not import subpackage '%s'" % package_name)
+            self.logger.error("Could not import subpackage '%s'", package_name)
             if "core" in package_name.lower():
                 raise SubpackageImportError(package_name, ix)
             return available_plugins
 
         for member in inspect.getmembers(package_import):
             if inspect.ismodule(member[1]):
-                self.logger.debug("member '%s' is a module. Adding import to available plugins" % member[0])
+                self.logger.debug("member '%s' is a module. Adding import to available plugins", member[0])
                 plugin_location = ".".join([package_name, member[0]])
-                available_plugins.append([
-                    member[0], importlib.import_module(plugin_location)
-                ])
+                with self.__startup_report.measure(StartupReport.MODULE_IMPORT, member[0]):
+                    plugin_module = importlib.import_module(plugin_location)
+                available_plugins.append([member[0], plugin_module])
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
+        return available_plugins
+
+
+    def __import_discovered_plugins(self, package_name, plugin_names=()):
+        '''
+        Discovers the plugins of the specified package statically and imports only those that are going to be loaded
+
+        :param package_name: The name of the package to load plugins from, such as "plugins.core"
+        :param plugin_names: An optional set of specific (lowercase) plugin names to import
+        :return: List of tuples containing (<plugin_name>, <plugin_module_reference>)
+        '''
+        self.trace("ENTRY")
+        available_plugins = []
+        tier = package_name.lower().split(".")[1]
+
+        with self.__startup_report.measure(StartupReport.DISCOVERY):
+            discovered = self.__discovery.discover(tier)
+
+        for plugin_info in discovered:
+            name = plugin_info.get_name()
+            if (plugin_names and name.lower() not in plugin_names) or name.lower() in self.__registry:
+                continue
+
+            try:
+                with self.__startup_report.measure(StartupReport.MODULE_IMPORT, name):
+                    available_plugins.append([name, self.__discovery.import_plugin(plugin_info)])
+                self.logger.debug("Plugin '%s' imported", name)
+            except Exception as ix:
+                self.logger.error("Could not import plugin '%s'", name)
+                if tier == self.CORE_DIR:
+                    raise SubpackageImportError(package_name, ix)
+
+        self.trace("EXIT")
         return available_plugins
 
 
@@ -298,18 +958,29 @@ class Plugsy(Logger):
         :param plugin_package: Namespace location of the plugin package to initiate, such as plugin.core.api
         :return: The name of the plugins's class, a class reference, an instance of the object and it's config
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         plugin_name = plugin_package[0]
         module_reference = plugin_package[1]
-        self.logger.debug("Attempting instantiation of '%s' plugin" % plugin_name)
+        self.logger.debug("Attempting instantiation of '%s' plugin", plugin_name)
 
         try:
             plugin_class = getattr(module_reference, plugin_name)
             plugin_configuration = getattr(module_reference, "Config")
-            plugin_object = plugin_class(
-                plugsy=self
-            )
+
+            # Plugins can be run in a worker process, behind a proxy
+            execution_mode = getattr(plugin_configuration, "EXECUTION_MODE", ProcessPluginProxy.THREAD)
+            if execution_mode not in ProcessPluginProxy.EXECUTION_MODES:
+                raise InvalidPlugin(plugin_name, "Unknown execution mode '%s'" % execution_mode)
+            elif execution_mode == ProcessPluginProxy.PROCESS:
+                self.logger.debug("'%s' runs in a worker process", plugin_name)
+                plugin_object = ProcessPluginProxy(
+                    plugsy=self, plugin_class=plugin_class, package_name=module_reference.__name__
+                )
+            else:
+                plugin_object = plugin_class(
+                    plugsy=self
+                )
 
             # Check plugin is valid
             try:
@@ -323,14 +994,79 @@ class Plugsy(Logger):
                 raise InvalidPlugin(plugin_name, "Not an instance of AbstractPlugin")
 
             plugin_name = plugin_object.get_name()
+            # Remembered so the plugin can be reloaded from its package
+            self.__plugin_packages[plugin_name.lower()] = (plugin_package[0], module_reference.__name__)
         except (TypeError, AttributeError) as ex:
             self.logger.error("Plugin is invalid (Bad type or initiation)")
             raise InvalidPlugin(plugin_name, ex)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
         return plugin_name, plugin_class, plugin_object, plugin_configuration
 
 
+    def __get_activation_plan(self, plugins, ignore_dependency_failures, loaded_plugins, plugin_names):
+        '''
+        Gets the activation plan for a batch of loaded plugins. The plan is taken from the discovery cache where
+        one was cached for the same request and the same plugins, otherwise the plugins are sorted by dependencies
+
+        :param plugins: The plugin objects to sort
+        :param ignore_dependency_failures: Boolean specifying with dependency failures should be suppressed
+        :param loaded_plugins: List of plugins that have been loaded so far
+        :param plugin_names: The set of (lowercase) plugin names requested
+        :return: Tuple of (sorted plugin objects, generations)
+        '''
+        self.trace("ENTRY")
+        cache = self.__discovery.get_cache() if self.__discovery else None
+
+        if not cache or not plugins:
+            self.trace("EXIT - sorting")
+            return self.__sort_by_dependencies(plugins, ignore_dependency_failures, loaded_plugins)
+
+        tier = self.CORE_DIR if plugins[0].is_core_plugin() else self.ADDON_DIR
+        key = "%s|%s" % (",".join(sorted(plugin_names)) or "*", ignore_dependency_failures)
+        plugins_by_name = {plugin.get_name().lower(): plugin for plugin in plugins}
+        cached_plan = cache.get_plan(tier, key)
+
+        if cached_plan is not None:
+            generations, skipped = cached_plan
+            planned_names = set(name for generation in generations for name in generation)
+
+            # Cached plan must cover exactly this batch, dependencies outside the batch must still be available, and
+            # each skipped plugin must still have a dependency that isn't
+            available_names = planned_names.union(
+                loaded_plugin.get_name().lower() for loaded_plugin in loaded_plugins
+            )
+            if (
+                    planned_names.union(skipped) == set(plugins_by_name) and
+                    all(
+                        dependency in available_names or dependency in self.__registry
+                        for name in planned_names for dependency in plugins_by_name[name].get_dependencies()
+                    ) and
+                    all(
+                        any(
+                            dependency and dependency not in available_names and dependency not in self.__registry
+                            for dependency in plugins_by_name[name].get_dependencies()
+                        )
+                        for name in skipped
+                    )
+            ):
+                self.trace("EXIT - using cached activation plan")
+                generations = [[plugins_by_name[name] for name in generation] for generation in generations]
+                return [plugin for generation in generations for plugin in generation], generations
+
+        sorted_plugins, generations = self.__sort_by_dependencies(
+            plugins, ignore_dependency_failures, loaded_plugins
+        )
+        cache.set_plan(
+            tier, key,
+            [[plugin.get_name().lower() for plugin in generation] for generation in generations],
+            set(plugins_by_name) - set(plugin.get_name().lower() for plugin in sorted_plugins)
+        )
+
+        self.trace("EXIT")
+        return sorted_plugins, generations
+
+
     def __sort_by_dependencies(self, plugins, ignore_dependency_failures, loaded_plugins):
         '''
         Sorts plugins by dependencies
@@ -338,19 +1074,21 @@ class Plugsy(Logger):
         :param plugins: The plugin objects to sort
         :param ignore_dependency_failures: Boolean specifying with dependency failures should be suppressed
         :param loaded_plugins: List of plugins that have been loaded so far
-        :return: Plugin objects in a sorted list
+        :return: Tuple of (sorted plugin objects, generations). generations is a list of plugin object lists, in
+            order, where each plugin only depends on plugins from earlier generations or already loaded plugins
         :raise: PluginCircularDependency
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         sorted_plugins = []
+        generations = []
         dependency_dict = {}
-        plugin_names = [plugin.get_name().lower() for plugin in plugins]
-        loaded_plugin_names = [loaded_plugin.get_name().lower() for loaded_plugin in loaded_plugins]
+        plugins_by_name = {plugin.get_name().lower(): plugin for plugin in plugins}
+        loaded_plugin_names = set(loaded_plugin.get_name().lower() for loaded_plugin in loaded_plugins)
 
-        # If no plugins to sort, return empty list
+        # If no plugins to sort, return empty plan
         if not plugins:
             self.logger.debug("No plugin objects to sort")
-            return list()
+            return sorted_plugins, generations
 
         # Determine sort type
         if plugins[0].is_core_plugin():
@@ -361,59 +1099,73 @@ class Plugsy(Logger):
             core_sort = False
 
         # Check for unresolveable/missing dependencies
-        for plugin in plugins:
+        for name, plugin in plugins_by_name.items():
             dependency_failure = False
 
-            # If no dependencies, add to list and skip
-            if not plugin.get_dependencies():
-                self.logger.debug("plugin '%s' has no dependencies. Skipping" % plugin.get_name())
-                sorted_plugins.append(plugin)
-                continue
-
             # Check each dep is in the list of plugins to be loaded, or is already loaded or activated
-            for dependency in [dependency.lower() for dependency in plugin.get_dependencies()]:
-                if dependency and dependency not in plugin_names and dependency not in loaded_plugin_names and not self.get_plugin(dependency):
+            for dependency in plugin.get_dependencies():
+                if (
+                        dependency and dependency not in plugins_by_name and
+                        dependency not in loaded_plugin_names and dependency not in self.__registry
+                ):
                     if core_sort or (not core_sort and not ignore_dependency_failures):
                         self.logger.critical(
-                            "core plugin '%s' has missing dependency '%s'" % (
-                                plugin.get_name(), dependency
-                            )
+                            "core plugin '%s' has missing dependency '%s'", plugin.get_name(), dependency
                         )
                         raise MissingDependencyError(plugin, dependency)
                     elif not core_sort:
                         self.logger.error(
-                            "Skipping addon plugin '%s' due to missing dependency" % (
-                                plugin.get_name(), dependency
-                            )
+                            "Skipping addon plugin '%s' due to missing dependency '%s'", plugin.get_name(), dependency
                         )
                         dependency_failure = True
 
-            # If dependency resolve failed and not fatal, skip plugin
-            if dependency_failure:
-                continue
-            else:
-                # Otherwise add plugins dependencies to dependency dict
-                dependency_dict[plugin.get_name().lower()] = plugin.get_dependencies()
+            # If dependency resolve failed and not fatal, skip plugin. Otherwise add to dependency dict, keeping
+            # only the dependencies within this batch
+            if not dependency_failure:
+                dependency_dict[name] = set(
+                    dependency for dependency in plugin.get_dependencies() if dependency in plugins_by_name
+                )
 
-        # Perform Topological Sort
-        self.logger.debug("Performing topological sort: %s" % dependency_dict)
+        # Perform Topological Sort. Each plugin's generation is one past the latest generation of its dependencies
+        self.logger.debug("Performing topological sort: %s", dependency_dict)
+        plugin_generations = {}
         try:
             for dependency_set in toposort(dependency_dict):
-                for dependency in dependency_set:
-                    for plugin in plugins:
-                        if plugin.get_name().lower() == dependency and plugin not in sorted_plugins:
-                            sorted_plugins.append(plugin)
+                for name in dependency_set:
+                    dependencies = dependency_dict.get(name)
+
+                    # Skip names that are not sortable plugins, or that depend on a skipped plugin
+                    if dependencies is None:
+                        continue
+                    if not dependencies.issubset(plugin_generations):
+                        self.logger.error(
+                            "Skipping addon plugin '%s' as a dependency was skipped", plugins_by_name[name].get_name()
+                        )
+                        continue
+
+                    plugin_generations[name] = max(
+                        (plugin_generations[dependency] + 1 for dependency in dependencies), default=0
+                    )
         except PluginCircularDependency as px:
             if core_sort or (not core_sort and not ignore_dependency_failures):
                 self.logger.critical(
-                    "encountered fatal circular dependency error while loading plugins"
+                    "encountered fatal circular dependency error while loading plugins: %s", px.cycle
                 )
                 raise px
             else:
-                self.logger.error("Skipping addon plugins due to circular dependency error")
+                self.logger.error("Skipping addon plugins due to circular dependency error: %s", px.cycle)
+
+        # Build the plan, keeping load order within each generation
+        if plugin_generations:
+            generations = [[] for _ in range(max(plugin_generations.values()) + 1)]
+            for name, plugin in plugins_by_name.items():
+                if name in plugin_generations:
+                    generations[plugin_generations[name]].append(plugin)
+            for generation in generations:
+                sorted_plugins += generation
 
-        self.logger.debug("EXIT with %s" % sorted_plugins)
-        return sorted_plugins
+        self.trace("EXIT with %s", sorted_plugins)
+        return sorted_plugins, generations
 
 
     # =======================
@@ -425,49 +1177,195 @@ class Plugsy(Logger):
 
         :return: True or False
         '''
-        self.logger.debug("ENTRY")
 
-        self.logger.debug("EXIT: %s" % self.__safe_mode)
         return self.__safe_mode
 
 
     def get_plugin(self, plugin_name):
         '''
-        Fetch the plugin object of a specific plugin
+        Fetch the plugin object of a specific plugin. Constant time and safe to call from plugin threads
 
         :param plugin_name: The name of the plugin to fetch
-        :return: The relevant plugin object
+        :return: The relevant plugin object, or None if it does not exist
         '''
-        self.logger.debug("ENTRY")
 
-        plugin_object = self.get_plugins(plugin_name=plugin_name)
+        return self.__registry.get(plugin_name)
+
+
+    def get_async_runtime(self):
+        '''
+        Fetch the event loop runtime hosting async plugins, starting it if it isn't running
+
+        :return: EventLoopRuntime
+        '''
+
+        with self.__runtime_lock:
+            if self.__async_runtime is None:
+                self.__async_runtime = EventLoopRuntime(loops=self.__async_loops)
+                self.__async_runtime.start()
+            return self.__async_runtime
+
+
+    def get_gc_tuner(self):
+        '''
+        Fetch the tuner freezing the heap and timing collections
+
+        :return: GcTuner, or None if neither gc_freeze nor gc_thresholds were set
+        '''
+
+        return self.__gc_tuner
 
-        if not plugin_object:
-            self.logger.debug("Plugin object does not exist")
-            self.logger.debug("EXIT")
-            return None
-        else:
-            self.logger.debug("Plugin object does exist")
-            self.logger.debug("EXIT")
-            return plugin_object[0]
 
+    def get_supervisor(self):
+        '''
+        Fetch the supervisor restarting failed plugins, and its failure and restart statistics
+
+        :return: Supervisor
+        '''
+
+        return self.__supervisor
+
+
+    def get_task_scheduler(self):
+        '''
+        Fetch the scheduler executing task plugin ticks, starting it if it isn't running
+
+        :return: TaskScheduler
+        '''
 
-    def get_plugins(self, plugin_name=None):
+        with self.__runtime_lock:
+            if self.__task_scheduler is None:
+                self.__task_scheduler = TaskScheduler(max_workers=self.__max_task_workers)
+                self.__task_scheduler.start()
+            return self.__task_scheduler
+
+
+    def create_channel(self, name, slot_size, slot_count=SharedChannel.DEFAULT_SLOT_COUNT):
+        '''
+        Creates a shared memory channel for passing binary data between plugins, in threads or processes
+
+        :param name: The channel name
+        :param slot_size: Maximum number of bytes written to a slot
+        :param slot_count: The number of slots
+        :return: SharedChannel
+        :raise: ValueError if a channel with that name already exists
+        '''
+
+        with self.__runtime_lock:
+            if name in self.__channels:
+                raise ValueError("Channel '%s' already exists" % name)
+            channel = self.__channels[name] = SharedChannel(name, slot_size, slot_count)
+            return channel
+
+
+    def close_channel(self, name):
+        '''
+        Closes a channel and removes its shared memory
+
+        :param name: The channel name
+        '''
+
+        with self.__runtime_lock:
+            channel = self.__channels.pop(name, None)
+
+        if channel is None:
+            self.logger.error("No channel found for '%s'", name)
+            return
+        channel.close()
+
+
+    def get_channels(self):
+        '''
+        Fetch every channel created with create_channel
+
+        :return: Dict of channel names to SharedChannels
+        '''
+
+        return dict(self.__channels)
+
+
+    def get_channel(self, name):
+        '''
+        Fetch a channel created with create_channel
+
+        :param name: The channel name
+        :return: SharedChannel, or None if no channel with that name exists
+        '''
+
+        return self.__channels.get(name)
+
+
+    def get_message_bus(self):
+        '''
+        Fetch the bus plugins publish and subscribe to messages on
+
+        :return: MessageBus
+        '''
+
+        return self.__message_bus
+
+
+    def get_leaked_modules(self):
+        '''
+        Gets the modules replaced by reload_plugin that are still referenced, and so haven't been garbage collected.
+        Modules collected since they were reloaded are no longer reported
+
+        :return: List of module names. Names appear once per leaked reload
+        '''
+
+        modules = [reference() for reference in self.__leaked_modules]
+        self.__leaked_modules = [reference for reference in self.__leaked_modules if reference() is not None]
+        return [module.__name__ for module in modules if module is not None]
+
+
+    def get_preloaded_plugins(self):
+        '''
+        Fetch the plugins loaded by preload_plugins that haven't been activated yet
+
+        :return: List of plugin objects. Empty if no plugins are preloaded
+        '''
+
+        return list(self.__preloaded[2]) if self.__preloaded is not None else []
+
+
+    def get_startup_report(self):
+        '''
+        Fetch the timings recorded by the most recent activate_plugins call
+
+        :return: StartupReport
+        '''
+
+        return self.__startup_report
+
+
+    def get_plugins(self, plugin_name=None, core=None, active=None):
         '''
         Fetches PlugSy plugins
 
         :param plugin_name: The name of a specific plugin to get (optional)
+        :param core: Optionally restrict to core (True) or addon (False) plugins
+        :param active: Optionally restrict to active (True) or inactive (False) plugins
         :return: A list of PlugSy plugin objects
         '''
-        self.logger.debug("ENTRY")
-        plugins_list = []
+        self.trace("ENTRY")
+
+        if plugin_name:
+            plugin = self.__registry.get(plugin_name)
+            plugins_list = [plugin] if plugin else []
+        elif core is not None:
+            plugins_list = self.__registry.get_by_tier(core)
+        elif active is not None:
+            plugins_list = self.__registry.get_by_state(active)
+        else:
+            plugins_list = self.__registry.get_all()
 
-        for plugin in self.__plugins:
-            if not plugin_name or plugin.get_name().lower() == plugin_name.lower():
-                self.logger.debug("Got plugin '%s'" % plugin.get_name())
-                plugins_list.append(plugin)
+        # Apply the remaining filters to the (already narrowed) list
+        if core is not None:
+            plugins_list = [plugin for plugin in plugins_list if plugin.is_core_plugin() == core]
+        if active is not None:
+            plugins_list = [plugin for plugin in plugins_list if self.__registry.is_active(plugin.get_name()) == active]
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
         return plugins_list
 
 
@@ -477,16 +1375,16 @@ class Plugsy(Logger):
 
         :return: List of subpackages
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         subpackages = []
 
         root_package_import = importlib.import_module(self.ROOT_PLUGIN_PACKAGE)
         for loader, modname, ispkg in pkgutil.iter_modules(root_package_import.__path__):
             if ispkg:
-                self.logger.debug("ENTRY")
+                self.trace("ENTRY")
                 subpackages.append(modname)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
         return subpackages
 
 
@@ -496,13 +1394,13 @@ class Plugsy(Logger):
 
         :return: True if frozen, otherwise False
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         if hasattr(sys, 'frozen'):
-            self.logger.debug("EXIT with %s" % True)
+            self.trace("EXIT with %s", True)
             return True
         else:
-            self.logger.debug("EXIT with %s" % False)
+            self.trace("EXIT with %s", False)
             return False
 
 
@@ -515,8 +1413,24 @@ class Plugsy(Logger):
 
         :param plugins: A list of plugin objects
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
+
+        for plugin in plugins:
+            self.__registry.add(plugin, active=plugin.is_activated())
+        self.__supervisor.watch([plugin for plugin in plugins if plugin.is_activated()])
+        self.trace("EXIT")
+
+
+    def __unset_plugin(self, plugin):
+        '''
+        Removes a deactivated plugin from PlugSy's plugins
+
+        :param plugin: The plugin object to remove
+        '''
+        self.trace("ENTRY")
 
-        self.__plugins += plugins
-        self.logger.debug("EXIT")
+        self.__supervisor.unwatch([plugin])
+        self.__registry.remove(plugin.get_name())
+        self.__plugin_packages.pop(plugin.get_name().lower(), None)
+        self.trace("EXIT")
 
@@ -0,0 +1,204 @@
+'''
+PreforkServer - Forks worker processes that activate plugins preloaded once by the parent
+'''
+
+# Import libs
+import logging
+import os
+import signal
+import threading
+import time
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class PreforkServer(Logger):
+    '''
+    Runs a pool of worker processes sharing one plugin home. The parent preloads the plugins with
+    Plugsy.preload_plugins, importing, instantiating and configuring them once, then forks the workers. Each worker
+    inherits the loaded modules and plugin objects copy-on-write and only calls activate_plugins, which is where the
+    plugin threads are created. Workers run until the server is stopped or the parent exits, then deactivate their
+    plugins. Only available where os.fork is (POSIX)
+    '''
+
+    DEFAULT_WORKERS = os.cpu_count() or 1
+
+    # Seconds between checks that workers have exited while stopping
+    STOP_POLL_INTERVAL = 0.05
+
+    def __init__(self, plugsy, workers=DEFAULT_WORKERS):
+        '''
+        Constructor
+
+        :param plugsy: PlugSy object with preloaded plugins
+        :param workers: The number of worker processes to fork
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer")
+
+        self.__plugsy = plugsy
+        self.__worker_count = workers
+        # Worker pids and the write end of each worker's stop pipe
+        self.__workers = {}
+        self.__worker_index = None
+
+
+    def start(self):
+        '''
+        Forks the worker processes. Must be called from the thread that preloaded the plugins, before any other
+        threads are started, as only the forking thread exists in the workers
+
+        :raise: RuntimeError if no plugins have been preloaded, or the server is already running
+        '''
+        self.trace("ENTRY")
+
+        if self.__workers:
+            raise RuntimeError("The prefork server is already running")
+        if not self.__plugsy.get_preloaded_plugins():
+            raise RuntimeError("No plugins have been preloaded. Call preload_plugins() before starting workers")
+
+        # Threads aren't copied into forked workers, so anything they do (e.g. a LogPipeline listener) stops there
+        threads = [thread.name for thread in threading.enumerate() if thread is not threading.current_thread()]
+        if threads:
+            self.logger.warning("Forking workers with other threads running, which won't exist in them: %s", threads)
+
+        for index in range(self.__worker_count):
+            self.__fork_worker(index)
+
+        self.logger.info("Started %s workers", self.__worker_count)
+        self.trace("EXIT")
+
+
+    def stop(self, timeout=None):
+        '''
+        Stops the workers. Each deactivates its plugins and exits. Workers still running after the timeout are killed
+
+        :param timeout: Optional number of seconds to wait for the workers to exit. Waits indefinitely if None
+        :return: Dict of worker pids to exit codes (negative if killed by a signal)
+        '''
+        self.trace("ENTRY")
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        # Closing the write end of its stop pipe tells a worker to stop
+        for stop_pipe in self.__workers.values():
+            os.close(stop_pipe)
+
+        exit_codes = {}
+        pending = set(self.__workers)
+        while pending:
+            for pid in list(pending):
+                waited_pid, status = os.waitpid(pid, os.WNOHANG)
+                if waited_pid:
+                    exit_codes[pid] = os.waitstatus_to_exitcode(status)
+                    pending.discard(pid)
+
+            if pending and deadline is not None and time.monotonic() >= deadline:
+                self.logger.warning("Killing workers still running after %ss: %s", timeout, sorted(pending))
+                for pid in pending:
+                    os.kill(pid, signal.SIGKILL)
+                    exit_codes[pid] = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+                pending.clear()
+            elif pending:
+                time.sleep(self.STOP_POLL_INTERVAL)
+
+        self.__workers = {}
+        self.logger.info("Stopped workers with exit codes %s", exit_codes)
+        self.trace("EXIT")
+        return exit_codes
+
+
+    def __fork_worker(self, index):
+        '''
+        Forks a worker process
+
+        :param index: The worker's index in the pool
+        '''
+        read_pipe, write_pipe = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(write_pipe)
+            self.__run_worker(index, read_pipe)
+
+        os.close(read_pipe)
+        self.__workers[pid] = write_pipe
+        self.logger.debug("Forked worker %s with pid %s", index, pid)
+
+
+    def __run_worker(self, index, stop_pipe):
+        '''
+        Worker process body. Activates the preloaded plugins, waits to be stopped, deactivates them and exits.
+        Never returns
+
+        :param index: The worker's index in the pool
+        :param stop_pipe: Read end of the worker's stop pipe. Reaches end of file when the server stops, or when
+            the parent exits
+        '''
+        exit_code = 0
+        self.__worker_index = index
+
+        try:
+            # Siblings' stop pipes must be closed here, or they'd never reach end of file
+            for sibling_pipe in self.__workers.values():
+                os.close(sibling_pipe)
+            self.__workers = {}
+
+            self.__plugsy.activate_plugins()
+            self.logger.info("Worker %s activated its plugins", index)
+
+            while os.read(stop_pipe, 1):
+                pass
+
+            self.__plugsy.deactivate_plugins()
+        except BaseException:
+            self.logger.critical("Worker %s failed", index, exc_info=True)
+            exit_code = 1
+        finally:
+            logging.shutdown()
+            os._exit(exit_code)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_worker_count(self):
+        '''
+        Gets the number of worker processes in the pool
+
+        :return: Worker count
+        '''
+
+        return self.__worker_count
+
+
+    def get_worker_pids(self):
+        '''
+        Gets the pids of the running workers. Only available in the parent
+
+        :return: List of pids
+        '''
+
+        return list(self.__workers)
+
+
+    def get_worker_index(self):
+        '''
+        Gets the index of the current worker in the pool
+
+        :return: Worker index, or None in the parent
+        '''
+
+        return self.__worker_index
+
+
+    def is_running(self):
+        '''
+        Checks whether the workers have been started and not stopped
+
+        :return: True if running, otherwise False
+        '''
+
+        return bool(self.__workers)
@@ -0,0 +1,301 @@
+'''
+Runs plugins in worker processes, behind a proxy plugin held by PlugSy
+'''
+
+# Import libs
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from threading import Thread
+
+# Import package modules
+from . import Config
+from .AbstractPlugin import AbstractPlugin
+from .Discovery import Discovery, PluginInfo
+from .utils import Logger
+
+class ProcessPluginProxy(AbstractPlugin):
+    '''
+    Stands in for a plugin whose Config.py sets EXECUTION_MODE to "process". The plugin itself is imported,
+    instantiated, configured and activated in a worker process started on activation, so CPU-bound plugins don't
+    contend for the GIL and a crash only takes down the worker. The proxy holds the plugin's configuration, so
+    dependency ordering, readiness and deactivation behave exactly as for threaded plugins. The plugin is named after
+    its class, and in the worker its plugsy attribute is a ProcessHost. The message bus lives in the parent process,
+    so plugins running in a worker exchange data through channels instead
+    '''
+
+    THREAD = "thread"
+    PROCESS = "process"
+    EXECUTION_MODES = [THREAD, PROCESS]
+
+    # Seconds between checks that the worker is still alive while waiting for it to report ready
+    READY_POLL_INTERVAL = 0.1
+
+    def __init__(self, plugsy, plugin_class, package_name):
+        '''
+        Constructor
+
+        :param plugsy: Parent PlugSy object
+        :param plugin_class: The plugin class, instantiated in the worker process
+        :param package_name: Name of the plugin package holding the plugin class and its Config module
+        '''
+        AbstractPlugin.__init__(self, plugsy, plugin_class.__name__)
+
+        self.__context = multiprocessing.get_context(Config.PROCESS_START_METHOD)
+        self.__class_name = plugin_class.__name__
+        self.__package_name = package_name
+        self.__package_path = os.path.dirname(sys.modules[package_name].__file__)
+        self.__process = None
+        # Released to stop the worker. Releasing never waits on the worker, unlike setting an Event whose waiter died
+        self.__stop = self.__context.Semaphore(0)
+        # Set by the plugin in the worker, so readiness is reported across the process boundary
+        self.ready_event = self.__context.Event()
+
+
+    def start(self):
+        '''
+        Starts the worker process, in place of a worker thread
+
+        :raise: RuntimeError if the plugin is already running
+        '''
+
+        if self.is_alive():
+            raise RuntimeError("Plugin '%s' is already running" % self.get_name())
+
+        # Each worker gets its own stop semaphore, so a release meant for the previous worker can't stop it
+        self.__stop = self.__context.Semaphore(0)
+        self.__process = self.__context.Process(
+            target=ProcessHost.run_plugin,
+            args=(
+                self.__package_name, self.__package_path, self.__class_name, self.is_core_plugin(),
+                logging.getLevelName(logging.getLogger(Config.FULL_NAME).getEffectiveLevel()).lower(),
+                self.plugsy.get_channels(), self.__stop, self.ready_event
+            ),
+            name="plugsy-%s" % self.get_name(),
+            daemon=True
+        )
+        self.__process.start()
+        self.logger.debug("Started worker process %s", self.__process.pid)
+
+
+    def stop(self):
+        '''
+        Plugin stop method. Releases the stop semaphore, which stops the plugin in the worker process. Never blocks,
+        even if the worker has died
+        '''
+        self.trace("ENTRY")
+
+        AbstractPlugin.stop(self)
+        self.__stop.release()
+
+        self.trace("EXIT")
+
+
+    def terminate(self):
+        '''
+        Terminates the worker process, for plugins that don't stop when asked to
+        '''
+
+        if self.is_alive():
+            self.logger.warning("Terminating worker process %s", self.__process.pid)
+            self.__process.terminate()
+
+
+    def set_ready(self):
+        '''
+        Readiness is reported by the plugin in the worker process, once it has been activated there
+        '''
+
+
+    def wait_until_ready(self, timeout=None):
+        '''
+        Blocks until the plugin reports ready, or its worker process exits
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        :return: True if the plugin is ready, otherwise False
+        '''
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            wait = self.READY_POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            if self.ready_event.wait(wait):
+                return True
+
+            if not self.is_alive():
+                self.logger.error("Worker process exited with code %s before reporting ready", self.get_exitcode())
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+
+    def wait_until_stopped(self, timeout=None):
+        '''
+        Waits for a stopped plugin's worker process to exit. The plugin is marked deactivated once it has
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        :return: True if the worker process has exited, otherwise False
+        '''
+        stopped = AbstractPlugin.wait_until_stopped(self, timeout)
+
+        if stopped and self.get_exitcode():
+            self.logger.warning("Worker process exited with code %s", self.get_exitcode())
+        return stopped
+
+
+    def is_alive(self):
+        '''
+        Checks whether the worker process is running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__process is not None and self.__process.is_alive()
+
+
+    def join(self, timeout=None):
+        '''
+        Waits for the worker process to exit
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        '''
+
+        if self.__process is not None:
+            self.__process.join(timeout)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_failure(self):
+        '''
+        Gets why the plugin's worker process exited without being stopped. The exception raised by run() is only
+        logged in the worker, which exits with an error
+
+        :return: ChildProcessError, or None if the worker is running, was stopped or exited cleanly
+        '''
+        failure = AbstractPlugin.get_failure(self)
+
+        if failure is None and self.get_exitcode() and not self.stop_event.is_set():
+            failure = ChildProcessError("Worker process exited with code %s" % self.get_exitcode())
+        return failure
+
+
+    def get_pid(self):
+        '''
+        Gets the worker process ID
+
+        :return: Process ID, or None if the plugin hasn't been started
+        '''
+
+        return self.__process.pid if self.__process is not None else None
+
+
+    def get_exitcode(self):
+        '''
+        Gets the worker process exit code
+
+        :return: Exit code (negative if killed by a signal), or None if not started or still running
+        '''
+
+        return self.__process.exitcode if self.__process is not None else None
+
+
+# ==========================
+# = ProcessHost Class
+# ==========================
+class ProcessHost(Logger):
+    '''
+    The plugsy object of a plugin running in a worker process. Gives access to the channels that existed when the
+    worker was started. The message bus isn't available, as its queues can't be shared with the worker
+    '''
+
+    def __init__(self, channels):
+        '''
+        Constructor
+
+        :param channels: Dict of channel names to SharedChannels, attached in the worker
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        self.__channels = channels
+
+
+    @staticmethod
+    def run_plugin(package_name, package_path, class_name, core, level, channels, stop, ready):
+        '''
+        Worker process target. Loads and activates the plugin, and runs it until it's stopped or returns. Only the
+        plugin's own package is imported: the plugins package and subpackage are registered without executing their
+        __init__ files, as in lazy discovery, so the worker doesn't import every other plugin
+
+        :param package_name: Name of the plugin package
+        :param package_path: The plugin package directory
+        :param class_name: Name of the plugin class within the package
+        :param core: Boolean specifying whether the plugin is a core plugin
+        :param level: Logging level of the parent PlugSy object
+        :param channels: Dict of channel names to SharedChannels
+        :param stop: Semaphore released when the plugin is deactivated
+        :param ready: Event set when the plugin is ready
+        '''
+        Logger(name=Config.FULL_NAME, level=level)
+        host = ProcessHost(channels)
+
+        root_package, tier, plugin_name = package_name.rsplit(".", 2)
+        module = Discovery(root_package).import_plugin(PluginInfo(plugin_name, tier, set(), package_path))
+        plugin = getattr(module, class_name)(plugsy=host)
+        if core:
+            plugin.set_core_plugin()
+        plugin.init_logging()
+        plugin.load_configuration(getattr(module, "Config"))
+        plugin.ready_event = ready
+
+        # Stop the plugin from a watcher thread, as the main thread is waiting for it
+        Thread(target=lambda: stop.acquire() and plugin.stop(), name="plugsy-stop-watcher", daemon=True).start()
+
+        try:
+            plugin.activate()
+            plugin.wait_until_stopped()
+        finally:
+            for channel in channels.values():
+                channel.close()
+
+        # The parent only sees the exit code, so a plugin whose run() raised exits with an error
+        if plugin.get_failure() is not None:
+            sys.exit(1)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_message_bus(self):
+        '''
+        The message bus isn't available in worker processes. Also raised by AbstractPlugin.subscribe()
+
+        :raise: RuntimeError
+        '''
+
+        raise RuntimeError("The message bus isn't available to plugins running in a worker process. Use a channel")
+
+
+    def get_channel(self, name):
+        '''
+        Fetch a channel of the parent PlugSy object
+
+        :param name: The channel name
+        :return: SharedChannel, or None if no channel with that name existed when the worker was started
+        '''
+
+        return self.__channels.get(name)
+
+
+    def get_channels(self):
+        '''
+        Fetch every channel of the parent PlugSy object
+
+        :return: Dict of channel names to SharedChannels
+        '''
+
+        return dict(self.__channels)
@@ -0,0 +1,199 @@
+'''
+Registry - Name indexed store of loaded plugins
+'''
+
+# Import libs
+from threading import RLock
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class Registry(Logger):
+    '''
+    Holds plugin objects keyed by their canonical (lowercase) name, with secondary indexes by tier (core/addon), by
+    activation state and by reverse dependency (dependents of each plugin). Lookups are constant time and safe to call
+    from plugin threads
+    '''
+
+    CORE_TIER = "core"
+    ADDON_TIER = "addon"
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        self.__lock = RLock()
+        self.__plugins = {}
+        self.__tiers = {self.CORE_TIER: {}, self.ADDON_TIER: {}}
+        self.__states = {True: {}, False: {}}
+        self.__dependents = {}
+
+
+    def add(self, plugin, active=False):
+        '''
+        Adds a plugin to the registry. Replaces any plugin already registered under the same name
+
+        :param plugin: The plugin object to add
+        :param active: Boolean specifying whether the plugin is active
+        '''
+        key = plugin.get_name().lower()
+
+        with self.__lock:
+            self.__discard(key)
+            self.__plugins[key] = plugin
+            self.__tiers[self.__get_tier(plugin)][key] = plugin
+            self.__states[bool(active)][key] = plugin
+            for dependency in plugin.get_dependencies():
+                self.__dependents.setdefault(dependency, {})[key] = plugin
+
+        self.logger.debug("Registered '%s' (active: %s)", plugin.get_name(), active)
+
+
+    def remove(self, plugin_name):
+        '''
+        Removes a plugin from the registry
+
+        :param plugin_name: The name of the plugin to remove
+        :return: The removed plugin object, or None if not registered
+        '''
+        with self.__lock:
+            plugin = self.__discard(plugin_name.lower())
+
+        if plugin:
+            self.logger.debug("Unregistered '%s'", plugin.get_name())
+        return plugin
+
+
+    def set_active(self, plugin_name, active):
+        '''
+        Moves a registered plugin to the active or inactive index
+
+        :param plugin_name: The name of the plugin
+        :param active: Boolean specifying whether the plugin is active
+        '''
+        key = plugin_name.lower()
+
+        with self.__lock:
+            plugin = self.__plugins.get(key)
+            if plugin is None:
+                return
+            self.__states[not active].pop(key, None)
+            self.__states[bool(active)][key] = plugin
+
+
+    def __discard(self, key):
+        '''
+        Removes a key from every index. Lock must be held by the caller
+
+        :param key: Canonical plugin name
+        :return: The removed plugin object, or None
+        '''
+        plugin = self.__plugins.pop(key, None)
+        if plugin is None:
+            return None
+
+        for index in list(self.__tiers.values()) + list(self.__states.values()):
+            index.pop(key, None)
+
+        for dependency in plugin.get_dependencies():
+            dependents = self.__dependents.get(dependency)
+            if dependents is not None:
+                dependents.pop(key, None)
+                if not dependents:
+                    del self.__dependents[dependency]
+
+        return plugin
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get(self, plugin_name):
+        '''
+        Fetches a plugin by name
+
+        :param plugin_name: The name of the plugin. Case insensitive
+        :return: The plugin object, or None if not registered
+        '''
+
+        return self.__plugins.get(plugin_name.lower())
+
+
+    def get_all(self):
+        '''
+        Fetches every registered plugin
+
+        :return: List of plugin objects in registration order
+        '''
+
+        with self.__lock:
+            return list(self.__plugins.values())
+
+
+    def get_by_tier(self, core):
+        '''
+        Fetches the registered plugins of a single tier
+
+        :param core: True for core plugins, False for addon plugins
+        :return: List of plugin objects in registration order
+        '''
+
+        with self.__lock:
+            return list(self.__tiers[self.CORE_TIER if core else self.ADDON_TIER].values())
+
+
+    def get_by_state(self, active):
+        '''
+        Fetches the registered plugins by activation state
+
+        :param active: True for active plugins, False for inactive plugins
+        :return: List of plugin objects in registration order
+        '''
+
+        with self.__lock:
+            return list(self.__states[bool(active)].values())
+
+
+    def get_dependents(self, plugin_name):
+        '''
+        Fetches the registered plugins that directly depend on a plugin
+
+        :param plugin_name: The name of the plugin
+        :return: List of dependent plugin objects
+        '''
+
+        with self.__lock:
+            return list(self.__dependents.get(plugin_name.lower(), {}).values())
+
+
+    def is_active(self, plugin_name):
+        '''
+        Checks whether a registered plugin is in the active index
+
+        :param plugin_name: The name of the plugin
+        :return: True if registered and active, otherwise False
+        '''
+
+        return plugin_name.lower() in self.__states[True]
+
+
+    def __get_tier(self, plugin):
+        '''
+        Gets the tier name of a plugin
+
+        :param plugin: The plugin object
+        :return: core or addon
+        '''
+
+        return self.CORE_TIER if plugin.is_core_plugin() else self.ADDON_TIER
+
+
+    def __contains__(self, plugin_name):
+        return plugin_name.lower() in self.__plugins
+
+
+    def __len__(self):
+        return len(self.__plugins)
@@ -0,0 +1,302 @@
+'''
+SharedChannel - Shared memory ring buffer for passing binary data between plugins without copying
+'''
+
+# Import libs
+import multiprocessing
+import struct
+import threading
+from multiprocessing.shared_memory import SharedMemory
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class SharedChannel(Logger):
+    '''
+    A fixed number of fixed size slots in a multiprocessing shared memory block, used as a ring buffer. Producers
+    reserve a slot and write straight into its memoryview, consumers receive a memoryview of the written bytes and
+    release the slot once done with it, so data is never copied or serialized on its way through the channel.
+    Slot hand over is synchronized with multiprocessing semaphores, so the same channel works between threads and,
+    once passed to a child process started with Config.PROCESS_START_METHOD, between processes. Each thread must
+    commit or release the slot it holds before reserving or receiving the next one
+    '''
+
+    DEFAULT_SLOT_COUNT = 16
+
+    # Shared write and read counters, each only updated by its own side, and per slot header of the written length
+    COUNTER = struct.Struct("Q")
+    WRITE_COUNTER = 0
+    READ_COUNTER = 8
+    SLOT_HEADER = struct.Struct("Q")
+    SLOT_ALIGNMENT = 64
+
+    def __init__(self, name, slot_size, slot_count=DEFAULT_SLOT_COUNT):
+        '''
+        Constructor. Creates the shared memory block
+
+        :param name: The channel name
+        :param slot_size: Maximum number of bytes written to a slot
+        :param slot_count: The number of slots
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(slot_size, int) or slot_size < 1:
+            raise ValueError("slot_size must be a positive integer")
+        if not isinstance(slot_count, int) or slot_count < 1:
+            raise ValueError("slot_count must be a positive integer")
+
+        self.__name = name
+        self.__slot_size = slot_size
+        self.__slot_count = slot_count
+        # Slots start on cache line boundaries so producers and consumers don't share lines
+        self.__stride = -(-(self.SLOT_HEADER.size + slot_size) // self.SLOT_ALIGNMENT) * self.SLOT_ALIGNMENT
+        context = multiprocessing.get_context(Config.PROCESS_START_METHOD)
+        self.__free = context.Semaphore(slot_count)
+        self.__filled = context.Semaphore(0)
+        self.__write_lock = context.Lock()
+        self.__read_lock = context.Lock()
+        self.__owner = True
+
+        self.__memory = SharedMemory(create=True, size=self.SLOT_ALIGNMENT + slot_count * self.__stride)
+        self.__buffer = self.__memory.buf
+        self.COUNTER.pack_into(self.__buffer, self.WRITE_COUNTER, 0)
+        self.COUNTER.pack_into(self.__buffer, self.READ_COUNTER, 0)
+        # The slots reserved and received by each thread
+        self.__held = threading.local()
+
+        self.logger.debug(
+            "Created channel '%s' of %s %s byte slots in '%s'", name, slot_count, slot_size, self.__memory.name
+        )
+
+
+    def __getstate__(self):
+        '''
+        Pickles the channel for a child process, which attaches to the same shared memory block and semaphores.
+        Only possible while spawning the process
+        '''
+
+        return {
+            "name": self.__name,
+            "slot_size": self.__slot_size,
+            "slot_count": self.__slot_count,
+            "memory": self.__memory.name,
+            "semaphores": (self.__free, self.__filled, self.__write_lock, self.__read_lock)
+        }
+
+
+    def __setstate__(self, state):
+        '''
+        Attaches an unpickled channel to its shared memory block
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        self.__name = state["name"]
+        self.__slot_size = state["slot_size"]
+        self.__slot_count = state["slot_count"]
+        self.__stride = -(-(self.SLOT_HEADER.size + self.__slot_size) // self.SLOT_ALIGNMENT) * self.SLOT_ALIGNMENT
+        self.__free, self.__filled, self.__write_lock, self.__read_lock = state["semaphores"]
+        self.__owner = False
+        self.__memory = SharedMemory(name=state["memory"])
+        self.__buffer = self.__memory.buf
+        # The slots reserved and received by each thread
+        self.__held = threading.local()
+
+
+    def __repr__(self):
+        return "<SharedChannel %s %sx%s depth=%s>" % (
+            self.__name, self.__slot_count, self.__slot_size, self.get_depth() if self.__buffer is not None else "-"
+        )
+
+
+    def __slot_offset(self, index):
+        '''
+        Gets the offset of a slot's header in the shared memory block
+
+        :param index: Write or read counter
+        :return: Byte offset
+        '''
+
+        return self.SLOT_ALIGNMENT + (index % self.__slot_count) * self.__stride
+
+
+    def reserve(self, timeout=None):
+        '''
+        Reserves the next free slot for writing. Must be followed by commit()
+
+        :param timeout: Optional number of seconds to wait for a free slot. Waits indefinitely if None
+        :return: Writable memoryview of the slot, slot_size bytes long
+        :raise: TimeoutError if no slot was free within the timeout
+        '''
+
+        if getattr(self.__held, "writing", None) is not None:
+            raise RuntimeError("The previously reserved slot of '%s' hasn't been committed" % self.__name)
+        if not self.__free.acquire(timeout=timeout):
+            raise TimeoutError("No free slot in '%s' within %ss" % (self.__name, timeout))
+        self.__write_lock.acquire()
+
+        offset = self.__slot_offset(self.COUNTER.unpack_from(self.__buffer, self.WRITE_COUNTER)[0])
+        offset += self.SLOT_HEADER.size
+        self.__held.writing = self.__buffer[offset:offset + self.__slot_size]
+        return self.__held.writing
+
+
+    def commit(self, length):
+        '''
+        Publishes the reserved slot to consumers. The slot's memoryview is released and can't be used afterwards
+
+        :param length: The number of bytes written to the slot
+        '''
+
+        if getattr(self.__held, "writing", None) is None:
+            raise RuntimeError("No slot of '%s' is reserved" % self.__name)
+        if not 0 <= length <= self.__slot_size:
+            raise ValueError("length must be between 0 and the slot size (%s)" % self.__slot_size)
+
+        self.__held.writing.release()
+        self.__held.writing = None
+        written = self.COUNTER.unpack_from(self.__buffer, self.WRITE_COUNTER)[0]
+        self.SLOT_HEADER.pack_into(self.__buffer, self.__slot_offset(written), length)
+        self.COUNTER.pack_into(self.__buffer, self.WRITE_COUNTER, written + 1)
+
+        self.__write_lock.release()
+        self.__filled.release()
+
+
+    def send(self, data, timeout=None):
+        '''
+        Copies a bytes-like object into the next free slot and commits it
+
+        :param data: bytes-like object, at most slot_size bytes long
+        :param timeout: Optional number of seconds to wait for a free slot. Waits indefinitely if None
+        :raise: TimeoutError if no slot was free within the timeout
+        '''
+        data = memoryview(data).cast("B")
+
+        if len(data) > self.__slot_size:
+            raise ValueError("%s bytes don't fit in the %s byte slots of '%s'" % (
+                len(data), self.__slot_size, self.__name
+            ))
+
+        slot = self.reserve(timeout)
+        slot[:len(data)] = data
+        self.commit(len(data))
+
+
+    def receive(self, timeout=None):
+        '''
+        Receives the oldest committed slot. Must be followed by release()
+
+        :param timeout: Optional number of seconds to wait for a slot. Waits indefinitely if None
+        :return: Read-only memoryview of the bytes written to the slot
+        :raise: TimeoutError if no slot was committed within the timeout
+        '''
+
+        if getattr(self.__held, "reading", None) is not None:
+            raise RuntimeError("The previously received slot of '%s' hasn't been released" % self.__name)
+        if not self.__filled.acquire(timeout=timeout):
+            raise TimeoutError("Nothing received on '%s' within %ss" % (self.__name, timeout))
+        self.__read_lock.acquire()
+
+        offset = self.__slot_offset(self.COUNTER.unpack_from(self.__buffer, self.READ_COUNTER)[0])
+        length = self.SLOT_HEADER.unpack_from(self.__buffer, offset)[0]
+        offset += self.SLOT_HEADER.size
+        self.__held.reading = self.__buffer[offset:offset + length].toreadonly()
+        return self.__held.reading
+
+
+    def release(self):
+        '''
+        Returns the received slot to producers. The slot's memoryview is released and can't be used afterwards
+        '''
+
+        if getattr(self.__held, "reading", None) is None:
+            raise RuntimeError("No slot of '%s' has been received" % self.__name)
+
+        self.__held.reading.release()
+        self.__held.reading = None
+        read = self.COUNTER.unpack_from(self.__buffer, self.READ_COUNTER)[0]
+        self.COUNTER.pack_into(self.__buffer, self.READ_COUNTER, read + 1)
+
+        self.__read_lock.release()
+        self.__free.release()
+
+
+    def close(self):
+        '''
+        Detaches from the shared memory block, and removes it if this is the channel that created it. Slots still
+        reserved or received by the calling thread are released first. Other threads must have released theirs
+        '''
+        self.trace("ENTRY")
+
+        if self.__buffer is None:
+            self.trace("EXIT - already closed")
+            return
+
+        for view in (getattr(self.__held, "writing", None), getattr(self.__held, "reading", None)):
+            if view is not None:
+                view.release()
+        self.__held.writing = self.__held.reading = None
+
+        self.__buffer.release()
+        self.__buffer = None
+        self.__memory.close()
+        if self.__owner:
+            self.__memory.unlink()
+            self.logger.debug("Removed channel '%s'", self.__name)
+
+        self.trace("EXIT")
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_name(self):
+        '''
+        Gets the channel name
+
+        :return: Channel name
+        '''
+
+        return self.__name
+
+
+    def get_slot_size(self):
+        '''
+        Gets the maximum number of bytes written to a slot
+
+        :return: Slot size
+        '''
+
+        return self.__slot_size
+
+
+    def get_slot_count(self):
+        '''
+        Gets the number of slots
+
+        :return: Slot count
+        '''
+
+        return self.__slot_count
+
+
+    def get_depth(self):
+        '''
+        Gets the number of committed slots not yet released by consumers
+
+        :return: Channel depth
+        '''
+
+        written = self.COUNTER.unpack_from(self.__buffer, self.WRITE_COUNTER)[0]
+        return written - self.COUNTER.unpack_from(self.__buffer, self.READ_COUNTER)[0]
+
+
+    def is_closed(self):
+        '''
+        Checks whether the channel has been closed
+
+        :return: True if closed, otherwise False
+        '''
+
+        return self.__buffer is None
@@ -0,0 +1,119 @@
+'''
+ShutdownReport - Outcome of a plugin deactivation
+'''
+
+class ShutdownReport():
+    '''
+    Records which plugins stopped during a deactivation, how long each took to stop and which overran their timeout
+    '''
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        self.__entries = {}
+        self.__elapsed = 0.0
+
+
+    def __repr__(self):
+        return "<ShutdownReport stopped=%s overrun=%s elapsed=%.3fs>" % (
+            self.get_stopped(), self.get_overrun(), self.__elapsed
+        )
+
+
+    def add(self, plugin_name, stopped, duration, timeout=None):
+        '''
+        Records the outcome of stopping a plugin
+
+        :param plugin_name: The name of the plugin
+        :param stopped: Boolean specifying whether the plugin stopped within its timeout
+        :param duration: Seconds from the stop signal until the plugin stopped, or until it was given up on
+        :param timeout: The number of seconds the plugin was allowed, or None if unbounded
+        '''
+
+        self.__entries[plugin_name] = {
+            "stopped": stopped,
+            "duration": duration,
+            "timeout": timeout
+        }
+
+
+    def to_dict(self):
+        '''
+        Converts the report to a dictionary
+
+        :return: Dict of report data
+        '''
+
+        return {
+            "elapsed": self.__elapsed,
+            "plugins": dict((name, dict(entry)) for name, entry in self.__entries.items())
+        }
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_stopped(self):
+        '''
+        Gets the plugins that stopped within their timeout
+
+        :return: List of plugin names
+        '''
+
+        return [name for name, entry in self.__entries.items() if entry["stopped"]]
+
+
+    def get_overrun(self):
+        '''
+        Gets the plugins that were still running when their timeout expired
+
+        :return: List of plugin names
+        '''
+
+        return [name for name, entry in self.__entries.items() if not entry["stopped"]]
+
+
+    def get_duration(self, plugin_name):
+        '''
+        Gets how long a plugin took to stop
+
+        :param plugin_name: The name of the plugin
+        :return: Seconds, or None if the plugin is not in the report
+        '''
+        entry = self.__entries.get(plugin_name)
+
+        return entry["duration"] if entry else None
+
+
+    def get_elapsed(self):
+        '''
+        Gets the total wall time of the deactivation
+
+        :return: Seconds
+        '''
+
+        return self.__elapsed
+
+
+    def is_clean(self):
+        '''
+        Checks whether every plugin stopped within its timeout
+
+        :return: True if no plugin overran, otherwise False
+        '''
+
+        return all(entry["stopped"] for entry in self.__entries.values())
+
+
+    # =======================
+    # = SETTERS
+    # =======================
+    def set_elapsed(self, elapsed):
+        '''
+        Sets the total wall time of the deactivation
+
+        :param elapsed: Seconds
+        '''
+
+        self.__elapsed = elapsed
@@ -0,0 +1,179 @@
+'''
+StartupReport - Wall and CPU timings of the plugin startup phases
+'''
+
+# Import libs
+import copy
+import json
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+class StartupReport():
+    '''
+    Records the wall and CPU time spent in each startup phase, in total and per plugin. CPU time is measured per
+    thread, so timings stay accurate for phases run concurrently (such as activation)
+    '''
+
+    DISCOVERY = "discovery"
+    PACKAGE_IMPORT = "package_import"
+    MODULE_IMPORT = "module_import"
+    INSTANTIATE = "instantiate"
+    LOAD_CONFIGURATION = "load_configuration"
+    SORT = "sort"
+    ACTIVATE = "activate"
+    READY = "ready"
+    GC_FREEZE = "gc_freeze"
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        self.__lock = Lock()
+        self.__phases = {}
+        self.__plugins = {}
+        self.__started = time.time()
+        self.__elapsed = 0.0
+
+
+    def __repr__(self):
+        return "<StartupReport elapsed=%.3fs phases=%s>" % (
+            self.__elapsed, dict((phase, round(totals["wall"], 3)) for phase, totals in self.__phases.items())
+        )
+
+
+    @contextmanager
+    def measure(self, phase, plugin_name=None):
+        '''
+        Context manager timing the enclosed block as a phase
+
+        :param phase: The name of the phase
+        :param plugin_name: Optional name of the plugin the phase belongs to
+        '''
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - wall, time.thread_time() - cpu, plugin_name)
+
+
+    def record(self, phase, wall, cpu, plugin_name=None):
+        '''
+        Records a phase timing
+
+        :param phase: The name of the phase
+        :param wall: Wall time in seconds
+        :param cpu: CPU time in seconds
+        :param plugin_name: Optional name of the plugin the phase belongs to
+        '''
+
+        with self.__lock:
+            totals = self.__phases.setdefault(phase, {"wall": 0.0, "cpu": 0.0, "count": 0})
+            totals["wall"] += wall
+            totals["cpu"] += cpu
+            totals["count"] += 1
+
+            if plugin_name is not None:
+                plugin_phases = self.__plugins.setdefault(plugin_name, {})
+                timing = plugin_phases.setdefault(phase, {"wall": 0.0, "cpu": 0.0})
+                timing["wall"] += wall
+                timing["cpu"] += cpu
+
+
+    def to_dict(self):
+        '''
+        Converts the report to a dictionary
+
+        :return: Dict of report data
+        '''
+
+        with self.__lock:
+            return {
+                "started": self.__started,
+                "elapsed": self.__elapsed,
+                "phases": copy.deepcopy(self.__phases),
+                "plugins": copy.deepcopy(self.__plugins)
+            }
+
+
+    def dump(self, path):
+        '''
+        Writes the report to a JSON file
+
+        :param path: Path of the file to write
+        '''
+
+        with open(path, "w") as report_file:
+            json.dump(self.to_dict(), report_file, indent=2, sort_keys=True)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_phase(self, phase):
+        '''
+        Gets the totals of a phase across all plugins
+
+        :param phase: The name of the phase
+        :return: Dict of wall, cpu and count, or None if the phase wasn't recorded
+        '''
+
+        with self.__lock:
+            totals = self.__phases.get(phase)
+            return dict(totals) if totals else None
+
+
+    def get_plugin(self, plugin_name):
+        '''
+        Gets the phase timings of a single plugin
+
+        :param plugin_name: The name of the plugin
+        :return: Dict of <phase>:<dict of wall and cpu>, or None if the plugin wasn't recorded
+        '''
+
+        with self.__lock:
+            phases = self.__plugins.get(plugin_name)
+            return dict((phase, dict(timing)) for phase, timing in phases.items()) if phases else None
+
+
+    def get_slowest(self, phase=None, count=10):
+        '''
+        Gets the plugins that took the most wall time
+
+        :param phase: Optional phase to rank by. Ranks by the sum of all phases if None
+        :param count: The number of plugins to return
+        :return: List of (plugin name, wall seconds) tuples, slowest first
+        '''
+
+        with self.__lock:
+            walls = [
+                (name, sum(timing["wall"] for timing_phase, timing in phases.items()
+                           if phase is None or timing_phase == phase))
+                for name, phases in self.__plugins.items()
+            ]
+
+        return sorted(walls, key=lambda item: item[1], reverse=True)[:count]
+
+
+    def get_elapsed(self):
+        '''
+        Gets the total wall time of the startup
+
+        :return: Seconds
+        '''
+
+        return self.__elapsed
+
+
+    # =======================
+    # = SETTERS
+    # =======================
+    def set_elapsed(self, elapsed):
+        '''
+        Sets the total wall time of the startup
+
+        :param elapsed: Seconds
+        '''
+
+        self.__elapsed = elapsed
@@ -0,0 +1,314 @@
+'''
+Supervisor - Detects plugins that have died and restarts them according to their restart policy
+'''
+
+# Import libs
+import time
+from threading import Condition, Event, Thread
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class Supervisor(Logger):
+    '''
+    Watches active plugins from a single monitor thread, started while plugins are being watched. Plugins report an
+    exception raised by run() as soon as it happens, waking the monitor, and the monitor also sweeps the watched
+    plugins periodically to catch worker processes that exited with an error. A plugin that has died without being
+    stopped is counted, then restarted or deactivated according to the RESTART_POLICY of its Config.py: never
+    deactivates it, always restarts it after MIN_RESTART_DELAY and backoff restarts it after a delay that doubles with
+    each consecutive failure, up to RESTART_MAX_BACKOFF. The failure streak ends once a plugin stays up for
+    RESTART_MAX_BACKOFF seconds. Restarts run outside the supervisor's lock and wait a bounded time for the plugin to
+    report ready, so a plugin failing again before it does never stalls the supervisor
+    '''
+
+    NEVER = "never"
+    ALWAYS = "always"
+    BACKOFF = "backoff"
+    RESTART_POLICIES = [NEVER, ALWAYS, BACKOFF]
+
+    DEFAULT_BACKOFF = 1.0
+    DEFAULT_MAX_BACKOFF = 60.0
+
+    # Seconds between sweeps of the watched plugins
+    DEFAULT_INTERVAL = 1.0
+
+    # Seconds a failed plugin is given to finish exiting its worker before being restarted or deactivated
+    EXIT_TIMEOUT = 1.0
+
+    # Seconds a restarted plugin is given to report ready, unless PlugSy has an activation timeout
+    DEFAULT_READY_TIMEOUT = 30.0
+
+    # Seconds waited before any restart, so a plugin failing straight away isn't restarted in a tight loop
+    MIN_RESTART_DELAY = 0.1
+
+    def __init__(self, restart, disable, interval=DEFAULT_INTERVAL, ready_timeout=DEFAULT_READY_TIMEOUT):
+        '''
+        Constructor
+
+        :param restart: Callable activating a failed plugin again. Passed the plugin object and the ready timeout
+        :param disable: Callable deactivating a failed plugin that won't be restarted. Passed the plugin object
+        :param interval: Seconds between sweeps of the watched plugins
+        :param ready_timeout: Seconds a restarted plugin is given to report ready
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not interval > 0:
+            raise ValueError("interval must be a positive number of seconds")
+
+        self.__restart = restart
+        self.__disable = disable
+        self.__interval = interval
+        self.__ready_timeout = ready_timeout
+        self.__lock = Condition()
+        # Lowercase names of the failed plugins being restarted or disabled. Unwatching them waits for that to finish
+        self.__busy = set()
+        self.__wake = Event()
+        self.__thread = None
+        # Lowercase plugin names to the watched plugin, when it was (re)started and when it's due to be restarted
+        self.__watched = {}
+        # Statistics by lowercase plugin name. Kept once plugins are unwatched, and never reference plugin objects
+        self.__stats = {}
+
+
+    def watch(self, plugins):
+        '''
+        Starts watching active plugins, starting the monitor thread if it isn't running. Plugins notify the supervisor
+        when they fail
+
+        :param plugins: List of plugin objects
+        '''
+
+        with self.__lock:
+            for plugin in plugins:
+                key = plugin.get_name().lower()
+                plugin.set_failure_listener(self.notify)
+                self.__watched[key] = {"plugin": plugin, "started": time.monotonic(), "restart_at": None}
+                self.__stats.setdefault(key, self.empty_stats())
+
+            if self.__watched and self.__thread is None:
+                self.__thread = Thread(target=self.__run, name="plugsy-supervisor", daemon=True)
+                self.__thread.start()
+
+        # Pick up plugins that failed before they were watched
+        self.notify()
+
+
+    def unwatch(self, plugins):
+        '''
+        Stops watching plugins. Must be called before plugins are deactivated, and waits for any restart of them in
+        progress, so they're never restarted once being deactivated. The monitor thread exits once no plugins are
+        watched
+
+        :param plugins: List of plugin objects
+        '''
+        keys = set(plugin.get_name().lower() for plugin in plugins)
+
+        with self.__lock:
+            self.__lock.wait_for(lambda: not keys & self.__busy)
+            for plugin in plugins:
+                watched = self.__watched.get(plugin.get_name().lower())
+                if watched is not None and watched["plugin"] is plugin:
+                    del self.__watched[plugin.get_name().lower()]
+                plugin.set_failure_listener(None)
+        self.notify()
+
+
+    def notify(self):
+        '''
+        Wakes the monitor thread to check the watched plugins. Called by plugins whose run() raised an exception.
+        Never blocks
+        '''
+
+        self.__wake.set()
+
+
+    def __run(self):
+        '''
+        Monitor thread body. Checks the watched plugins whenever woken, a restart is due or the sweep interval passes
+        '''
+        self.trace("ENTRY")
+
+        while True:
+            self.__wake.wait(self.__get_wait())
+            self.__wake.clear()
+
+            with self.__lock:
+                if not self.__watched:
+                    self.__thread = None
+                    break
+
+                failed = []
+                due = []
+                for key, watched in self.__watched.items():
+                    if watched["restart_at"] is None and self.__has_failed(watched["plugin"]):
+                        failed.append((key, watched))
+                    elif watched["restart_at"] is not None and watched["restart_at"] <= time.monotonic():
+                        watched["restart_at"] = None
+                        due.append((key, watched))
+                self.__busy.update(key for key, _ in failed + due)
+
+            try:
+                for key, watched in failed:
+                    self.__on_failure(key, watched, watched["plugin"].get_failure())
+                for key, watched in due:
+                    self.__restart_plugin(key, watched)
+            finally:
+                with self.__lock:
+                    self.__busy.clear()
+                    self.__lock.notify_all()
+
+        self.trace("EXIT")
+
+
+    def __get_wait(self):
+        '''
+        Gets how long the monitor thread may wait before the next check
+
+        :return: Seconds until the next sweep, or the next restart if that's sooner
+        '''
+        wait = self.__interval
+
+        for watched in list(self.__watched.values()):
+            if watched["restart_at"] is not None:
+                wait = min(wait, max(0.0, watched["restart_at"] - time.monotonic()))
+        return wait
+
+
+    @staticmethod
+    def __has_failed(plugin):
+        '''
+        Checks whether an active plugin has died without being stopped
+
+        :param plugin: The plugin object
+        :return: True if the plugin has failed, otherwise False
+        '''
+
+        return plugin.is_activated() and not plugin.stop_event.is_set() and plugin.get_failure() is not None
+
+
+    def __on_failure(self, key, watched, failure):
+        '''
+        Records a plugin failure and applies its restart policy. Called by the monitor thread without the lock held
+
+        :param key: Lowercase plugin name
+        :param watched: The plugin's watch entry
+        :param failure: The exception the plugin failed with
+        '''
+        plugin = watched["plugin"]
+        now = time.monotonic()
+
+        with self.__lock:
+            stats = self.__stats[key]
+            # A plugin that stayed up long enough ends its failure streak
+            if now - watched["started"] >= plugin.get_max_restart_backoff():
+                stats["consecutive_failures"] = 0
+            stats["failures"] += 1
+            stats["consecutive_failures"] += 1
+            stats["last_failure"] = "%s: %s" % (failure.__class__.__name__, failure)
+            stats["last_failure_time"] = time.time()
+            last_failure = stats["last_failure"]
+            consecutive_failures = stats["consecutive_failures"]
+
+        # Only restart plugins whose worker has exited
+        plugin.join(self.EXIT_TIMEOUT)
+        policy = plugin.get_restart_policy()
+        if policy == self.NEVER or plugin.is_alive():
+            self.logger.error("'%s' failed with %s, and won't be restarted", plugin.get_name(), last_failure)
+            with self.__lock:
+                if self.__watched.get(key) is watched:
+                    del self.__watched[key]
+            plugin.set_failure_listener(None)
+            try:
+                self.__disable(plugin)
+            except Exception:
+                self.logger.error("Could not deactivate failed plugin '%s'", plugin.get_name(), exc_info=True)
+            return
+
+        delay = self.MIN_RESTART_DELAY
+        if policy == self.BACKOFF:
+            delay = max(delay, min(
+                plugin.get_restart_backoff() * 2 ** (consecutive_failures - 1), plugin.get_max_restart_backoff()
+            ))
+        with self.__lock:
+            watched["restart_at"] = now + delay
+        self.logger.error("'%s' failed with %s. Restarting in %.1fs", plugin.get_name(), last_failure, delay)
+
+
+    def __restart_plugin(self, key, watched):
+        '''
+        Restarts a failed plugin. A restart that fails counts as another failure. Called by the monitor thread
+        without the lock held
+
+        :param key: Lowercase plugin name
+        :param watched: The plugin's watch entry
+        '''
+        plugin = watched["plugin"]
+        watched["started"] = time.monotonic()
+
+        try:
+            self.__restart(plugin, self.__ready_timeout)
+        except Exception as ex:
+            self.logger.error("Could not restart '%s': %s", plugin.get_name(), ex)
+            # Stop whatever was started, so the next attempt starts afresh
+            plugin.stop()
+            self.__on_failure(key, watched, ex)
+            return
+
+        with self.__lock:
+            self.__stats[key]["restarts"] += 1
+            restarts = self.__stats[key]["restarts"]
+        self.logger.info("Restarted '%s' (%s restarts)", plugin.get_name(), restarts)
+
+
+    @staticmethod
+    def empty_stats():
+        '''
+        Creates empty plugin statistics
+
+        :return: Dict of failures, consecutive_failures, restarts, last_failure and last_failure_time
+        '''
+
+        return {
+            "failures": 0, "consecutive_failures": 0, "restarts": 0, "last_failure": None, "last_failure_time": None
+        }
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_stats(self, plugin_name=None):
+        '''
+        Gets the failure and restart statistics of the plugins watched so far
+
+        :param plugin_name: Optional plugin name to restrict the statistics to
+        :return: Dict of plugin names to dicts of failures, consecutive_failures, restarts, last_failure (exception
+            type and message) and last_failure_time (epoch seconds). A single plugin's dict, or None if it has never
+            been watched, if plugin_name is specified
+        '''
+
+        with self.__lock:
+            if plugin_name is not None:
+                stats = self.__stats.get(plugin_name.lower())
+                return dict(stats) if stats is not None else None
+            return {key: dict(stats) for key, stats in self.__stats.items()}
+
+
+    def get_watched(self):
+        '''
+        Gets the names of the watched plugins
+
+        :return: List of (lowercase) plugin names
+        '''
+
+        return list(self.__watched)
+
+
+    def is_running(self):
+        '''
+        Checks whether the monitor thread is running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__thread is not None
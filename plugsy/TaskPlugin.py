@@ -0,0 +1,139 @@
+'''
+Defines the Abstract Plugin that periodic task plugins must derive from
+'''
+
+# Import package modules
+from .AbstractPlugin import AbstractPlugin
+
+class TaskPlugin(AbstractPlugin):
+    '''
+    Plugin that does a unit of work each tick instead of running a loop of its own. Ticks are executed on the shared
+    thread pool of its PlugSy object's TaskScheduler, every INTERVAL seconds (set in the plugin's Config.py) and
+    whenever trigger() is called. Plugins without an INTERVAL only tick when triggered. Activation, readiness,
+    dependencies and deactivation otherwise behave exactly as for threaded plugins
+    '''
+
+    def __init__(self, plugsy, name=None):
+        '''
+        Constructor
+
+        :param plugsy: Parent PlugSy object
+        :param name: The name of the plugin. Optional, overrides package name
+        '''
+        AbstractPlugin.__init__(self, plugsy, name)
+
+        self.__interval = None
+        self.__scheduler = None
+        self.__task = None
+
+
+    def tick(self):
+        '''
+        Plugin tick method holding the work done on each tick. Called on a thread pool worker
+        Must be overriden by derived classes (plugins)
+
+        :raises: NotImplementedError If plugin hasn't overridden method
+        '''
+
+        self.logger.error("Plugin does not have a tick() method")
+        raise NotImplementedError(
+            "Abstract tick() method must be implemented by '%s'" %
+            self.__class__.__name__
+        )
+
+
+    def load_configuration(self, configuration):
+        '''
+        Loads the plugin configuration into the plugin object
+
+        :param configuration: Plugin configuration module
+        '''
+        self.trace("ENTRY")
+
+        AbstractPlugin.load_configuration(self, configuration)
+
+        # Optional number of seconds between ticks
+        self.__interval = getattr(configuration, "INTERVAL", None)
+        if self.__interval is not None and self.__interval <= 0:
+            raise ValueError("INTERVAL must be a positive number of seconds")
+        self.trace("EXIT")
+
+
+    def start(self):
+        '''
+        Schedules the plugin's ticks, in place of a worker thread
+
+        :raise: RuntimeError if the plugin is already running
+        '''
+
+        if self.is_alive():
+            raise RuntimeError("Plugin '%s' is already running" % self.get_name())
+
+        self.__scheduler = self.plugsy.get_task_scheduler()
+        self.__task = self.__scheduler.schedule(self, self.__interval)
+
+
+    def stop(self):
+        '''
+        Plugin stop method. Sets the stop event and cancels future ticks
+        '''
+        self.trace("ENTRY")
+
+        AbstractPlugin.stop(self)
+        if self.__task is not None:
+            self.__scheduler.unschedule(self.__task)
+
+        self.trace("EXIT")
+
+
+    def trigger(self):
+        '''
+        Requests a tick as soon as possible, regardless of the interval. Skipped if a tick is already running
+        '''
+
+        if self.__task is not None:
+            self.__scheduler.trigger(self.__task)
+
+
+    def is_alive(self):
+        '''
+        Checks whether the plugin is scheduled or a tick is still running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__task is not None and (not self.__task.is_cancelled() or self.__task.is_pending())
+
+
+    def join(self, timeout=None):
+        '''
+        Waits for the tick in progress, if any, to finish
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        '''
+
+        if self.__task is not None:
+            self.__task.wait_until_idle(timeout)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_interval(self):
+        '''
+        Gets the number of seconds between ticks
+
+        :return: Seconds, or None if the plugin only ticks when triggered
+        '''
+
+        return self.__interval
+
+
+    def get_task_stats(self):
+        '''
+        Gets the plugin's tick statistics
+
+        :return: Dict of runs, skipped, overruns and last_duration, or None if the plugin hasn't been started
+        '''
+
+        return self.__task.get_stats() if self.__task is not None else None
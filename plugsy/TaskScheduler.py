@@ -0,0 +1,399 @@
+'''
+TaskScheduler - Runs the ticks of task plugins on a shared thread pool
+'''
+
+# Import libs
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Event, Thread
+
+# Import package modules
+from . import Config
+from .utils import Logger
+
+class TaskScheduler(Logger):
+    '''
+    Schedules task plugins on a single timer thread and executes their ticks on a bounded, shared ThreadPoolExecutor.
+    A plugin never has more than one tick queued or running: a tick that falls due while the previous one hasn't
+    finished is skipped and counted, as are ticks missed entirely because the scheduler fell behind. Ticks that take
+    longer than the plugin's interval are counted as overruns
+    '''
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        '''
+        Constructor
+
+        :param max_workers: Maximum number of ticks executed concurrently
+        '''
+        Logger.__init__(self, name="%s.%s" % (Config.FULL_NAME, self.__class__.__name__))
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.__max_workers = max_workers
+        self.__condition = Condition()
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__tasks = {}
+        self.__executor = None
+        self.__timer = None
+        self.__running = False
+
+
+    def start(self):
+        '''
+        Starts the timer thread and the thread pool
+        '''
+        self.trace("ENTRY")
+
+        with self.__condition:
+            if self.__running:
+                self.trace("EXIT - already running")
+                return
+
+            self.__running = True
+            self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="plugsy-task")
+            self.__timer = Thread(target=self.__run_timer, name="plugsy-task-scheduler", daemon=True)
+            self.__timer.start()
+
+        self.trace("EXIT")
+
+
+    def stop(self, timeout=None):
+        '''
+        Stops the timer thread and the thread pool. Ticks already running are allowed to finish
+
+        :param timeout: Optional number of seconds to wait for the timer thread to finish
+        '''
+        self.trace("ENTRY")
+
+        with self.__condition:
+            if not self.__running:
+                self.trace("EXIT - not running")
+                return
+
+            self.__running = False
+            executor, timer = self.__executor, self.__timer
+            self.__condition.notify()
+
+        timer.join(timeout)
+        executor.shutdown(wait=False)
+        self.trace("EXIT")
+
+
+    def schedule(self, plugin, interval):
+        '''
+        Schedules a plugin's ticks. The first tick is due immediately
+
+        :param plugin: The task plugin. Its tick() method is called on each tick
+        :param interval: Seconds between ticks, or None to only tick when triggered
+        :return: ScheduledTask tracking the plugin's ticks
+        '''
+        task = ScheduledTask(plugin, interval)
+
+        with self.__condition:
+            self.__tasks[plugin.get_name()] = task
+            self.__push(task, time.monotonic(), periodic=interval is not None)
+
+        self.logger.debug("Scheduled '%s' every %ss", plugin.get_name(), interval)
+        return task
+
+
+    def unschedule(self, task):
+        '''
+        Cancels a task's future ticks. A tick that's already running is allowed to finish
+
+        :param task: ScheduledTask to cancel
+        '''
+
+        with self.__condition:
+            if self.__tasks.get(task.get_name()) is task:
+                del self.__tasks[task.get_name()]
+            task.cancel()
+
+        self.logger.debug("Unscheduled '%s'", task.get_name())
+
+
+    def trigger(self, task):
+        '''
+        Makes a task's next tick due immediately
+
+        :param task: ScheduledTask to tick
+        '''
+
+        with self.__condition:
+            if not task.is_cancelled():
+                self.__push(task, time.monotonic(), periodic=False)
+
+
+    def __push(self, task, due, periodic):
+        '''
+        Queues a tick of a task. Condition must be held by the caller
+
+        :param task: ScheduledTask
+        :param due: Monotonic time the tick is due
+        :param periodic: Boolean specifying whether the tick is part of the task's interval schedule, and should
+            queue the next one. False for triggered ticks
+        '''
+
+        heapq.heappush(self.__queue, (due, next(self.__sequence), periodic, task))
+        self.__condition.notify()
+
+
+    def __run_timer(self):
+        '''
+        Timer thread loop. Dispatches each tick to the thread pool once it falls due
+        '''
+
+        with self.__condition:
+            while self.__running:
+                if not self.__queue:
+                    self.__condition.wait()
+                    continue
+
+                due, _, periodic, task = self.__queue[0]
+                now = time.monotonic()
+                if due > now:
+                    self.__condition.wait(due - now)
+                    continue
+
+                heapq.heappop(self.__queue)
+                if task.is_cancelled():
+                    continue
+
+                # The next tick is queued before this one runs so the tick rate doesn't drift with tick duration
+                if periodic:
+                    interval = task.get_interval()
+                    missed = int((now - due) // interval)
+                    if missed:
+                        task.add_skipped(missed)
+                    self.__push(task, due + (missed + 1) * interval, periodic=True)
+
+                if task.is_pending():
+                    task.add_skipped(1)
+                    self.logger.debug("Skipped tick of '%s' as its previous tick hasn't finished", task.get_name())
+                    continue
+
+                task.set_pending()
+                self.__executor.submit(self.__tick, task)
+
+
+    def __tick(self, task):
+        '''
+        Runs a single tick of a task on the thread pool
+
+        :param task: ScheduledTask
+        '''
+        started = time.monotonic()
+
+        try:
+            task.get_plugin().tick()
+        except Exception:
+            task.get_plugin().logger.error("Plugin tick() raised an exception", exc_info=True)
+        finally:
+            duration = time.monotonic() - started
+            overran = task.finish_tick(duration)
+
+        # Only the first overrun of each task is warned about, as a task that overruns tends to keep doing so
+        if overran:
+            log = self.logger.warning if task.get_stats()["overruns"] == 1 else self.logger.debug
+            log("Tick of '%s' took %.3fs, overrunning its %ss interval", task.get_name(), duration, task.get_interval())
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_max_workers(self):
+        '''
+        Gets the maximum number of concurrently executed ticks
+
+        :return: Max worker count
+        '''
+
+        return self.__max_workers
+
+
+    def get_task_count(self):
+        '''
+        Gets the number of scheduled tasks
+
+        :return: Task count
+        '''
+
+        with self.__condition:
+            return len(self.__tasks)
+
+
+    def is_running(self):
+        '''
+        Checks whether the scheduler is running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__running
+
+
+# ==========================
+# = ScheduledTask Class
+# ==========================
+class ScheduledTask():
+    '''
+    The scheduling state and tick statistics of a single task plugin
+    '''
+
+    def __init__(self, plugin, interval):
+        '''
+        Constructor
+
+        :param plugin: The task plugin
+        :param interval: Seconds between ticks, or None to only tick when triggered
+        '''
+        self.__plugin = plugin
+        self.__interval = interval
+        self.__pending = False
+        self.__cancelled = False
+        self.__idle = Event()
+        self.__idle.set()
+        self.__runs = 0
+        self.__skipped = 0
+        self.__overruns = 0
+        self.__last_duration = None
+
+
+    def __repr__(self):
+        return "<ScheduledTask %s runs=%s skipped=%s overruns=%s>" % (
+            self.get_name(), self.__runs, self.__skipped, self.__overruns
+        )
+
+
+    def cancel(self):
+        '''
+        Marks the task as cancelled, so no further ticks are dispatched
+        '''
+
+        self.__cancelled = True
+
+
+    def finish_tick(self, duration):
+        '''
+        Records the completion of a tick
+
+        :param duration: Seconds the tick took
+        :return: True if the tick overran the interval, otherwise False
+        '''
+        overran = self.__interval is not None and duration > self.__interval
+
+        self.__runs += 1
+        self.__last_duration = duration
+        if overran:
+            self.__overruns += 1
+
+        self.__pending = False
+        self.__idle.set()
+        return overran
+
+
+    def add_skipped(self, count):
+        '''
+        Counts skipped ticks
+
+        :param count: The number of ticks skipped
+        '''
+
+        self.__skipped += count
+
+
+    def wait_until_idle(self, timeout=None):
+        '''
+        Waits until no tick is queued or running
+
+        :param timeout: Optional number of seconds to wait. Waits indefinitely if None
+        :return: True if idle, otherwise False
+        '''
+
+        return self.__idle.wait(timeout)
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_plugin(self):
+        '''
+        Gets the task plugin
+
+        :return: Plugin object
+        '''
+
+        return self.__plugin
+
+
+    def get_name(self):
+        '''
+        Gets the name of the task plugin
+
+        :return: Plugin name
+        '''
+
+        return self.__plugin.get_name()
+
+
+    def get_interval(self):
+        '''
+        Gets the seconds between ticks
+
+        :return: Seconds, or None if the task only ticks when triggered
+        '''
+
+        return self.__interval
+
+
+    def get_stats(self):
+        '''
+        Gets the tick statistics
+
+        :return: Dict of runs, skipped, overruns and last_duration
+        '''
+
+        return {
+            "runs": self.__runs,
+            "skipped": self.__skipped,
+            "overruns": self.__overruns,
+            "last_duration": self.__last_duration
+        }
+
+
+    def is_pending(self):
+        '''
+        Checks whether a tick is queued or running on the thread pool
+
+        :return: True if pending, otherwise False
+        '''
+
+        return self.__pending
+
+
+    def is_cancelled(self):
+        '''
+        Checks whether the task has been cancelled
+
+        :return: True if cancelled, otherwise False
+        '''
+
+        return self.__cancelled
+
+
+    # =======================
+    # = SETTERS
+    # =======================
+    def set_pending(self):
+        '''
+        Marks a tick as queued on the thread pool
+        '''
+
+        self.__pending = True
+        self.__idle.clear()
@@ -32,7 +32,7 @@ class Plugin(Logger):
             self,
             name="%s.sdk.%s.%s" % (Config.FULL_NAME, self.__class__.__name__, name)
         )
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         self.__plugins_dir_path = plugins_dir_path
         self.__name = name
         self.__home = None
@@ -49,17 +49,17 @@ class Plugin(Logger):
 
         # Load plugin config
         if plugin_type is not None and self.does_plugin_exist():
-            self.logger.debug("Plugin '%s' already exists. Loading" % self.__name)
+            self.logger.debug("Plugin '%s' already exists. Loading", self.__name)
             self.__load_plugin_config()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def create(self):
         '''
         Creates the plugin
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Check core plugin is set
         if self.__is_core_plugin is None:
@@ -76,7 +76,7 @@ class Plugin(Logger):
             self.__home = os.path.join(self.__plugins_dir_path, "core", self.__name)
         else:
             self.__home = os.path.join(self.__plugins_dir_path, "addon", self.__name)
-        self.logger.debug("Plugin home set as '%s'" % self.__home)
+        self.logger.debug("Plugin home set as '%s'", self.__home)
 
         # Create home
         try:
@@ -90,8 +90,8 @@ class Plugin(Logger):
         self.__create_config()
         self.__create_class_file()
 
-        self.logger.info("Plugin '%s' created at '%s'" % (self.__name, self.__home))
-        self.logger.debug("EXIT")
+        self.logger.info("Plugin '%s' created at '%s'", self.__name, self.__home)
+        self.trace("EXIT")
 
 
     def does_plugin_exist(self):
@@ -100,21 +100,21 @@ class Plugin(Logger):
 
         :return: True if the plugin exists, otherwise False
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Check core
         plugin_path = os.path.join(self.__plugins_dir_path, "core", self.__name)
         if os.path.isdir(plugin_path):
-            self.logger.debug("EXIT with True (core)")
+            self.trace("EXIT with True (core)")
             return True
 
         # Check addon
         plugin_path = os.path.join(self.__plugins_dir_path, "addon", self.__name)
         if os.path.isdir(plugin_path):
-            self.logger.debug("EXIT with True (addon)")
+            self.trace("EXIT with True (addon)")
             return True
 
-        self.logger.debug("EXIT with False")
+        self.trace("EXIT with False")
         return False
 
 
@@ -122,7 +122,7 @@ class Plugin(Logger):
         '''
         Deletes the plugin
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Check plugin exists
         if not self.does_plugin_exist():
@@ -143,17 +143,17 @@ class Plugin(Logger):
             self.__home = os.path.join(self.__plugins_dir_path, "core", self.__name)
         else:
             self.__home = os.path.join(self.__plugins_dir_path, "addon", self.__name)
-        self.logger.debug("Plugin exists at '%s'" % self.__home)
+        self.logger.debug("Plugin exists at '%s'", self.__home)
 
         shutil.rmtree(self.__home)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_init(self):
         '''
         Creates the Plugin __init__.py
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         template_path = os.path.join(os.path.dirname(__file__), self.TEMPLATE_PLUGIN_NAME, "__init__.py")
 
         # Read init
@@ -164,14 +164,14 @@ class Plugin(Logger):
         with open(os.path.join(self.__home, "__init__.py"), "w") as new_init_file:
             new_init_file.write(new_init_contents)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_config(self):
         '''
         Create the plugins Config.py
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         template_path = os.path.join(os.path.dirname(__file__), self.TEMPLATE_PLUGIN_NAME, "Config.py")
 
         # Read config
@@ -182,14 +182,14 @@ class Plugin(Logger):
         with open(os.path.join(self.__home, "Config.py"), "w") as new_config_file:
             new_config_file.write(new_config_contents)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_class_file(self):
         '''
         Creates the main class file of the Plugin
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         template_path = os.path.join(os.path.dirname(__file__), self.TEMPLATE_PLUGIN_NAME, "%s.py" % self.TEMPLATE_PLUGIN_NAME)
 
         # Read plugin class
@@ -200,13 +200,13 @@ class Plugin(Logger):
         with open(os.path.join(self.__home, "%s.py" % self.__name), "w") as new_class_file:
             new_class_file.write(new_class_contents)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
     def __load_plugin_config(self):
         '''
         Loads the plugin config contents
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Set subpackage name
         if self.__is_core_plugin:
@@ -221,7 +221,7 @@ class Plugin(Logger):
             "Config"
         ))
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
 
@@ -234,8 +234,7 @@ class Plugin(Logger):
 
         :return: Plugin name
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__name
 
     def get_description(self):
@@ -244,8 +243,7 @@ class Plugin(Logger):
 
         :return: Plugin description
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__description
 
     def get_version(self):
@@ -254,8 +252,7 @@ class Plugin(Logger):
 
         :return: Plugin version
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__version
 
     def get_author(self):
@@ -264,8 +261,7 @@ class Plugin(Logger):
 
         :return: Plugin author
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__author
 
     def get_dependencies(self):
@@ -274,8 +270,7 @@ class Plugin(Logger):
 
         :return: Plugin dependencies
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__dependencies
 
 
@@ -285,8 +280,7 @@ class Plugin(Logger):
 
         :return: Home dir
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__home
 
     def is_core_plugin(self):
@@ -295,8 +289,7 @@ class Plugin(Logger):
 
         :return: True or False
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("EXIT")
+
         return self.__is_core_plugin
 
 
@@ -309,8 +302,8 @@ class Plugin(Logger):
 
         :param core: True of False
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("Setting plugin as core: %s" % core)
+        self.trace("ENTRY")
+        self.logger.debug("Setting plugin as core: %s", core)
 
         if core:
             self.__is_core_plugin = True
@@ -323,6 +316,6 @@ class Plugin(Logger):
         else:
             self.__home = os.path.join(self.__plugins_dir_path, "addon", self.__name)
 
-        self.logger.debug("Plugin home set to '%s'" % self.__home)
+        self.logger.debug("Plugin home set to '%s'", self.__home)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
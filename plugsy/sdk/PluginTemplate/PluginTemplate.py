@@ -3,9 +3,6 @@ Plugsy - PluginTemplate
 Generated by PlugSy SDK
 '''
 
-#Import libs
-import time
-
 # Import Package and PlugSy Modules
 from plugsy.AbstractPlugin import AbstractPlugin
 
@@ -27,11 +24,13 @@ class PluginTemplate(AbstractPlugin):
         '''
         Main run method.
         '''
-        self.logger.debug("ENTRY!")
+        self.trace("ENTRY!")
         self.logger.info("PluginTemplate running!")
 
-        while not self.stop_event.is_set():
-            time.sleep(0.1)
+        # Blocks until woken by self.wake() or the timeout passes. Returns False as soon as the plugin is stopped
+        while self.wait_for_work(timeout=1.0):
+            # Do work here
+            pass
 
         self.logger.info("PluginTemplate stopping!")
-        self.logger.debug("EXIT!")
+        self.trace("EXIT!")
@@ -38,21 +38,21 @@ class Sdk(Logger):
         # Init Plugsy and logger
         self.__plugsy = Plugsy(debug_level=debug_level, debug_log_path=debug_log_path)
         Logger.__init__(self, name="%s.sdk" % Config.FULL_NAME)
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.__plugins = {}
         # Check plugins home exists
         if not os.path.isdir(plugins_home_path):
             raise PluginsHomeNotFound(plugins_home_path)
 
-        self.logger.info("Setting plugins home to '%s'" % plugins_home_path)
+        self.logger.info("Setting plugins home to '%s'", plugins_home_path)
         self.__plugins_dir_path = plugins_home_path
 
         self.__init_plugins_home()
 
         # Add plugins home dir to path
         sys.path.append(plugins_home_path)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __init_plugins_home(self):
@@ -60,7 +60,7 @@ class Sdk(Logger):
         Checks the plugin's home directory is initialised, or initialises if not. addon and core packages
         are created if they don't exist
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         plugins_init_path = os.path.join(self.__plugins_dir_path, "__init__.py")
         addon_package_path = os.path.join(self.__plugins_dir_path, "addon")
         core_package_path = os.path.join(self.__plugins_dir_path, "core")
@@ -78,12 +78,12 @@ class Sdk(Logger):
         # Create core and addon packages
         for package_path in [core_package_path, addon_package_path]:
             if not os.path.isdir(package_path):
-                self.logger.debug("'%s' plugin package was not found in plugins home dir and will be created" %
-                                  package_path
-                                  )
+                self.logger.debug(
+                    "'%s' plugin package was not found in plugins home dir and will be created", package_path
+                )
                 self.__create_bare_package(package_path)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_bare_package(self, package_dir):
@@ -92,19 +92,19 @@ class Sdk(Logger):
 
         :param package_dir: The absolute path of the package to create
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         init_path = os.path.join(package_dir, "__init__.py")
 
         # Create package dir
         if not os.path.isdir(package_dir):
-            self.logger.debug("Creating package dir at '%s'" % package_dir)
+            self.logger.debug("Creating package dir at '%s'", package_dir)
             os.makedirs(package_dir)
 
         # Create empty __init__
         open(init_path, "w").close()
-        self.logger.debug("__init__.py created at '%s'" % init_path)
+        self.logger.debug("__init__.py created at '%s'", init_path)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def create_plugin(self, plugin_type, name):
@@ -114,19 +114,19 @@ class Sdk(Logger):
         :param plugin_type: The type of plugin to create. Should be core or addon
         :param nane: The name of the plugin to create
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Check name
         if not self.is_valid_plugin_name(name):
-            self.logger.error("Could not create plugin due to bad plugin name '%s'" % name)
+            self.logger.error("Could not create plugin due to bad plugin name '%s'", name)
             raise BadPluginName(name)
         # Check type
         if not self.__is_valid_plugin_type(plugin_type):
-            self.logger.error("Could not create plugin due to bad plugin type '%s'" % plugin_type)
+            self.logger.error("Could not create plugin due to bad plugin type '%s'", plugin_type)
             raise BadPluginType(plugin_type)
 
         # Initiate plugin
-        self.logger.info("Creating new '%s' plugin '%s'" % (plugin_type, name))
+        self.logger.info("Creating new '%s' plugin '%s'", plugin_type, name)
         new_plugin = Plugin(
             plugins_dir_path=self.__plugins_dir_path, name=name, plugin_type=plugin_type
         )
@@ -137,7 +137,7 @@ class Sdk(Logger):
 
         # Add new plugin package to subpackage (core, addon) __init__
         self.__add_plugin_to_init(new_plugin)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def does_plugin_exist(self, plugin_name):
@@ -147,7 +147,7 @@ class Sdk(Logger):
         :param plugin_name: The name of the plugin to check for
         :return: True if plugin exists, otherwise False
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         if not self.__plugins:
             self.get_plugins()
@@ -155,10 +155,10 @@ class Sdk(Logger):
         for cat in self.__plugins:
             for plugin in self.__plugins[cat]:
                 if plugin.get_name().lower() == plugin_name.lower():
-                    self.logger.debug("EXIT with True")
+                    self.trace("EXIT with True")
                     return True
 
-        self.logger.debug("EXIT with False")
+        self.trace("EXIT with False")
         return False
 
 
@@ -168,16 +168,16 @@ class Sdk(Logger):
 
         :param name: The name of the plugin to delete
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Initiate plugin and delete
         existing_plugin = Plugin(self.__plugins_dir_path, name)
         existing_plugin.delete()
-        self.logger.info("Plugin '%s' successfully deleted" % name)
+        self.logger.info("Plugin '%s' successfully deleted", name)
 
         # Remove from init
         self.__remove_plugin_from_init(existing_plugin)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __add_plugin_to_init(self, new_plugin):
@@ -186,7 +186,7 @@ class Sdk(Logger):
 
         :param new_plugin: The name of the new plugin to add to the __init__ file
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         init_contents = ""
         subpackage_init_path = os.path.join(
@@ -194,7 +194,7 @@ class Sdk(Logger):
             "core" if new_plugin.is_core_plugin() else "addon",
             "__init__.py"
         )
-        self.logger.debug("Adding plugin to init at '%s'" % subpackage_init_path)
+        self.logger.debug("Adding plugin to init at '%s'", subpackage_init_path)
 
         # Read subpackage init
         if os.path.isfile(subpackage_init_path):
@@ -211,7 +211,7 @@ class Sdk(Logger):
         with open(subpackage_init_path, "w") as init_file:
             init_file.write(init_contents)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __remove_plugin_from_init(self, existing_plugin):
@@ -220,14 +220,14 @@ class Sdk(Logger):
 
         :param name: The name of the plugin to remove
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         subpackage_init_path = os.path.join(
             self.__plugins_dir_path,
             "core" if existing_plugin.is_core_plugin() else "addon",
             "__init__.py"
         )
-        self.logger.debug("Removing plugin from init at '%s'" % subpackage_init_path)
+        self.logger.debug("Removing plugin from init at '%s'", subpackage_init_path)
 
         if os.path.isfile(subpackage_init_path):
             # Read subpackage init
@@ -241,7 +241,7 @@ class Sdk(Logger):
             with open(subpackage_init_path, "w") as init_file:
                 init_file.write(init_contents)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
     #############
     ## GETTERS ##
@@ -253,7 +253,7 @@ class Sdk(Logger):
 
         :return: Dict of core and addon plugin lists
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         plugins = {
             "core": [],
@@ -274,11 +274,11 @@ class Sdk(Logger):
 
                         # Add to package plugins
                         plugins[subpackage].append(plugin)
-                self.logger.debug("Got the following '%s' plugins: %s" % (subpackage, plugins[subpackage]))
+                self.logger.debug("Got the following '%s' plugins: %s", subpackage, plugins[subpackage])
 
         self.__plugins = plugins
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
         return plugins
 
 
@@ -289,18 +289,18 @@ class Sdk(Logger):
         :param name: The name to check
         :return: True if name is valid, otherwise False
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("Checking names '%s'" % name)
+        self.trace("ENTRY")
+        self.logger.debug("Checking names '%s'", name)
 
         if (
                 (not self.PLUGIN_NAME_REGEX.match(name)) or
                 (len(name) < self.PLUGIN_NAME_MIN_LEN) or
                 (len(name) > self.PLUGIN_NAME_MAX_LEN)
         ):
-            self.logger.debug("EXIT with False")
+            self.trace("EXIT with False")
             return False
         else:
-            self.logger.debug("EXIT with True")
+            self.trace("EXIT with True")
             return True
 
 
@@ -311,14 +311,14 @@ class Sdk(Logger):
         :param plugin_type: plugin type
         :return: True if valid, else False
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("Checking plugin type %s" % plugin_type)
+        self.trace("ENTRY")
+        self.logger.debug("Checking plugin type %s", plugin_type)
 
         if plugin_type.lower() == "core" or plugin_type.lower() == "addon":
-            self.logger.debug("EXIT with True")
+            self.trace("EXIT with True")
             return True
         else:
-            self.logger.debug("EXIT with False")
+            self.trace("EXIT with False")
             return False
 
 
@@ -329,11 +329,11 @@ class Sdk(Logger):
         :param name: The name to validate
         :return: True if the name is reserved and not a permitted plugin names, otherwise False
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         if name.lower() in self.RESERVED_PLUGIN_NAMES:
-            self.logger.debug("EXIT with True for name '%s'" % name)
+            self.trace("EXIT with True for name '%s'", name)
             return True
 
-        self.logger.debug("EXIT with False for name '%s'" % name)
+        self.trace("EXIT with False for name '%s'", name)
         return False
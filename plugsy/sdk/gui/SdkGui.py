@@ -17,7 +17,7 @@ from ...utils import Logger
 # ======================================
 # = SdkGui Class
 # ======================================
-class SdkGui(MainFrame):
+class SdkGui(MainFrame, Logger):
     '''
     SDK Gui - Main
     '''
@@ -81,14 +81,14 @@ class SdkGui(MainFrame):
         '''
         Reloads plugins from specified plugins home directory
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.__loaded_plugins = self.__sdk.get_plugins()
-        self.logger.info("Loaded '%s' core plugins" % len(self.__loaded_plugins["core"]))
-        self.logger.info("Loaded '%s' addon plugins" % len(self.__loaded_plugins["addon"]))
+        self.logger.info("Loaded '%s' core plugins", len(self.__loaded_plugins["core"]))
+        self.logger.info("Loaded '%s' addon plugins", len(self.__loaded_plugins["addon"]))
         self.plugins_tree.populate_tree(self.__loaded_plugins)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_new_plugin(self, event):
@@ -97,12 +97,12 @@ class SdkGui(MainFrame):
 
         :param event: wx event object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         new_plugin_dialog = _NewPluginDialog(self, self.__plugins_home_dir, self.__sdk)
         new_plugin_dialog.Show()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __delete_plugin(self, event):
@@ -111,37 +111,37 @@ class SdkGui(MainFrame):
 
         :param event: wx event object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         plugin_name = self.plugins_tree.get_current_selection_text()
-        self.logger.debug("Attempting to delete '%s' plugin" % plugin_name)
+        self.logger.debug("Attempting to delete '%s' plugin", plugin_name)
 
         delete_plugin_dialog = DeletePluginConfirmation(self, plugin_name, self.__sdk)
         delete_plugin_dialog.Show()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def sync_config_fields(self):
         '''
         Syncs config fields so they are that of the currently selected tree item
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.__set_selected_plugin(None)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def clear_config_fields(self):
         '''
         Convenience method to clear all configuration boxes and items and reset to default
         '''
-        self.logger.debug(" ENTRY")
+        self.trace("ENTRY")
 
         self.PluginNameTextCtrl.SetValue("")
         self.PluginTypeComboBox.SetValue("core")
         self.DeletePluginButton.Disable()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __close(self, event):
@@ -174,16 +174,16 @@ class SdkGui(MainFrame):
             self,
             name="%s.sdk.SdkGui" % Config.FULL_NAME
         )
-        self.logger.debug("Plugins home set to '%s'" % plugins_home_dir)
-        self.logger.info("Loaded '%s' core plugins" % len(self.__loaded_plugins["core"]))
-        self.logger.info("Loaded '%s' addon plugins" % len(self.__loaded_plugins["addon"]))
+        self.logger.debug("Plugins home set to '%s'", plugins_home_dir)
+        self.logger.info("Loaded '%s' core plugins", len(self.__loaded_plugins["core"]))
+        self.logger.info("Loaded '%s' addon plugins", len(self.__loaded_plugins["addon"]))
 
         # Add plugins to tree
         self.plugins_tree = PluginTree(self.PluginsTreeCtrl, self.__loaded_plugins)
 
         # Set status bar
         self.__set_status_bar_message("Plugins Home - %s" % plugins_home_dir)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __set_status_bar_message(self, message):
@@ -192,15 +192,15 @@ class SdkGui(MainFrame):
 
         :param message: The message to set in the wx status bar
         '''
-        self.logger.debug("ENTRY")
-        self.logger.debug("Setting message as '%s'" % message)
+        self.trace("ENTRY")
+        self.logger.debug("Setting message as '%s'", message)
 
         # Check len
         if len(message) > 40:
             message = message[:37] + "..."
 
         self.StatusBar.SetStatusText(message)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __set_selected_plugin(self, event):
@@ -209,11 +209,11 @@ class SdkGui(MainFrame):
 
         :param event: wx event object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Get plugin name and cat and set obj
         selected_plugin_name = self.plugins_tree.get_current_selection_text()
-        self.logger.debug("Setting selected plugin to '%s'" % selected_plugin_name)
+        self.logger.debug("Setting selected plugin to '%s'", selected_plugin_name)
         # If plugin selected and not category
         if selected_plugin_name.lower() != "core" and selected_plugin_name.lower() != "addon":
             self.__selected_plugin = self.__loaded_plugins
@@ -228,12 +228,11 @@ class SdkGui(MainFrame):
         else:
 
             self.logger.debug(
-                "Category '%s' selected. Clearing config fields" %
-                selected_plugin_name
+                "Category '%s' selected. Clearing config fields", selected_plugin_name
             )
             self.clear_config_fields()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def set_log_level(self, log_level):
@@ -427,7 +426,7 @@ class _NewPluginDialog(NewPluginDialog, Logger):
             self,
             name="%s.sdk.%s" % (Config.FULL_NAME, self.__class__.__name__)
         )
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         self.__parent = parent
         self.__sdk = sdk
         self.__plugins_home_dir = plugins_home_dir
@@ -438,7 +437,7 @@ class _NewPluginDialog(NewPluginDialog, Logger):
 
         # Disable parent
         self.__parent.Disable()
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __create_new_plugin(self, event):
@@ -447,12 +446,12 @@ class _NewPluginDialog(NewPluginDialog, Logger):
 
         :param event: wx event object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         # Handle inputs
         name = self.PluginNameTextCtrl.GetValue()
         _type = self.PluginTypeChoice.GetString(self.PluginTypeChoice.GetSelection())
-        self.logger.debug("Attempting creation of '%s' plugin of type '%s'" % (name, _type))
+        self.logger.debug("Attempting creation of '%s' plugin of type '%s'", name, _type)
 
         # Check plugin name
         if not self.__sdk.is_valid_plugin_name(name):
@@ -462,26 +461,24 @@ class _NewPluginDialog(NewPluginDialog, Logger):
             )
             self.logger.error(
                 "The specified plugin name '%s' is invalid. It does not match the regex '%s' and is not between"
-                " %s and %s characters in length" % (
-                    name, self.__sdk.PLUGIN_NAME_REGEX.pattern,
-                    self.__sdk.PLUGIN_NAME_MIN_LEN, self.__sdk.PLUGIN_NAME_MAX_LEN
-                )
+                " %s and %s characters in length",
+                name, self.__sdk.PLUGIN_NAME_REGEX.pattern, self.__sdk.PLUGIN_NAME_MIN_LEN, self.__sdk.PLUGIN_NAME_MAX_LEN
             )
-            self.logger.debug("EXIT")
+            self.trace("EXIT")
             return
 
         # Check plugin doesn't already exist
         if self.__sdk.does_plugin_exist(name):
             self.StatusLabel.SetLabelText("Error: A plugin with the specified name already exists")
-            self.logger.error("A plugin already exists with the name '%s'" % name)
-            self.logger.debug("EXIT")
+            self.logger.error("A plugin already exists with the name '%s'", name)
+            self.trace("EXIT")
             return
 
         # Check plugin name isn't reserved
         if self.__sdk.is_reserved_plugin_name(name):
             self.StatusLabel.SetLabelText("Error: Plugin name is reserved. Please choose another name")
-            self.logger.error("The keyword '%s' is reserved and cannot be used as a plugin name" % name)
-            self.logger.debug("EXIT")
+            self.logger.error("The keyword '%s' is reserved and cannot be used as a plugin name", name)
+            self.trace("EXIT")
             return
 
         # Create plugin
@@ -491,7 +488,7 @@ class _NewPluginDialog(NewPluginDialog, Logger):
         # Close
         self.__parent.Enable()
         self.Destroy()
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def __cancel(self, event):
@@ -500,12 +497,12 @@ class _NewPluginDialog(NewPluginDialog, Logger):
 
         :return: wx event object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.__parent.Enable()
         self.Destroy()
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
     #############
     ## SETTERS ##
@@ -515,12 +512,12 @@ class _NewPluginDialog(NewPluginDialog, Logger):
         '''
         Bind events
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.Bind(wx.EVT_BUTTON, self.__create_new_plugin, self.OkCanelSizerOK)
         self.Bind(wx.EVT_BUTTON, self.__cancel, self.OkCanelSizerCancel)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
 # ======================================
@@ -544,7 +541,7 @@ class PluginTree(Logger):
             self,
             name="%s.sdk.%s" % (Config.FULL_NAME, self.__class__.__name__)
         )
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         self.__tree = tree
         self.__categories = []
         self.__loaded_plugins = loaded_plugins
@@ -556,7 +553,7 @@ class PluginTree(Logger):
         # Populate
         self.logger.debug("Adding plugins to the tree")
         self.populate_tree(loaded_plugins)
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def populate_tree(self, loaded_plugins):
@@ -565,36 +562,36 @@ class PluginTree(Logger):
 
         :param loaded_plugins: List of currently loaded plugin objects
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         for cat in loaded_plugins:
-            self.logger.debug("Adding '%s' plugins to tree" % cat)
+            self.logger.debug("Adding '%s' plugins to tree", cat)
             # if cat in get_list_of_category_names() (children under the root node)
             if cat not in self.get_category_names():
-                self.logger.debug("'%s' category not yet in tree, adding it" % cat)
+                self.logger.debug("'%s' category not yet in tree, adding it", cat)
                 self.__tree.AppendItem(self.__root, cat)
 
             # Add each plugin under cat
-            self.logger.debug("Adding '%s' plugins to category" % len(loaded_plugins[cat]))
+            self.logger.debug("Adding '%s' plugins to category", len(loaded_plugins[cat]))
             for plugin in loaded_plugins[cat]:
                 if plugin.get_name() not in self.get_category_plugin_names(cat):
-                    self.logger.debug("Adding '%s' plugin to tree" % plugin.get_name())
+                    self.logger.debug("Adding '%s' plugin to tree", plugin.get_name())
                     self.__tree.AppendItem(self.__get_category_id(cat), plugin.get_name())
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def remove_plugin(self):
         '''
         Removes the currently selected plugin item from the tree
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         plugin_id = self.get_current_selection_id()
         self.debug("Removing '%s' plugin from tree" % self.get_current_selection_text())
         self.__tree.Delete(plugin_id)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     #############
@@ -607,7 +604,7 @@ class PluginTree(Logger):
 
         :return: List of strings
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         category_names = []
 
         # Get first child
@@ -618,7 +615,7 @@ class PluginTree(Logger):
             category_names.append(self.__tree.GetItemText(category))
             category, cookie = self.__tree.GetNextChild(self.__root, cookie)
 
-        self.logger.debug("EXIT with '%s'" % category_names)
+        self.trace("EXIT with '%s'", category_names)
         return category_names
 
 
@@ -630,7 +627,7 @@ class PluginTree(Logger):
             this will be None
         :return: id object or None
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         category_id = None
 
         category, cookie = self.__tree.GetFirstChild(self.__root)
@@ -643,7 +640,7 @@ class PluginTree(Logger):
         if self.__tree.GetItemText(category) == category_name:
             category_id = category
 
-        self.logger.debug("EXIT with '%s'" % category_id)
+        self.trace("EXIT with '%s'", category_id)
         return category_id
 
     def get_category_plugin_names(self, category_name):
@@ -653,7 +650,7 @@ class PluginTree(Logger):
         :param category_name: The category name of which to get plugin names
         :return: A list of the plugin names under the cat
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
         plugin_names = []
         cat_id = self.__get_category_id(category_name)
 
@@ -664,7 +661,7 @@ class PluginTree(Logger):
             plugin_names.append(self.__tree.GetItemText(plugin_id))
             plugin_id, cookie = self.__tree.GetNextChild(cat_id, cookie)
 
-        self.logger.debug("EXIT with '%s'" % plugin_names)
+        self.trace("EXIT with '%s'", plugin_names)
         return plugin_names
 
 
@@ -675,10 +672,10 @@ class PluginTree(Logger):
         :param category: The category of which to get plugin ids
         :return: A list of the plugin ids under the cat
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         pass
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
 
 
     def get_current_selection_text(self):
@@ -687,11 +684,11 @@ class PluginTree(Logger):
 
         :return: the name string of the currently selected plugin
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         selected_plugin_name = self.__tree.GetItemText(self.__tree.GetSelection())
 
-        self.logger.debug("EXIT with '%s'" % selected_plugin_name)
+        self.trace("EXIT with '%s'", selected_plugin_name)
         return selected_plugin_name
 
 
@@ -701,11 +698,11 @@ class PluginTree(Logger):
 
         :return: treectrl id object
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         selected_plugin_id = self.__tree.GetSelection()
 
-        self.logger.debug("EXIT with '%s'" % selected_plugin_id)
+        self.trace("EXIT with '%s'", selected_plugin_id)
         return selected_plugin_id
 
 
@@ -719,8 +716,8 @@ class PluginTree(Logger):
 
         :param item_id: The ID of the item to focus on
         '''
-        self.logger.debug("ENTRY")
+        self.trace("ENTRY")
 
         self.__tree.SetFocusedItem(item_id)
 
-        self.logger.debug("EXIT")
+        self.trace("EXIT")
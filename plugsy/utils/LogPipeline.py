@@ -0,0 +1,346 @@
+'''
+LogPipeline - Non-blocking, queue-based delivery of log records to their handlers
+'''
+
+# import libs
+import logging
+import queue
+from threading import Lock, Thread
+
+
+class LogPipeline():
+    '''
+    Decouples logging threads from log I/O. Records are put on a bounded in-memory queue by a PipelineHandler and a
+    single background listener drains them in batches to the sinks (the real handlers), taking each sink's lock once
+    per batch rather than once per record. What happens when the queue is full is decided by the overflow policy:
+
+    - drop: the record is discarded
+    - block: the logging thread waits for room on the queue
+    - sample: once the queue is half full, only one in every sample_rate records below WARNING is queued. Records
+      that still don't fit are discarded
+
+    Discarded records are counted, and a warning reporting them is written to the sinks once the listener catches up
+    '''
+
+    DROP = "drop"
+    BLOCK = "block"
+    SAMPLE = "sample"
+    OVERFLOW_POLICIES = [DROP, BLOCK, SAMPLE]
+
+    DEFAULT_QUEUE_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 256
+    DEFAULT_SAMPLE_RATE = 10
+
+    # Queued to stop the listener once it has drained every record before it
+    __STOP = object()
+
+    def __init__(self, sinks, queue_size=DEFAULT_QUEUE_SIZE, overflow_policy=DROP, batch_size=DEFAULT_BATCH_SIZE,
+                 sample_rate=DEFAULT_SAMPLE_RATE):
+        '''
+        Constructor
+
+        :param sinks: List of logging handlers records are delivered to
+        :param queue_size: Maximum number of records held in the queue
+        :param overflow_policy: What to do with records when the queue is full. One of OVERFLOW_POLICIES
+        :param batch_size: Maximum number of records delivered to the sinks at once
+        :param sample_rate: Under the sample policy, one in every sample_rate records is kept while the queue is
+            under pressure
+        '''
+
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy '%s'. Expected one of %s" % (
+                overflow_policy, self.OVERFLOW_POLICIES
+            ))
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+
+        self.__sinks = list(sinks)
+        self.__queue = queue.Queue(maxsize=queue_size)
+        self.__queue_size = queue_size
+        self.__overflow_policy = overflow_policy
+        self.__batch_size = max(1, batch_size)
+        self.__sample_rate = max(1, sample_rate)
+        self.__sampled = 0
+        self.__counter_lock = Lock()
+        self.__dropped = {}
+        self.__reported_dropped = 0
+        self.__listener = None
+
+
+    def start(self):
+        '''
+        Starts the background listener
+        '''
+
+        if self.__listener is not None and self.__listener.is_alive():
+            return
+
+        self.__listener = Thread(target=self.__listen, name="plugsy-log-pipeline", daemon=True)
+        self.__listener.start()
+
+
+    def stop(self, timeout=None):
+        '''
+        Stops the background listener once every queued record has been delivered
+
+        :param timeout: Optional number of seconds to wait for the queue to drain. Waits indefinitely if None. A
+            listener still draining once the timeout passes is kept, so stop() can be called again
+        '''
+
+        if self.__listener is None or not self.__listener.is_alive():
+            return
+
+        # The stop marker must always be queued, regardless of the overflow policy
+        self.__queue.put(self.__STOP, timeout=timeout)
+        self.__listener.join(timeout)
+        if not self.__listener.is_alive():
+            self.__listener = None
+
+
+    def enqueue(self, record):
+        '''
+        Puts a record on the queue, applying the overflow policy
+
+        :param record: LogRecord
+        '''
+
+        # Merge the message args now, as they may be mutated by the logging thread before the record is delivered
+        record.msg = record.getMessage()
+        record.args = None
+
+        if self.__overflow_policy == self.BLOCK:
+            self.__queue.put(record)
+            return
+
+        if (
+                self.__overflow_policy == self.SAMPLE and record.levelno < logging.WARNING and
+                self.__queue.qsize() * 2 >= self.__queue_size
+        ):
+            with self.__counter_lock:
+                self.__sampled += 1
+                sampled_out = self.__sampled % self.__sample_rate
+            if sampled_out:
+                self.__count_dropped(record)
+                return
+
+        try:
+            self.__queue.put_nowait(record)
+        except queue.Full:
+            self.__count_dropped(record)
+
+
+    def __count_dropped(self, record):
+        '''
+        Counts a discarded record
+
+        :param record: LogRecord
+        '''
+
+        with self.__counter_lock:
+            self.__dropped[record.levelname] = self.__dropped.get(record.levelname, 0) + 1
+
+
+    def __listen(self):
+        '''
+        Listener thread loop. Delivers queued records to the sinks in batches until the stop marker is reached.
+        Records logged after stop() queued the marker may share its batch, and only those before it are delivered
+        '''
+        stopping = False
+
+        while not stopping:
+            batch = [self.__queue.get()]
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for index, record in enumerate(batch):
+                if record is self.__STOP:
+                    stopping = True
+                    del batch[index:]
+                    break
+
+            self.__report_dropped(batch)
+            self.__deliver(batch)
+
+
+    def __report_dropped(self, batch):
+        '''
+        Appends a warning to the batch if records have been dropped since the last report
+
+        :param batch: List of LogRecords to deliver
+        '''
+        dropped = self.get_dropped()
+
+        if dropped > self.__reported_dropped and batch:
+            batch.append(logging.LogRecord(
+                batch[-1].name, logging.WARNING, __file__, 0,
+                "Log queue overflowed. %s records dropped (%s in total)" % (
+                    dropped - self.__reported_dropped, dropped
+                ), None, None, "deliver"
+            ))
+            self.__reported_dropped = dropped
+
+
+    def __deliver(self, batch):
+        '''
+        Delivers a batch of records to every sink. Stream sinks receive the whole batch in a single write
+
+        :param batch: List of LogRecords
+        '''
+
+        for sink in self.__sinks:
+            records = [record for record in batch if record.levelno >= sink.level and sink.filter(record)]
+            if not records:
+                continue
+
+            sink.acquire()
+            try:
+                stream = getattr(sink, "stream", None)
+                if isinstance(sink, logging.StreamHandler) and stream is not None:
+                    try:
+                        stream.write("".join(sink.format(record) + sink.terminator for record in records))
+                        sink.flush()
+                    except Exception:
+                        sink.handleError(records[-1])
+                else:
+                    for record in records:
+                        try:
+                            sink.emit(record)
+                        except Exception:
+                            sink.handleError(record)
+            finally:
+                sink.release()
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_handler(self):
+        '''
+        Creates a handler that puts records on this pipeline
+
+        :return: PipelineHandler
+        '''
+
+        return PipelineHandler(self)
+
+
+    def get_sinks(self):
+        '''
+        Gets the handlers records are delivered to
+
+        :return: List of logging handlers
+        '''
+
+        return list(self.__sinks)
+
+
+    def get_dropped(self, level=None):
+        '''
+        Gets the number of records dropped due to overflow
+
+        :param level: Optional level name (e.g. DEBUG) to count. Counts every level if None
+        :return: Number of dropped records
+        '''
+
+        with self.__counter_lock:
+            if level is not None:
+                return self.__dropped.get(level.upper(), 0)
+            return sum(self.__dropped.values())
+
+
+    def get_dropped_by_level(self):
+        '''
+        Gets the number of records dropped due to overflow, by level
+
+        :return: Dict of <level name>:<count>
+        '''
+
+        with self.__counter_lock:
+            return dict(self.__dropped)
+
+
+    def get_queue_depth(self):
+        '''
+        Gets the number of records waiting to be delivered
+
+        :return: Queue depth
+        '''
+
+        return self.__queue.qsize()
+
+
+    def get_overflow_policy(self):
+        '''
+        Gets the overflow policy
+
+        :return: Policy name
+        '''
+
+        return self.__overflow_policy
+
+
+    def is_running(self):
+        '''
+        Checks whether the listener is running
+
+        :return: True if running, otherwise False
+        '''
+
+        return self.__listener is not None and self.__listener.is_alive()
+
+
+# ==========================
+# = PipelineHandler Class
+# ==========================
+class PipelineHandler(logging.Handler):
+    '''
+    Handler putting records on a LogPipeline. It doesn't take the handler lock, so logging threads never contend
+    with each other or with the listener beyond the queue itself
+    '''
+
+    def __init__(self, pipeline):
+        '''
+        Constructor override
+
+        :param pipeline: The LogPipeline to put records on
+        '''
+        logging.Handler.__init__(self)
+
+        self.__pipeline = pipeline
+
+
+    def handle(self, record):
+        '''
+        Filters and enqueues a record, without taking the handler lock
+
+        :param record: LogRecord
+        :return: True (or the filtered record) if it passed the filters, otherwise False
+        '''
+        passed = self.filter(record)
+
+        if passed:
+            self.__pipeline.enqueue(passed if isinstance(passed, logging.LogRecord) else record)
+        return passed
+
+
+    def emit(self, record):
+        '''
+        Enqueues a record
+
+        :param record: LogRecord
+        '''
+
+        self.__pipeline.enqueue(record)
+
+
+    def get_pipeline(self):
+        '''
+        Gets the pipeline this handler puts records on
+
+        :return: LogPipeline
+        '''
+
+        return self.__pipeline
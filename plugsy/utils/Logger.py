@@ -3,11 +3,16 @@ Logger Class. Provides global logger access and handles initiation
 '''
 
 # import libs
+import atexit
 import logging
 import os
+import time
+import weakref
+from threading import Lock
 
 # import package content
 from .. import Config
+from .LogPipeline import LogPipeline, PipelineHandler
 
 class Logger():
     '''
@@ -18,17 +23,29 @@ class Logger():
     DEFAULT_LEVEL = logging.WARNING
     FILTERS_FILENAME = "debugfilters.conf"
 
-    def __init__(self, name, level="", log_path=""):
+    # Every Logger instance, so tracing can be switched on or off for existing loggers
+    __instances = weakref.WeakSet()
+
+    # Debug filters shared by every logger, created on first use
+    __debug_filters = None
+    __debug_filters_lock = Lock()
+
+    def __init__(self, name, level="", log_path="", queue_size=0, overflow_policy=LogPipeline.DROP):
         '''
         Constructor
 
         :param name: Debug name
         :param level: Logging level,
         :param log_path: Log file path
+        :param queue_size: Optional maximum number of queued records. If set, records are queued and written to the
+            console and log file by a background LogPipeline instead of by the logging thread
+        :param overflow_policy: What the LogPipeline does with records when its queue is full
         '''
 
         # Init logger
         self.logger = logging.getLogger(name)
+        Logger.__instances.add(self)
+        self.set_tracing(self.is_trace_logger(name))
 
         # Configure logger if not already set up
         if not self.logger.hasHandlers():
@@ -37,21 +54,31 @@ class Logger():
             self.__level = self.__get_level(level)
             self.logger.setLevel(self.__level)
 
-            # Load filters and create filter object
-            self.__filter = Filter(self.__get_filter_strings())
+            # Create filter object from the shared debug filters
+            self.__filter = Filter(self.get_debug_filters())
 
             # Configure handlers
             # Console
             self.__console = logging.StreamHandler()
             self.__console.setFormatter(self.__formatter)
             self.__console.addFilter(self.__filter)
-            self.logger.addHandler(self.__console)
+            handlers = [self.__console]
             # File
             if log_path:
                 self.__file = logging.FileHandler(log_path, mode="w")
                 self.__file.setFormatter(self.__formatter)
                 self.__file.addFilter(self.__filter)
-                self.logger.addHandler(self.__file)
+                handlers.append(self.__file)
+
+            # Queue records for a background listener rather than writing them from the logging thread
+            if queue_size:
+                pipeline = LogPipeline(handlers, queue_size=queue_size, overflow_policy=overflow_policy)
+                pipeline.start()
+                atexit.register(pipeline.stop)
+                handlers = [pipeline.get_handler()]
+
+            for handler in handlers:
+                self.logger.addHandler(handler)
 
             self.info("LOGGER INITIALISED")
             self.info("Level - '%s'" % logging.getLevelName(self.__level))
@@ -62,24 +89,19 @@ class Logger():
                 self.warning("Debug level set to '%s'. This may hinder performance" % logging.getLevelName(self.__level))
 
 
-    def __get_filter_strings(self):
+    @staticmethod
+    def get_debug_filters():
         '''
-        Loads and returns a list of debug filter strings
+        Gets the debug filters shared by every logger. They're loaded on first use, from Config.DEBUG_FILTERS and
+        the filters file in the current working directory
 
-        :return: List of debug filter strings
+        :return: DebugFilters
         '''
 
-        filters = Config.DEBUG_FILTERS
-        filters_filepath = os.path.join(os.getcwd(), self.FILTERS_FILENAME)
-
-        # Load any additional filters form filters file
-        if os.path.isfile(filters_filepath):
-            with open(filters_filepath, "r") as filter_file:
-                for filter_string in filter_file.readlines():
-                    if not filter_string.startswith("#"):
-                        filters.append(filter_string.lower().rstrip())
-
-        return filters
+        with Logger.__debug_filters_lock:
+            if Logger.__debug_filters is None:
+                Logger.__debug_filters = DebugFilters(os.path.join(os.getcwd(), Logger.FILTERS_FILENAME))
+            return Logger.__debug_filters
 
 
 
@@ -87,6 +109,92 @@ class Logger():
     ## LOGGER METHODS ##
     ####################
 
+    def trace(self, msg, *args):
+        '''
+        Logs a DEBUG level trace entry, such as a method ENTRY or EXIT. Does nothing unless tracing is enabled for
+        this logger, in which case set_tracing() shadows this method with __trace. Arguments are only formatted into
+        the message when the entry is emitted
+
+        :param msg: Message to log, optionally containing % placeholders
+        :param args: Arguments for the message placeholders
+        '''
+
+
+    def __trace(self, msg, *args):
+        '''
+        Emits a trace entry, attributed to the calling method
+
+        :param msg: Message to log, optionally containing % placeholders
+        :param args: Arguments for the message placeholders
+        '''
+        self.logger.debug(msg, *args, stacklevel=2)
+
+
+    def set_tracing(self, enabled):
+        '''
+        Enables or disables tracing for this logger
+
+        :param enabled: True to emit trace entries, otherwise False
+        '''
+
+        if enabled:
+            self.trace = self.__trace
+        else:
+            self.__dict__.pop("trace", None)
+
+
+    def get_log_pipeline(self):
+        '''
+        Gets the LogPipeline this logger's records are queued on, if any
+
+        :return: LogPipeline, or None if records are written synchronously
+        '''
+        logger = self.logger
+
+        while logger:
+            for handler in logger.handlers:
+                if isinstance(handler, PipelineHandler):
+                    return handler.get_pipeline()
+            logger = logger.parent if logger.propagate else None
+
+        return None
+
+
+    def is_tracing(self):
+        '''
+        Checks whether tracing is enabled for this logger
+
+        :return: True if enabled, otherwise False
+        '''
+
+        return "trace" in self.__dict__
+
+
+    @staticmethod
+    def is_trace_logger(name):
+        '''
+        Checks whether a logger name matches one of the trace logger prefixes
+
+        :param name: The logger name
+        :return: True if tracing should be enabled for the logger, otherwise False
+        '''
+
+        return bool(Config.TRACE_LOGGERS) and name.lower().startswith(tuple(Config.TRACE_LOGGERS))
+
+
+    @staticmethod
+    def set_trace_loggers(prefixes):
+        '''
+        Sets the logger name prefixes to trace, and applies them to every existing logger
+
+        :param prefixes: List of logger name prefixes. An empty list disables tracing everywhere
+        '''
+        Config.TRACE_LOGGERS[:] = [prefix.lower() for prefix in prefixes]
+
+        for instance in list(Logger.__instances):
+            instance.set_tracing(Logger.is_trace_logger(instance.logger.name))
+
+
     def debug(self, msg):
         '''
         Logs a DEBUG level entry
@@ -156,6 +264,133 @@ class Logger():
         return logging_lvl
 
 
+# ==========================
+# = DebugFilters Class
+# ==========================
+class DebugFilters():
+    '''
+    Registry of debug filter strings, compiled into a single tuple of lowercase logger name prefixes. Match results
+    are cached per logger name. The filters file is reloaded when it changes, checked at most once every
+    RELOAD_INTERVAL seconds
+    '''
+
+    RELOAD_INTERVAL = 1.0
+
+    def __init__(self, filters_path):
+        '''
+        Constructor
+
+        :param filters_path: Path of the debug filters file. It's optional and may be created later
+        '''
+        self.__filters_path = filters_path
+        self.__lock = Lock()
+        self.__fingerprint = None
+        self.__next_check = 0.0
+        self.__prefixes = ()
+        self.__matches = {}
+
+        self.reload()
+
+
+    def reload(self):
+        '''
+        Reloads Config.DEBUG_FILTERS and the filters file, and clears the cached match results
+        '''
+        filter_strings = list(Config.DEBUG_FILTERS)
+
+        with self.__lock:
+            self.__fingerprint = self.__get_fingerprint()
+            self.__next_check = time.monotonic() + self.RELOAD_INTERVAL
+
+            # Load any additional filters from filters file
+            if self.__fingerprint is not None:
+                try:
+                    with open(self.__filters_path, "r") as filter_file:
+                        filter_strings += [
+                            line for line in filter_file.read().splitlines() if not line.startswith("#")
+                        ]
+                except OSError:
+                    pass
+
+            # Blank filters would match every logger, so they're ignored
+            self.__prefixes = tuple(sorted(set(
+                filter_string.strip().lower() for filter_string in filter_strings if filter_string.strip()
+            )))
+            self.__matches = {}
+
+
+    def matches(self, logger_name):
+        '''
+        Checks whether a logger's records pass the filters
+
+        :param logger_name: The name of the logger
+        :return: True if the name starts with a filter, or if there are no filters. Otherwise False
+        '''
+
+        if time.monotonic() >= self.__next_check:
+            self.__check_reload()
+
+        matched = self.__matches.get(logger_name)
+        if matched is None:
+            prefixes = self.__prefixes
+            matched = not prefixes or logger_name.lower().startswith(prefixes)
+            self.__matches[logger_name] = matched
+
+        return matched
+
+
+    def __check_reload(self):
+        '''
+        Reloads the filters if the filters file has changed since it was last loaded
+        '''
+
+        with self.__lock:
+            if time.monotonic() < self.__next_check:
+                return
+            self.__next_check = time.monotonic() + self.RELOAD_INTERVAL
+            changed = self.__get_fingerprint() != self.__fingerprint
+
+        if changed:
+            self.reload()
+
+
+    def __get_fingerprint(self):
+        '''
+        Fingerprints the filters file
+
+        :return: Tuple of (mtime_ns, size), or None if the file doesn't exist
+        '''
+
+        try:
+            stat = os.stat(self.__filters_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+
+    # =======================
+    # = GETTERS
+    # =======================
+    def get_filters(self):
+        '''
+        Gets the compiled filter prefixes
+
+        :return: Tuple of lowercase logger name prefixes
+        '''
+
+        return self.__prefixes
+
+
+    def get_filters_path(self):
+        '''
+        Gets the path of the debug filters file
+
+        :return: Path
+        '''
+
+        return self.__filters_path
+
+
 # ==========================
 # = Filter Class
 # ==========================
@@ -166,13 +401,13 @@ class Filter(logging.Filter):
     '''
 
 
-    def __init__(self, filters):
+    def __init__(self, debug_filters):
         '''
         Constructor override
 
-        :param filters: A list of filter names
+        :param debug_filters: The DebugFilters object to match records against
         '''
-        self.__filters = filters
+        self.__debug_filters = debug_filters
 
         logging.Filter.__init__(self, name="")
 
@@ -185,13 +420,4 @@ class Filter(logging.Filter):
         :return: True if event is going to be logged. Otherwise False. Defaults to True if no filters found
         '''
 
-        # If no filters, return True
-        if not self.__filters:
-            return True
-
-        # Check for matching filter
-        for filter in self.__filters:
-            if record.name.lower().startswith(filter.lower()):
-                return True
-
-        return False
+        return self.__debug_filters.matches(record.name)
@@ -1,2 +1,3 @@
 from .toposort import toposort
-from .Logger import Logger
\ No newline at end of file
+from .Logger import Logger
+from .LogPipeline import LogPipeline
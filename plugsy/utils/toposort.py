@@ -9,49 +9,70 @@ from ..Exceptions import PluginCircularDependency
 
 def toposort(data):
     '''
-    Topological sorting function
+    Topological sorting function. Implements Kahn's algorithm using in-degree counters and a dependents index, so
+    runs in O(V+E). The input data is not modified
 
     :param data: Dictionary of <string>:<set> where string is a an item name of forms, and <set> is a list of the
         item's dependencies
-    :return: Items are yielded in topologically sorted order
+    :return: Items are yielded in topologically sorted order, as sets of items that only depend on items from
+        previously yielded sets
+    :raise: PluginCircularDependency, carrying the members of one of the cycles found
     '''
 
     # Check data isn't empty
     if len(data) == 0:
         return
 
-    # Copy data
-    data = data.copy()
-
-    # Remove any self-dependencies
+    # Count each item's dependencies and index the reverse edges (dependency -> dependents). Self-dependencies are
+    # ignored, and dependencies that aren't keys of their own are treated as independent items
+    in_degree = {}
+    dependents = {}
     for item, deps in data.items():
-        deps.discard(item)
+        in_degree.setdefault(item, 0)
+        for dependency in deps:
+            if dependency == item:
+                continue
+            in_degree[item] += 1
+            in_degree.setdefault(dependency, 0)
+            dependents.setdefault(dependency, []).append(item)
 
-    # Find all independent items (items within a deps set that don't have a dep set of their own)
-    independent_items = set()
-    for item, deps in data.items():
-        # Iterate all of the keys values and check for deps not in keys list
-        for dependency in data[item]:
-            if dependency not in data:
-                independent_items.update([dependency])
-
-    # Add independent items with a deps set to the data, with an empty set
-    for item in independent_items:
-        data.update({item: set()})
-
-    # Resolve dependencies until none remaining
-    while True:
-        # Add items with no deps to set and yield them. Break if none left
-        ordered = set(item for item, dep in data.items() if len(dep) == 0)
-        if not ordered:
-            break
+    # Yield generations of items with no unresolved dependencies, releasing their dependents as we go
+    remaining = len(in_degree)
+    ordered = set(item for item, degree in in_degree.items() if degree == 0)
+    while ordered:
         yield ordered
+        remaining -= len(ordered)
 
-        # This is where items the deps of items are basically removed until that item has no more deps
-        data = {
-            item: (dep - ordered) for item, dep in data.items() if item not in ordered
-        }
+        next_ordered = set()
+        for item in ordered:
+            for dependent in dependents.get(item, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_ordered.add(dependent)
+        ordered = next_ordered
 
     # If there are items remaining, must be circular dependency
-    if len(data) > 0:
-        raise PluginCircularDependency()
+    if remaining > 0:
+        raise PluginCircularDependency(_find_cycle(data, in_degree))
+
+
+def _find_cycle(data, in_degree):
+    '''
+    Finds a dependency cycle among the items left unresolved by toposort
+
+    :param data: The dependency dictionary passed to toposort
+    :param in_degree: The in-degree counters left by toposort
+    :return: List of item names forming the cycle, starting and ending with the same item
+    '''
+    unresolved = set(item for item, degree in in_degree.items() if degree > 0)
+
+    # Every unresolved item has at least one unresolved dependency, so following them must revisit an item
+    item = next(item for item in data if item in unresolved)
+    path = []
+    position = {}
+    while item not in position:
+        position[item] = len(path)
+        path.append(item)
+        item = min(dependency for dependency in data[item] if dependency != item and dependency in unresolved)
+
+    return path[position[item]:] + [item]
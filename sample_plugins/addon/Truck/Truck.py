@@ -3,9 +3,6 @@ Plugsy - Truck
 @note - Generated by PlugSy SDK
 '''
 
-#Import libs
-import time
-
 # Import Package and PlugSy Modules
 from plugsy.AbstractPlugin import AbstractPlugin
 
@@ -26,11 +23,11 @@ class Truck(AbstractPlugin):
         @summary: Main run method.
         @return:
         '''
-        self.logger.debug("ENTRY!")
+        self.trace("ENTRY!")
         self.logger.info("Truck running!")
 
-        while not self.stop_event.is_set():
+        while self.wait_for_work():
             pass
 
         self.logger.info("Truck stopping!")
-        self.logger.debug("EXIT!")
+        self.trace("EXIT!")
@@ -3,9 +3,6 @@ Plugsy - Boat
 @note - Generated by PlugSy SDK
 '''
 
-#Import libs
-import time
-
 # Import Package and PlugSy Modules
 from plugsy.AbstractPlugin import AbstractPlugin
 
@@ -26,11 +23,11 @@ class Boat(AbstractPlugin):
         @summary: Main run method.
         @return:
         '''
-        self.logger.debug("ENTRY!")
+        self.trace("ENTRY!")
         self.logger.info("Boat running!")
 
-        while not self.stop_event.is_set():
+        while self.wait_for_work():
             pass
 
         self.logger.info("Boat stopping!")
-        self.logger.debug("EXIT!")
+        self.trace("EXIT!")
@@ -13,6 +13,15 @@ setup(
     author_email='sithis999@gmail.com',
     description='Threaded plugin system and SDK',
     long_description=open('README.rst', 'r').read(),
+    python_requires=">=3.8",
+    classifiers=[
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+    ],
     install_requires=[
         "wxPython==4.0.1; 'win' in sys_platform" # wxPython if on Win
     ],
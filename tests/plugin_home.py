@@ -0,0 +1,110 @@
+'''
+Test case base creating a throwaway plugins home for each test
+'''
+
+# Import libs
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+# Import package modules
+from plugsy.sdk.Sdk import Sdk
+
+# Plugin that records its runs on the PlugSy object and reports ready once started
+RECORDING = '''from plugsy.AbstractPlugin import AbstractPlugin
+
+class {name}(AbstractPlugin):
+
+    def __init__(self, plugsy):
+        AbstractPlugin.__init__(self, plugsy)
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+        self.plugsy.events.append(("start", self.get_name()))
+        self.set_ready()
+        while self.wait_for_work():
+            pass
+        self.plugsy.events.append(("stop", self.get_name()))
+'''
+
+
+class PluginHomeTestCase(unittest.TestCase):
+    '''
+    Creates a plugins home in a temporary directory, importable as the "plugins" package while the test runs
+    '''
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.root = tempfile.mkdtemp()
+        self.home = os.path.join(self.root, "plugins")
+        os.makedirs(self.home)
+        self.sdk = Sdk(self.home)
+        self.forget_plugins()
+        sys.path.insert(0, self.root)
+        os.chdir(self.root)
+
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        sys.path.remove(self.root)
+        self.forget_plugins()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+    def forget_plugins(self):
+        '''
+        Removes the plugins package of a previous test from sys.modules
+        '''
+
+        for module_name in [name for name in sys.modules if name == "plugins" or name.startswith("plugins.")]:
+            del sys.modules[module_name]
+        importlib.invalidate_caches()
+
+
+    def create_plugin(self, tier, name, dependencies=(), config="", source=None):
+        '''
+        Creates a plugin in the test plugins home
+
+        :param tier: "core" or "addon"
+        :param name: The plugin name
+        :param dependencies: Names of the plugins it depends on
+        :param config: Extra lines for its Config.py
+        :param source: Optional plugin module source, formatted with the plugin name
+        '''
+
+        self.sdk.create_plugin(tier, name)
+        with open(os.path.join(self.home, tier, name, "Config.py"), "a") as config_file:
+            config_file.write("\nDEPENDENCIES = %r\n%s\n" % (list(dependencies), config))
+        if source is not None:
+            self.write_plugin(tier, name, source)
+
+
+    def write_plugin(self, tier, name, source):
+        '''
+        Replaces the module source of a plugin
+
+        :param tier: "core" or "addon"
+        :param name: The plugin name
+        :param source: Plugin module source, formatted with the plugin name
+        '''
+
+        with open(os.path.join(self.home, tier, name, "%s.py" % name), "w") as plugin_file:
+            plugin_file.write(source.format(name=name))
+
+
+    def assert_nothing_running(self, plugsy, names):
+        '''
+        Asserts that no plugin thread is left running and no plugin is registered
+
+        :param plugsy: The PlugSy object
+        :param names: The names of every plugin in the home
+        '''
+
+        running = [thread.name for thread in threading.enumerate() if thread.name in names and thread.is_alive()]
+        self.assertEqual(running, [])
+        self.assertEqual(plugsy.get_plugins(), [])
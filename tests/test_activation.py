@@ -0,0 +1,63 @@
+'''
+Tests that a failed activation leaves no plugins running
+'''
+
+# Import libs
+import unittest
+
+# Import package modules
+from plugsy.Exceptions import PluginNotReady
+from plugsy.Plugsy import Plugsy
+from plugin_home import PluginHomeTestCase
+
+DIES_BEFORE_READY = '''from plugsy.AbstractPlugin import AbstractPlugin
+
+class {name}(AbstractPlugin):
+
+    def run(self):
+        raise RuntimeError("{name} failed before reporting ready")
+'''
+
+NEVER_READY = '''from plugsy.AbstractPlugin import AbstractPlugin
+
+class {name}(AbstractPlugin):
+
+    def run(self):
+        while self.wait_for_work(timeout=1.0):
+            pass
+'''
+
+
+class TestFailedActivation(PluginHomeTestCase):
+    '''
+    Activations that fail part way must stop every plugin they started before raising
+    '''
+
+    def test_core_plugin_failing_before_ready(self):
+        self.create_plugin("core", "Alpha")
+        self.create_plugin("core", "Beta", config="SIGNALS_READY = True", source=DIES_BEFORE_READY)
+        self.create_plugin("addon", "Gamma", ["Beta"])
+        plugsy = Plugsy()
+
+        with self.assertRaises(PluginNotReady) as raised:
+            plugsy.activate_plugins()
+
+        self.assertIsInstance(raised.exception.failure, RuntimeError)
+        self.assert_nothing_running(plugsy, ["Alpha", "Beta", "Gamma"])
+
+
+    def test_addon_plugin_not_ready_in_time(self):
+        self.create_plugin("core", "Alpha")
+        self.create_plugin("core", "Beta", ["Alpha"])
+        self.create_plugin("addon", "Gamma", ["Beta"])
+        self.create_plugin("addon", "Delta", ["Beta"], config="SIGNALS_READY = True", source=NEVER_READY)
+        plugsy = Plugsy(activation_timeout=0.5)
+
+        with self.assertRaises(PluginNotReady):
+            plugsy.activate_plugins()
+
+        self.assert_nothing_running(plugsy, ["Alpha", "Beta", "Gamma", "Delta"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+'''
+Tests the queue-based log pipeline
+'''
+
+# Import libs
+import io
+import logging
+import threading
+import time
+import unittest
+
+# Import package modules
+from plugsy.utils.LogPipeline import LogPipeline
+
+
+class TestLogPipeline(unittest.TestCase):
+    '''
+    Records are delivered by the listener thread, which must survive being stopped while threads are still logging
+    '''
+
+    def setUp(self):
+        self.__stream = io.StringIO()
+        self.__pipeline = LogPipeline(
+            [logging.StreamHandler(self.__stream)], queue_size=500, overflow_policy=LogPipeline.BLOCK, batch_size=64
+        )
+        self.__logger = logging.getLogger("plugsy.tests.%s" % self.id())
+        self.__logger.propagate = False
+        self.__logger.setLevel(logging.DEBUG)
+        self.__logger.addHandler(self.__pipeline.get_handler())
+
+
+    def tearDown(self):
+        self.__logger.handlers = []
+
+
+    def test_records_are_delivered_in_order(self):
+        self.__pipeline.start()
+        for index in range(1000):
+            self.__logger.info("record %s", index)
+        self.__pipeline.stop(timeout=5)
+
+        self.assertEqual(self.__stream.getvalue().splitlines(), ["record %s" % index for index in range(1000)])
+
+
+    def test_stop_while_threads_log(self):
+        failures = []
+        logging_done = threading.Event()
+        hook = threading.excepthook
+        threading.excepthook = lambda args: failures.append(args.exc_value)
+
+        def log():
+            while not logging_done.is_set():
+                self.__logger.info("record")
+
+        threads = [threading.Thread(target=log, daemon=True) for _ in range(4)]
+        try:
+            self.__pipeline.start()
+            for thread in threads:
+                thread.start()
+            # Let the queue fill, so records are logged between the stop marker and the ones before it
+            time.sleep(0.2)
+            self.__pipeline.stop(timeout=5)
+        finally:
+            # Start a new listener to drain the records logged since, so the blocked logging threads can finish
+            logging_done.set()
+            self.__pipeline.start()
+            for thread in threads:
+                thread.join(5)
+            self.__pipeline.stop(timeout=5)
+            threading.excepthook = hook
+
+        self.assertEqual(failures, [])
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+
+
+if __name__ == "__main__":
+    unittest.main()
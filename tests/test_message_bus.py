@@ -0,0 +1,105 @@
+'''
+Tests the message bus overflow policies and subscription lifecycle
+'''
+
+# Import libs
+import threading
+import time
+import unittest
+
+# Import package modules
+from plugsy.MessageBus import MessageBus
+
+
+class TestMessageBus(unittest.TestCase):
+    '''
+    Each subscription's full queue only affects that subscription, according to its overflow policy
+    '''
+
+    def setUp(self):
+        self.bus = MessageBus()
+
+
+    def test_messages_are_delivered_to_every_subscription_in_order(self):
+        first = self.bus.subscribe("topic")
+        second = self.bus.subscribe("topic")
+
+        self.assertEqual(self.bus.publish_batch("topic", [1, 2, 3]), 2)
+        self.assertEqual(first.receive_batch(timeout=0), [1, 2, 3])
+        self.assertEqual(second.receive(timeout=0), 1)
+        self.assertEqual(self.bus.publish("other", 4), 0)
+
+
+    def test_drop_discards_new_messages(self):
+        subscription = self.bus.subscribe("topic", max_size=2, overflow_policy=MessageBus.DROP)
+
+        self.assertEqual(self.bus.publish_batch("topic", [1, 2, 3, 4]), 0)
+        self.assertEqual(subscription.receive_batch(timeout=0), [1, 2])
+        self.assertEqual(subscription.get_stats()["dropped"], 2)
+
+
+    def test_drop_oldest_discards_queued_messages(self):
+        subscription = self.bus.subscribe("topic", max_size=2, overflow_policy=MessageBus.DROP_OLDEST)
+
+        self.assertEqual(self.bus.publish_batch("topic", [1, 2, 3, 4]), 1)
+        self.assertEqual(subscription.receive_batch(timeout=0), [3, 4])
+        self.assertEqual(subscription.get_stats()["dropped"], 2)
+
+
+    def test_block_waits_for_room(self):
+        subscription = self.bus.subscribe("topic", max_size=1, overflow_policy=MessageBus.BLOCK)
+        self.bus.publish("topic", 1)
+
+        started = time.monotonic()
+        self.assertEqual(self.bus.publish("topic", 2, timeout=0.1), 0)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+        # A subscriber making room releases the publisher
+        publisher = threading.Thread(target=self.bus.publish, args=("topic", 3))
+        publisher.start()
+        self.assertEqual(subscription.receive(timeout=1), 1)
+        publisher.join(5)
+        self.assertFalse(publisher.is_alive())
+        self.assertEqual(subscription.receive(timeout=1), 3)
+
+
+    def test_closing_releases_blocked_publisher(self):
+        subscription = self.bus.subscribe("topic", max_size=1, overflow_policy=MessageBus.BLOCK)
+        self.bus.publish("topic", 1)
+        delivered = []
+
+        publisher = threading.Thread(target=lambda: delivered.append(self.bus.publish("topic", 2)))
+        publisher.start()
+        publisher.join(0.1)
+        self.assertTrue(publisher.is_alive())
+
+        subscription.unsubscribe()
+        publisher.join(5)
+        self.assertFalse(publisher.is_alive())
+        self.assertEqual(delivered, [0])
+        self.assertTrue(subscription.is_closed())
+        self.assertEqual(self.bus.get_topics(), [])
+        # Messages queued before closing can still be received
+        self.assertEqual(subscription.receive_batch(timeout=0), [1])
+
+
+    def test_unsubscribe_owner(self):
+        owned = [self.bus.subscribe("first", owner="Consumer"), self.bus.subscribe("second", owner="Consumer")]
+        other = self.bus.subscribe("first", owner="Other")
+
+        self.assertEqual(self.bus.unsubscribe_owner("consumer"), 2)
+        self.assertTrue(all(subscription.is_closed() for subscription in owned))
+        self.assertEqual(self.bus.get_subscriptions("first"), [other])
+        self.assertEqual(self.bus.get_topics(), ["first"])
+
+
+    def test_notify_is_called_when_messages_are_queued(self):
+        notified = threading.Event()
+        self.bus.subscribe("topic", notify=notified.set)
+
+        self.bus.publish("topic", 1)
+        self.assertTrue(notified.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+'''
+Tests reloading a plugin from its source while other plugins keep running
+'''
+
+# Import libs
+import gc
+import sys
+import unittest
+
+# Import package modules
+from plugsy.Plugsy import Plugsy
+from plugin_home import RECORDING, PluginHomeTestCase
+
+# The recording plugin, with a version attribute the reload can be told apart by
+RELOADED = RECORDING + '''
+    version = 2
+'''
+
+BROKEN = '''from plugsy.AbstractPlugin import AbstractPlugin
+
+class {name}(AbstractPlugin)
+'''
+
+
+class TestReloadPlugin(PluginHomeTestCase):
+    '''
+    Reloading replaces the plugin with one built from its new source, or reactivates the previous version if that
+    can't be loaded
+    '''
+
+    def setUp(self):
+        PluginHomeTestCase.setUp(self)
+        self.create_plugin("core", "Alpha", config="SIGNALS_READY = True", source=RECORDING)
+        self.create_plugin("core", "Beta", ["Alpha"], config="SIGNALS_READY = True", source=RECORDING)
+        self.create_plugin("core", "Gamma", ["Beta"], config="SIGNALS_READY = True", source=RECORDING)
+        self.plugsy = Plugsy(activation_timeout=5)
+        self.plugsy.events = []
+        self.plugsy.activate_plugins()
+
+
+    def tearDown(self):
+        self.plugsy.deactivate_plugins()
+        self.assert_nothing_running(self.plugsy, ["Alpha", "Beta", "Gamma"])
+        PluginHomeTestCase.tearDown(self)
+
+
+    def test_reload_replaces_plugin_and_restarts_dependents(self):
+        previous = self.plugsy.get_plugin("Beta")
+        alpha = self.plugsy.get_plugin("Alpha")
+        gamma = self.plugsy.get_plugin("Gamma")
+        self.write_plugin("core", "Beta", RELOADED)
+        self.plugsy.events = []
+
+        self.assertIsNotNone(self.plugsy.reload_plugin("Beta"))
+
+        reloaded = self.plugsy.get_plugin("Beta")
+        self.assertIsNot(reloaded, previous)
+        self.assertEqual(reloaded.version, 2)
+        self.assertTrue(reloaded.is_alive())
+        self.assertIs(self.plugsy.get_plugin("Gamma"), gamma)
+        self.assertIs(self.plugsy.get_plugin("Alpha"), alpha)
+        self.assertEqual(alpha.runs, 1)
+        self.assertEqual(self.plugsy.events, [
+            ("stop", "Gamma"), ("stop", "Beta"), ("start", "Beta"), ("start", "Gamma")
+        ])
+        del previous
+        self.assertEqual(self.plugsy.get_leaked_modules(), [])
+
+
+    def test_reload_rolls_back_when_new_version_fails_to_load(self):
+        previous = self.plugsy.get_plugin("Beta")
+        previous_module = sys.modules["plugins.core.Beta.Beta"]
+        self.write_plugin("core", "Beta", BROKEN)
+
+        with self.assertRaises(SyntaxError):
+            self.plugsy.reload_plugin("Beta")
+
+        self.assertIs(self.plugsy.get_plugin("Beta"), previous)
+        self.assertIs(sys.modules["plugins.core.Beta.Beta"], previous_module)
+        self.assertTrue(previous.is_alive())
+        self.assertEqual(previous.runs, 2)
+        self.assertTrue(self.plugsy.get_plugin("Gamma").is_alive())
+
+
+    def test_leaked_modules_are_reported_until_collected(self):
+        previous_module = sys.modules["plugins.core.Beta.Beta"]
+        self.write_plugin("core", "Beta", RELOADED)
+
+        self.plugsy.reload_plugin("Beta")
+
+        self.assertEqual(self.plugsy.get_leaked_modules(), ["plugins.core.Beta.Beta"])
+        del previous_module
+        gc.collect()
+        self.assertEqual(self.plugsy.get_leaked_modules(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
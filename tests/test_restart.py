@@ -0,0 +1,67 @@
+'''
+Tests restarting a plugin and its dependents in place
+'''
+
+# Import libs
+import unittest
+
+# Import package modules
+from plugsy.Plugsy import Plugsy
+from plugin_home import RECORDING, PluginHomeTestCase
+
+
+class TestRestartPlugin(PluginHomeTestCase):
+    '''
+    Restarting a plugin restarts the same objects, stopping dependents first and starting them last
+    '''
+
+    def setUp(self):
+        PluginHomeTestCase.setUp(self)
+        self.create_plugin("core", "Alpha", config="SIGNALS_READY = True", source=RECORDING)
+        self.create_plugin("core", "Beta", ["Alpha"], config="SIGNALS_READY = True", source=RECORDING)
+        self.create_plugin("core", "Delta", config="SIGNALS_READY = True", source=RECORDING)
+        self.create_plugin("addon", "Gamma", ["Beta"], config="SIGNALS_READY = True", source=RECORDING)
+        self.plugsy = Plugsy(activation_timeout=5)
+        self.plugsy.events = []
+        self.plugsy.activate_plugins()
+
+
+    def tearDown(self):
+        self.plugsy.deactivate_plugins()
+        self.assert_nothing_running(self.plugsy, ["Alpha", "Beta", "Gamma", "Delta"])
+        PluginHomeTestCase.tearDown(self)
+
+
+    def test_restart_keeps_instances_and_orders_dependents(self):
+        plugins = {name: self.plugsy.get_plugin(name) for name in ["Alpha", "Beta", "Gamma", "Delta"]}
+        self.plugsy.events = []
+
+        report = self.plugsy.restart_plugin("Alpha")
+
+        self.assertIsNotNone(report)
+        self.assertEqual(self.plugsy.events, [
+            ("stop", "Gamma"), ("stop", "Beta"), ("stop", "Alpha"),
+            ("start", "Alpha"), ("start", "Beta"), ("start", "Gamma")
+        ])
+        for name, plugin in plugins.items():
+            self.assertIs(self.plugsy.get_plugin(name), plugin)
+            self.assertTrue(plugin.is_alive())
+        self.assertEqual({name: plugin.runs for name, plugin in plugins.items()}, {
+            "Alpha": 2, "Beta": 2, "Gamma": 2, "Delta": 1
+        })
+
+
+    def test_restart_leaf_plugin_only_restarts_it(self):
+        self.plugsy.events = []
+
+        self.plugsy.restart_plugin("Gamma")
+
+        self.assertEqual(self.plugsy.events, [("stop", "Gamma"), ("start", "Gamma")])
+
+
+    def test_restart_inactive_plugin(self):
+        self.assertIsNone(self.plugsy.restart_plugin("Missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+'''
+Tests that the supervisor applies each restart policy to failed plugins
+'''
+
+# Import libs
+import threading
+import time
+import unittest
+
+# Import package modules
+from plugsy.Supervisor import Supervisor
+
+
+class FakePlugin():
+    '''
+    Stands in for a plugin, failing when told to and recording each restart
+    '''
+
+    def __init__(self, name, policy, backoff=Supervisor.DEFAULT_BACKOFF, max_backoff=Supervisor.DEFAULT_MAX_BACKOFF):
+        self.stop_event = threading.Event()
+        self.restarts = []
+        self.__name = name
+        self.__policy = policy
+        self.__backoff = backoff
+        self.__max_backoff = max_backoff
+        self.__failure = None
+        self.__listener = None
+        self.__activated = True
+
+
+    def fail(self):
+        self.__failure = RuntimeError("%s failed" % self.__name)
+        if self.__listener is not None:
+            self.__listener()
+
+
+    def restart(self):
+        self.restarts.append(time.monotonic())
+        self.__failure = None
+        self.__activated = True
+
+
+    def deactivate(self):
+        self.__activated = False
+
+
+    def stop(self):
+        pass
+
+
+    def join(self, timeout=None):
+        pass
+
+
+    def is_alive(self):
+        return False
+
+
+    def is_activated(self):
+        return self.__activated
+
+
+    def get_name(self):
+        return self.__name
+
+
+    def get_failure(self):
+        return self.__failure
+
+
+    def get_restart_policy(self):
+        return self.__policy
+
+
+    def get_restart_backoff(self):
+        return self.__backoff
+
+
+    def get_max_restart_backoff(self):
+        return self.__max_backoff
+
+
+    def set_failure_listener(self, listener):
+        self.__listener = listener
+
+
+class TestSupervisor(unittest.TestCase):
+    '''
+    Failed plugins are restarted or deactivated according to their policy, without holding up the supervisor
+    '''
+
+    def setUp(self):
+        self.disabled = []
+        self.watched = []
+        self.restart_hook = None
+        self.supervisor = Supervisor(restart=self.__restart, disable=self.__disable, interval=0.05)
+
+
+    def tearDown(self):
+        self.supervisor.unwatch(self.watched)
+
+
+    def __watch(self, plugin):
+        self.watched.append(plugin)
+        self.supervisor.watch([plugin])
+
+
+    def __restart(self, plugin, ready_timeout):
+        plugin.restart()
+        if self.restart_hook is not None:
+            self.restart_hook(plugin)
+
+
+    def __disable(self, plugin):
+        plugin.deactivate()
+        self.disabled.append(plugin)
+
+
+    def __wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Timed out waiting for the supervisor")
+            time.sleep(0.01)
+
+
+    def test_never_deactivates(self):
+        plugin = FakePlugin("Never", Supervisor.NEVER)
+        self.__watch(plugin)
+        plugin.fail()
+
+        self.__wait_for(lambda: self.disabled)
+        self.assertEqual(self.disabled, [plugin])
+        self.assertEqual(plugin.restarts, [])
+        self.assertEqual(self.supervisor.get_watched(), [])
+        stats = self.supervisor.get_stats("Never")
+        self.assertEqual((stats["failures"], stats["restarts"]), (1, 0))
+        self.assertEqual(stats["last_failure"], "RuntimeError: Never failed")
+
+
+    def test_always_restarts_after_minimum_delay(self):
+        plugin = FakePlugin("Always", Supervisor.ALWAYS)
+        self.__watch(plugin)
+
+        for restarts in range(1, 4):
+            failed = time.monotonic()
+            plugin.fail()
+            self.__wait_for(lambda: len(plugin.restarts) == restarts)
+            self.assertGreaterEqual(plugin.restarts[-1] - failed, Supervisor.MIN_RESTART_DELAY)
+
+        stats = self.supervisor.get_stats("Always")
+        self.assertEqual((stats["failures"], stats["restarts"]), (3, 3))
+        self.assertEqual(self.disabled, [])
+
+
+    def test_backoff_doubles(self):
+        plugin = FakePlugin("Backoff", Supervisor.BACKOFF, backoff=0.1, max_backoff=0.4)
+        self.__watch(plugin)
+
+        # Each restart fails straight away, so the failure streak keeps growing
+        def fail_again(restarted):
+            if len(restarted.restarts) < 4:
+                restarted.fail()
+        self.restart_hook = fail_again
+
+        started = time.monotonic()
+        plugin.fail()
+        self.__wait_for(lambda: len(plugin.restarts) == 4)
+
+        delays = [later - earlier for earlier, later in zip([started] + plugin.restarts, plugin.restarts)]
+        for delay, expected in zip(delays, [0.1, 0.2, 0.4, 0.4]):
+            self.assertGreaterEqual(delay, expected)
+        self.assertLess(delays[0], delays[2])
+        self.assertEqual(self.supervisor.get_stats("Backoff")["consecutive_failures"], 4)
+
+
+    def test_failure_streak_resets_once_up_long_enough(self):
+        plugin = FakePlugin("Streak", Supervisor.BACKOFF, backoff=0.05, max_backoff=0.2)
+        self.__watch(plugin)
+
+        plugin.fail()
+        self.__wait_for(lambda: len(plugin.restarts) == 1)
+        plugin.fail()
+        self.__wait_for(lambda: len(plugin.restarts) == 2)
+        self.assertEqual(self.supervisor.get_stats("Streak")["consecutive_failures"], 2)
+
+        # Staying up for RESTART_MAX_BACKOFF ends the streak
+        time.sleep(0.3)
+        plugin.fail()
+        self.__wait_for(lambda: len(plugin.restarts) == 3)
+        stats = self.supervisor.get_stats("Streak")
+        self.assertEqual((stats["failures"], stats["consecutive_failures"]), (3, 1))
+
+
+    def test_restart_in_progress_does_not_hold_the_lock(self):
+        plugin = FakePlugin("Slow", Supervisor.ALWAYS)
+        restarting = threading.Event()
+        release = threading.Event()
+
+        def block(restarted):
+            restarting.set()
+            release.wait(5)
+        self.restart_hook = block
+        self.__watch(plugin)
+        plugin.fail()
+        self.assertTrue(restarting.wait(5))
+
+        started = time.monotonic()
+        self.assertEqual(self.supervisor.get_stats("Slow")["failures"], 1)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+        # Unwatching waits for the plugin's restart to finish
+        unwatched = threading.Thread(target=self.supervisor.unwatch, args=([plugin],))
+        unwatched.start()
+        unwatched.join(0.2)
+        self.assertTrue(unwatched.is_alive())
+        release.set()
+        unwatched.join(5)
+        self.assertFalse(unwatched.is_alive())
+        self.assertEqual(self.supervisor.get_watched(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()